@@ -95,7 +95,13 @@ plt.show()
 h3("Relatório de Classificação")
 print(report_text)
 
-scores_acc = cross_val_score(pipe_cls, X, y, cv=5, scoring="accuracy")
+# Validação cruzada com codificação única e dobras em cache (equivale a
+# cross_val_score(pipe_cls, X, y, cv=5), sem recodificar os dados por dobra)
+sys.path.append('../scripts')
+from validacao_cruzada import ValidacaoCruzadaCache
+
+vc_churn = ValidacaoCruzadaCache(X, y, cv=5)
+scores_acc = vc_churn.avaliar(modelo_arvore, scoring="accuracy")
 h3("Resultados da Validação Cruzada (cv=5) — Acurácia")
 print("Acurácias por fold:", np.round(scores_acc, 3))
 print(f"Acurácia Média: {scores_acc.mean():.2%}")
@@ -130,29 +136,11 @@ if not candidate_targets:
 y_car = df_car[candidate_targets[0]].astype(float)
 X_car = df_car.drop(columns=[candidate_targets[0]])
 
-cat_cols_car = X_car.select_dtypes(include=["object", "category"]).columns.tolist()
-num_cols_car = X_car.select_dtypes(include=["number", "bool"]).columns.tolist()
-
-from sklearn.compose import ColumnTransformer
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.pipeline import Pipeline
 from sklearn.linear_model import LinearRegression
 
-prep_car = ColumnTransformer(
-    transformers=[
-        ("num", "passthrough", num_cols_car),
-        ("cat", OneHotEncoder(handle_unknown='ignore', sparse_output=False), cat_cols_car),
-    ],
-    remainder="drop"
-)
-
-pipe_reg = Pipeline([
-    ("prep", prep_car),
-    ("reg", LinearRegression())
-])
-
-from sklearn.model_selection import cross_val_score
-scores_rmse = cross_val_score(pipe_reg, X_car, y_car, cv=5, scoring="neg_root_mean_squared_error")
+# A codificação one-hot das colunas categóricas fica a cargo do ValidacaoCruzadaCache
+vc_car = ValidacaoCruzadaCache(X_car, y_car, cv=5)
+scores_rmse = vc_car.avaliar(LinearRegression(), scoring="neg_root_mean_squared_error")
 rmse_per_fold = -scores_rmse
 rmse_mean = rmse_per_fold.mean()
 rmse_std  = rmse_per_fold.std()
@@ -1,64 +1,62 @@
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+sys.path.append('../scripts')
+from perfil_eda import perfilar
+from imputacao import ImputadorAproximado
+
 df = pd.read_csv('online_gaming_behavior_dataset(in).csv')
 
 print("Primeiras 5 linhas do dataset:")
 display(df.head())
 
-print("Informações gerais do dataset:")
-df.info()
+# info() + describe() + isnull() + duplicated() em uma única passada
+perfil = perfilar(df)
+perfil.relatorio()
 
 print("\nEstatísticas descritivas:")
-display(df.describe())
+resumo = perfil.resumo()
+display(resumo)
 
-print(f"\nDimensões do dataset: {df.shape[0]} linhas e {df.shape[1]} colunas")
+print(f"\nDimensões do dataset: {perfil.linhas} linhas e {len(perfil.colunas)} colunas")
 
 print("Verificando valores ausentes por coluna:")
-valores_ausentes = df.isnull().sum()
+valores_ausentes = resumo['nulos']
 print(valores_ausentes)
 
 if valores_ausentes.sum() == 0:
     print("\nPerfeito! Nosso dataset não tem valores ausentes.")
+    print("Nenhuma correção necessária para valores ausentes.")
 else:
     print("\nEncontrados valores ausentes. Vamos corrigi-los...")
-
-    if valores_ausentes.sum() > 0:
     print("Aplicando correções...")
 
-    colunas_numericas = df.select_dtypes(include=['int64', 'float64']).columns
-    for coluna in colunas_numericas:
-        if df[coluna].isnull().any():
-            mediana = df[coluna].median()
-            df[coluna].fillna(mediana, inplace=True)
-            print(f"Coluna '{coluna}' preenchida com mediana: {mediana}")
-
-    colunas_categoricas = df.select_dtypes(include=['object']).columns
-    for coluna in colunas_categoricas:
-        if df[coluna].isnull().any():
-            moda = df[coluna].mode()[0]
-            df[coluna].fillna(moda, inplace=True)
-            print(f"Coluna '{coluna}' preenchida com moda: {moda}")
-else:
-    print("Nenhuma correção necessária para valores ausentes.")
+    # Mediana (numéricas) e moda (categóricas) aprendidas com sketches, sem
+    # ordenar cada coluna; o imputador pode ser salvo e aplicado em blocos
+    imputador = ImputadorAproximado(colunas=valores_ausentes[valores_ausentes > 0].index.tolist())
+    imputador.ajustar(df)
+    df = imputador.transformar(df, relatorio=True)
     
-duplicatas = df.duplicated().sum()
+# Remoção exata sempre executada, após a imputação (como no fluxo original)
+formato_original = df.shape
+df.drop_duplicates(inplace=True)
+duplicatas = formato_original[0] - df.shape[0]
 print(f"Número de linhas duplicadas encontradas: {duplicatas}")
 
 if duplicatas > 0:
-    print("Removendo linhas duplicadas...")
-    formato_original = df.shape
-    df.drop_duplicates(inplace=True)
+    print("Linhas duplicadas removidas.")
     print(f"Dataset original: {formato_original}")
     print(f"Dataset após remoção: {df.shape}")
-    print(f"Linhas removidas: {formato_original[0] - df.shape[0]}")
+    print(f"Linhas removidas: {duplicatas}")
 else:
     print("Excelente! Não há linhas duplicadas no dataset.")
 
+perfil_final = perfilar(df)
 print("Status final após limpeza:")
-print(f"Valores ausentes total: {df.isnull().sum().sum()}")
-print(f"Linhas duplicadas: {df.duplicated().sum()}")
+print(f"Valores ausentes total: {int(perfil_final.resumo()['nulos'].sum())}")
+print(f"Linhas duplicadas: {perfil_final.duplicatas}")
 print(f"Formato final do dataset: {df.shape}")
 
 playtime_column = "PlayTimeHours"
@@ -147,8 +145,8 @@ if playtime_column in df.columns and pd.api.types.is_numeric_dtype(df[playtime_c
 print("RESUMO FINAL DO DATASET LIMPO")
 print("=" * 50)
 print(f"Dimensões: {df.shape[0]} linhas × {df.shape[1]} colunas")
-print(f"Valores ausentes: {df.isnull().sum().sum()}")
-print(f"Linhas duplicadas: {df.duplicated().sum()}")
+print(f"Valores ausentes: {int(perfil_final.resumo()['nulos'].sum())}")
+print(f"Linhas duplicadas: {perfil_final.duplicatas}")
 print(f"Colunas numéricas: {len(df.select_dtypes(include=['int64', 'float64']).columns)}")
 print(f"Colunas categóricas: {len(df.select_dtypes(include=['object']).columns)}")
 
@@ -1,8 +1,13 @@
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+sys.path.append('../scripts')
+from correlacao import ServicoCorrelacao
+from graficos_amostrados import pairplot_amostrado
+
 df = pd.read_csv('online_gaming_behavior_dataset.csv')
 
 numeric_columns = ['Age', 'PlayTimeHours', 'InGamePurchases', 'SessionsPerWeek',
@@ -10,7 +15,9 @@ numeric_columns = ['Age', 'PlayTimeHours', 'InGamePurchases', 'SessionsPerWeek',
 
 df_numeric = df[numeric_columns]
 
-correlation_matrix = df_numeric.corr()
+# Matriz calculada uma vez; heatmap e pair plot leem do mesmo cache
+servico_correlacao = ServicoCorrelacao(df_numeric)
+correlation_matrix = servico_correlacao.matriz()
 
 plt.figure(figsize=(10, 8))
 sns.heatmap(correlation_matrix,
@@ -36,10 +43,10 @@ plt.style.use('default')
 sns.set_palette("husl")
 
 fig = plt.figure(figsize=(15, 12))
-pair_plot = sns.pairplot(df_important,
-                        diag_kind='hist',
-                        plot_kws={'alpha': 0.6, 's': 20},
-                        diag_kws={'bins': 30, 'alpha': 0.7})
+# Acima de 50 mil linhas: dispersões viram densidade 2-D (histogramas com todas as linhas)
+pair_plot = pairplot_amostrado(df_important,
+                               plot_kws={'alpha': 0.6, 's': 20},
+                               diag_kws={'bins': 30, 'alpha': 0.7})
 
 pair_plot.fig.suptitle('Pair Plot - Variáveis Mais Importantes do Gaming Dataset',
                        fontsize=16, y=1.02)
@@ -50,7 +57,7 @@ for i in range(len(important_vars)):
     for j in range(len(important_vars)):
         if i != j:
             ax = pair_plot.axes[i, j]
-            corr = df_important.iloc[:, j].corr(df_important.iloc[:, i])
+            corr = servico_correlacao.par(important_vars[j], important_vars[i])
             ax.text(0.05, 0.95, f'r = {corr:.3f}',
                    transform=ax.transAxes, fontsize=10,
                    bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
@@ -1,7 +1,11 @@
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+sys.path.append('../scripts')
+from graficos_amostrados import dispersao_amostrada, pairplot_amostrado
+
 plt.rcParams["figure.dpi"] = 110
 
 df = pd.read_csv("online_gaming_behavior_dataset.csv")
@@ -23,8 +27,8 @@ plt.show()
 var_x = "PlayTimeHours"
 var_y = "InGamePurchases"
 
-plt.figure(figsize=(8,5))
-sns.scatterplot(x=df[var_x], y=df[var_y], alpha=0.6)
+fig, ax = plt.subplots(figsize=(8,5))
+dispersao_amostrada(ax, df[var_x], df[var_y], alpha=0.6)
 plt.title(f"Relação entre {var_x} e {var_y}")
 plt.xlabel(var_x)
 plt.ylabel(var_y)
@@ -74,10 +78,10 @@ df_important = df[important_vars]
 
 sns.set_palette("husl")
 
-pair_plot = sns.pairplot(df_important,
-                        diag_kind='hist',
-                        plot_kws={'alpha': 0.6, 's': 20},
-                        diag_kws={'bins': 30, 'alpha': 0.7})
+# Acima de 50 mil linhas: dispersões viram densidade 2-D (histogramas com todas as linhas)
+pair_plot = pairplot_amostrado(df_important,
+                               plot_kws={'alpha': 0.6, 's': 20},
+                               diag_kws={'bins': 30, 'alpha': 0.7})
 
 pair_plot.fig.suptitle('Pair Plot - Variáveis Mais Importantes do Gaming Dataset',
                        fontsize=16, y=1.02)
@@ -1,4 +1,5 @@
 import io
+import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -14,11 +15,13 @@ df_churn = pd.read_csv(telco_url)
 print("Dimensão:", df_churn.shape)
 df_churn.head()
 
-buffer = io.StringIO()
-df_churn.info(buf=buffer)
-print(buffer.getvalue())
+# info() + describe(include="all") em uma única passada
+sys.path.append('../scripts')
+from perfil_eda import perfilar
 
-display(df_churn.describe(include="all").T.head(20))
+perfil_churn = perfilar(df_churn)
+perfil_churn.relatorio()
+display(perfil_churn.resumo().head(20))
 
 # Limpeza TotalCharges
 df_churn["TotalCharges"] = pd.to_numeric(df_churn["TotalCharges"], errors="coerce")
@@ -41,8 +44,11 @@ plt.show()
 
 (churn_counts / churn_counts.sum()).rename("proporcao")
 
-def stacked_bar_by_target(df, cat_col, target="Churn"):
-    ctab = pd.crosstab(df[cat_col], df[target], normalize="index")
+from resumo_agrupado import tabelas_cruzadas, estatisticas_caixa, para_bxp
+
+def stacked_bar_by_target(df, cat_col, target="Churn", ctab=None):
+    if ctab is None:
+        ctab = tabelas_cruzadas(df, [cat_col], target)[cat_col]
     fig, ax = plt.subplots()
     bottom = np.zeros(ctab.shape[0])
     for cls in ctab.columns:
@@ -53,22 +59,25 @@ def stacked_bar_by_target(df, cat_col, target="Churn"):
     ax.legend(title=target); plt.xticks(rotation=0); plt.show()
     return ctab
 
-ctab_contract = stacked_bar_by_target(df_churn, "Contract")
-ctab_internet = stacked_bar_by_target(df_churn, "InternetService")
-ctab_partner  = stacked_bar_by_target(df_churn, "Partner")
+# Proporções das três colunas com o target fatorado uma única vez
+ctabs = tabelas_cruzadas(df_churn, ["Contract", "InternetService", "Partner"], "Churn")
+ctab_contract = stacked_bar_by_target(df_churn, "Contract", ctab=ctabs["Contract"])
+ctab_internet = stacked_bar_by_target(df_churn, "InternetService", ctab=ctabs["InternetService"])
+ctab_partner  = stacked_bar_by_target(df_churn, "Partner", ctab=ctabs["Partner"])
 
 ctab_contract, ctab_internet, ctab_partner
 
-def boxplot_by_target(df, target, num_col):
-    groups = [df[df[target]==cls][num_col].dropna().values for cls in df[target].unique()]
-    labels = list(df[target].unique())
+def boxplot_by_target(df, target, num_col, stats=None):
+    if stats is None:
+        stats = estatisticas_caixa(df, target, [num_col])[num_col]
     fig, ax = plt.subplots()
-    ax.boxplot(groups, labels=labels, showmeans=True)
+    ax.bxp(para_bxp(stats), showmeans=True)
     ax.set_title(f"Distribuição de {num_col} por {target}")
     ax.set_xlabel(target); ax.set_ylabel(num_col); plt.show()
 
-boxplot_by_target(df_churn, "Churn", "tenure")
-boxplot_by_target(df_churn, "Churn", "MonthlyCharges")
+stats_churn = estatisticas_caixa(df_churn, "Churn", ["tenure", "MonthlyCharges"])
+boxplot_by_target(df_churn, "Churn", "tenure", stats=stats_churn["tenure"])
+boxplot_by_target(df_churn, "Churn", "MonthlyCharges", stats=stats_churn["MonthlyCharges"])
 
 auto_url = "https://archive.ics.uci.edu/ml/machine-learning-databases/autos/imports-85.data"
 colnames = [
@@ -109,10 +118,9 @@ ax.set_xlabel("price"); ax.set_ylabel("freq")
 plt.show()
 
 def boxplot_cat_y(df, cat_col, y="price"):
-    groups = [df[df[cat_col]==val][y].dropna().values for val in df[cat_col].dropna().unique()]
-    labels = list(df[cat_col].dropna().unique())
+    stats = estatisticas_caixa(df, cat_col, [y])[y]
     fig, ax = plt.subplots(figsize=(10, 5))
-    ax.boxplot(groups, labels=labels, showmeans=True)
+    ax.bxp(para_bxp(stats), showmeans=True)
     ax.set_title(f"{y} por {cat_col}")
     ax.set_xlabel(cat_col); ax.set_ylabel(y)
     plt.xticks(rotation=45, ha="right"); plt.tight_layout(); plt.show()
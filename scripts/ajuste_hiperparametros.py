@@ -0,0 +1,171 @@
+"""
+Ajuste de Hiperparâmetros com Successive Halving
+
+Explora as grades dos modelos de árvore (Decision Tree e Random Forest) com
+`HalvingGridSearchCV`: todos os candidatos começam com uma fração das linhas
+e só o melhor terço de cada rodada segue para a próxima, com mais dados.
+Os candidatos de cada rodada são avaliados em paralelo (processos).
+
+As features são codificadas uma única vez (`CodificadorCategorico`) e as
+dobras são fixas, então todos os candidatos reutilizam a mesma matriz, que o
+joblib compartilha com os processos como memmap.
+
+Uso:
+    resultado = ajustar_hiperparametros(X, y)
+    salvar_melhor_configuracao(resultado, caminho_bundle='bundle_modelo')
+"""
+
+import datetime
+import time
+
+import numpy as np
+
+from codificador import CodificadorCategorico
+
+
+GRADES_PADRAO = {
+    'Decision Tree': {
+        'max_depth': [3, 4, 5, 6, 8, 10, None],
+        'min_samples_split': [2, 5, 10, 20],
+        'min_samples_leaf': [1, 5, 10, 20]
+    },
+    'Random Forest': {
+        'n_estimators': [100, 200, 400],
+        'max_depth': [8, 10, 15, 20, None],
+        'min_samples_split': [2, 5, 10],
+        'max_features': ['sqrt', 0.5]
+    }
+}
+
+
+def _estimador_base(nome):
+    from sklearn.tree import DecisionTreeClassifier
+    from sklearn.ensemble import RandomForestClassifier
+
+    if nome == 'Decision Tree':
+        return DecisionTreeClassifier(random_state=42)
+    if nome == 'Random Forest':
+        # Paralelismo fica na busca (um candidato por processo), não na floresta
+        return RandomForestClassifier(random_state=42, n_jobs=1)
+    raise ValueError(f"Modelo '{nome}' sem estimador base; use um de {list(GRADES_PADRAO)}.")
+
+
+def ajustar_hiperparametros(X, y, modelos=None, grades=None, codificador=None,
+                            scoring='f1', pos_label='Yes', cv=5, fator=3,
+                            n_processos=-1, random_state=42):
+    """
+    Busca os melhores hiperparâmetros de cada modelo com successive halving.
+
+    Parâmetros:
+    -----------
+    X : DataFrame
+        Features originais (ex.: saída de `preparar_features`)
+    y : Series
+        Target ('Yes'/'No')
+    modelos : list, opcional
+        Nomes dos modelos a ajustar (padrão: todos de `GRADES_PADRAO`)
+    grades : dict, opcional
+        {nome: grade de parâmetros} que substitui a grade padrão
+    codificador : CodificadorCategorico, opcional
+        Codificador já ajustado (padrão: ajustado em X)
+    scoring : str
+        'f1', 'precisao', 'recall' (da classe `pos_label`) ou qualquer
+        métrica aceita pelo scikit-learn (ex.: 'roc_auc')
+    cv : int
+        Número de dobras estratificadas
+    fator : int
+        Fração de candidatos mantida a cada rodada (1/fator)
+    n_processos : int
+        Processos usados para avaliar os candidatos (-1 = todos os núcleos)
+
+    Retorna:
+    --------
+    dict com:
+        'melhor_modelo'  nome do modelo vencedor
+        'estimador'      estimador vencedor, retreinado em todos os dados
+        'codificador'    codificador usado
+        'feature_columns'
+        'configuracao'   dict serializável com parâmetros e score do vencedor
+        'resultados'     {nome: {'parametros', 'score', 'n_candidatos', 'n_rodadas', 'tempo'}}
+    """
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingGridSearchCV, StratifiedKFold
+    from sklearn.metrics import make_scorer, f1_score, precision_score, recall_score
+
+    grades = {**GRADES_PADRAO, **(grades or {})}
+    modelos = modelos or list(GRADES_PADRAO)
+
+    metricas_pos_label = {'f1': f1_score, 'precisao': precision_score, 'recall': recall_score}
+    scorer = (make_scorer(metricas_pos_label[scoring], pos_label=pos_label)
+              if scoring in metricas_pos_label else scoring)
+
+    # Codificação única: todas as rodadas e dobras usam a mesma matriz
+    if codificador is None:
+        codificador = CodificadorCategorico().ajustar(X)
+    matriz = codificador.transformar(X)
+    y = np.asarray(y)
+    dobras = StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state)
+
+    resultados = {}
+    buscas = {}
+    for nome in modelos:
+        inicio = time.perf_counter()
+        busca = HalvingGridSearchCV(
+            _estimador_base(nome), grades[nome], factor=fator, cv=dobras,
+            scoring=scorer, n_jobs=n_processos, random_state=random_state,
+            refit=True
+        ).fit(matriz, y)
+        tempo = time.perf_counter() - inicio
+
+        buscas[nome] = busca
+        resultados[nome] = {
+            'parametros': busca.best_params_,
+            'score': float(busca.best_score_),
+            'n_candidatos': int(busca.n_candidates_[0]),
+            'n_rodadas': int(busca.n_iterations_),
+            'tempo': tempo
+        }
+        print(f"✅ {nome}: {scoring}={busca.best_score_:.4f} com {busca.best_params_} "
+              f"({busca.n_candidates_[0]} candidatos, {busca.n_iterations_} rodadas, {tempo:.1f}s)")
+
+    melhor = max(resultados, key=lambda nome: resultados[nome]['score'])
+    configuracao = {
+        'modelo': melhor,
+        'classe': type(buscas[melhor].best_estimator_).__name__,
+        'parametros': resultados[melhor]['parametros'],
+        'scoring': scoring,
+        'score_cv': resultados[melhor]['score'],
+        'cv': cv,
+        'n_amostras': int(len(y)),
+        'data': datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    }
+
+    return {
+        'melhor_modelo': melhor,
+        'estimador': buscas[melhor].best_estimator_,
+        'codificador': codificador,
+        'feature_columns': list(codificador.feature_columns),
+        'configuracao': configuracao,
+        'resultados': resultados
+    }
+
+
+def salvar_melhor_configuracao(resultado, **kwargs):
+    """
+    Salva o modelo vencedor e sua configuração com `salvar_modelo_completo`.
+
+    Parâmetros:
+    -----------
+    resultado : dict
+        Saída de `ajustar_hiperparametros`
+    **kwargs
+        Repassados a `salvar_modelo_completo` (caminho_modelo, caminho_bundle, ...)
+    """
+    from artefatos import salvar_modelo_completo
+
+    salvar_modelo_completo(
+        resultado['estimador'], resultado['feature_columns'],
+        codificador=resultado['codificador'],
+        configuracao=resultado['configuracao'],
+        **kwargs
+    )
@@ -0,0 +1,281 @@
+"""
+Análise de ROI da Estratégia de Retenção
+
+Versão vetorizada de `calcular_roi_retencao`: em vez de uma matriz de
+confusão por vez, recebe as probabilidades de churn e calcula o ROI para
+todos os limiares e cenários (LTV, custo, taxa de sucesso) de uma vez.
+
+As contagens VP/FP/FN/VN de todos os limiares saem de uma única passada que
+localiza cada probabilidade na grade ordenada de limiares, seguida de somas
+acumuladas por faixa.
+
+`simular_roi` troca a estimativa pontual por uma simulação de Monte Carlo:
+taxa de sucesso, LTV e custo são sorteados de distribuições e o ROI de todos
+os cenários é avaliado de uma vez, com intervalos de confiança.
+
+Uso:
+    resultado = superficie_roi(probabilidade, y_test, limiares=np.linspace(0, 1, 201),
+                               ltv=[1500, 2000, 2500], custo_retencao=300, taxa_sucesso=[0.4, 0.6])
+    resultado['melhor']
+
+    simulacao = simular_roi(VP, FP, FN, VN, n_cenarios=200_000)
+    simulacao['intervalo_confianca']
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+
+def contagens_por_limiar(probabilidade, y_true, limiares, pos_label='Yes'):
+    """
+    Matriz de confusão para cada limiar (churn previsto se prob >= limiar).
+
+    Parâmetros:
+    -----------
+    probabilidade : array-like
+        Probabilidade de churn de cada cliente
+    y_true : array-like
+        Classe real
+    limiares : array-like
+        Limiares de decisão
+    pos_label : str ou int
+        Valor de `y_true` que indica churn
+
+    Retorna:
+    --------
+    DataFrame indexado pelo limiar (em ordem crescente) com as colunas
+    VP, FP, FN, VN
+    """
+    probabilidade = np.asarray(probabilidade, dtype=np.float64)
+    y_true = np.asarray(y_true)
+    positivos = y_true == pos_label
+    rotulos = pd.unique(y_true.ravel())
+    if not positivos.any() and len(rotulos) >= 2:
+        # Ex.: y_true em 0/1 com o padrão 'Yes' daria zero churns sem aviso
+        raise ValueError(f"pos_label={pos_label!r} não está entre os rótulos "
+                         f"{sorted(rotulos.tolist(), key=str)}")
+    limiares = np.sort(np.atleast_1d(np.asarray(limiares, dtype=np.float64)))
+
+    # faixa[i] = quantos limiares são <= prob[i]; o cliente é churn previsto
+    # no limiar k se faixa > k. Uma passada de searchsorted + bincount e somas
+    # acumuladas do fim para o início (evita ordenar os clientes)
+    faixa = np.searchsorted(limiares, probabilidade, side='right')
+    tamanho = limiares.size + 1
+    por_faixa = np.bincount(faixa, minlength=tamanho)
+    positivos_por_faixa = np.bincount(faixa[positivos], minlength=tamanho)
+
+    previstos_positivos = np.cumsum(por_faixa[::-1])[::-1][1:]
+    vp = np.cumsum(positivos_por_faixa[::-1])[::-1][1:]
+
+    n = probabilidade.size
+    total_positivos = int(positivos.sum())
+    fp = previstos_positivos - vp
+    fn = total_positivos - vp
+    vn = (n - total_positivos) - fp
+
+    return pd.DataFrame({'VP': vp, 'FP': fp, 'FN': fn, 'VN': vn},
+                        index=pd.Index(limiares, name='limiar'))
+
+
+def superficie_roi(probabilidade, y_true, limiares=None, ltv=2000, custo_retencao=300,
+                   taxa_sucesso=0.6, pos_label='Yes', truncar=True, relatorio=True):
+    """
+    Calcula o ROI para todas as combinações de limiar e parâmetros financeiros.
+
+    Parâmetros:
+    -----------
+    probabilidade : array-like
+        Probabilidade de churn de cada cliente (ex.: `predict_proba(X)[:, 1]`)
+    y_true : array-like
+        Classe real
+    limiares : array-like, opcional
+        Limiares de decisão (padrão: 0.00, 0.01, ..., 1.00)
+    ltv, custo_retencao, taxa_sucesso : float ou array-like
+        Mesmo significado de `calcular_roi_retencao`; arrays geram cenários
+    pos_label : str ou int
+        Valor de `y_true` que indica churn
+    truncar : bool
+        Se True, clientes salvos são arredondados para baixo, como em
+        `calcular_roi_retencao`
+    relatorio : bool
+        Se True, imprime o melhor cenário
+
+    Retorna:
+    --------
+    dict com:
+        'contagens'       DataFrame VP/FP/FN/VN por limiar
+        'roi'             np.ndarray (limiar, ltv, custo, taxa)
+        'roi_percentual'  np.ndarray com o mesmo formato
+        'limiar_otimo'    np.ndarray (ltv, custo, taxa) com o melhor limiar
+        'roi_otimo'       np.ndarray (ltv, custo, taxa) com o ROI nesse limiar
+        'melhor'          dict com o melhor cenário de toda a superfície
+    """
+    if limiares is None:
+        limiares = np.linspace(0, 1, 101)
+    contagens = contagens_por_limiar(probabilidade, y_true, limiares, pos_label)
+    limiares = contagens.index.to_numpy()
+
+    ltv = np.atleast_1d(np.asarray(ltv, dtype=np.float64))
+    custo = np.atleast_1d(np.asarray(custo_retencao, dtype=np.float64))
+    taxa = np.atleast_1d(np.asarray(taxa_sucesso, dtype=np.float64))
+
+    # Eixos: (limiar, ltv, custo, taxa)
+    vp = contagens['VP'].to_numpy(dtype=np.float64)[:, None, None, None]
+    contatados = (contagens['VP'] + contagens['FP']).to_numpy(dtype=np.float64)[:, None, None, None]
+
+    clientes_salvos = vp * taxa[None, None, None, :]
+    if truncar:
+        clientes_salvos = np.floor(clientes_salvos)
+    receita_retida = clientes_salvos * ltv[None, :, None, None]
+    custo_campanhas = contatados * custo[None, None, :, None]
+    roi = receita_retida - custo_campanhas
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi_percentual = np.where(custo_campanhas > 0, roi / custo_campanhas * 100, 0.0)
+
+    indice_otimo = roi.argmax(axis=0)
+    roi_otimo = np.take_along_axis(roi, indice_otimo[None], axis=0)[0]
+
+    i, j, k, m = np.unravel_index(roi.argmax(), roi.shape)
+    melhor = {
+        'limiar': float(limiares[i]),
+        'ltv': float(ltv[j]),
+        'custo_retencao': float(custo[k]),
+        'taxa_sucesso': float(taxa[m]),
+        'roi': float(roi[i, j, k, m]),
+        'roi_percentual': float(roi_percentual[i, j, k, m]),
+        **{chave: int(valor) for chave, valor in contagens.iloc[i].items()}
+    }
+
+    if relatorio:
+        print(f"📈 Superfície de ROI: {roi.size:,} combinações "
+              f"({len(limiares)} limiares x {ltv.size * custo.size * taxa.size} cenários)")
+        print(f"   Melhor limiar: {melhor['limiar']:.2f} -> ROI R$ {melhor['roi']:,.2f} "
+              f"({melhor['roi_percentual']:.1f}%) com LTV R$ {melhor['ltv']:,.0f}, "
+              f"custo R$ {melhor['custo_retencao']:,.0f}, sucesso {melhor['taxa_sucesso']:.0%}")
+
+    return {
+        'contagens': contagens,
+        'roi': roi,
+        'roi_percentual': roi_percentual,
+        'limiar_otimo': limiares[indice_otimo],
+        'roi_otimo': roi_otimo,
+        'melhor': melhor
+    }
+
+
+def _simular_fatia(semente, n, vp, contatados, ltv, incerteza_ltv, custo_retencao,
+                   incerteza_custo, taxa_sucesso, concentracao_taxa):
+    """
+    Sorteia `n` cenários e devolve o ROI de cada um.
+    """
+    rng = np.random.default_rng(semente)
+
+    # Taxa de sucesso ~ Beta com média taxa_sucesso; clientes salvos ~ Binomial
+    # (inteiros sem o arredondamento para baixo da estimativa pontual). Taxa 0 ou
+    # 1, ou concentração None/inf, não têm Beta válida: a taxa fica fixa
+    if concentracao_taxa is None or np.isinf(concentracao_taxa) or taxa_sucesso in (0, 1):
+        taxas = np.full(n, float(taxa_sucesso))
+    else:
+        taxas = rng.beta(taxa_sucesso * concentracao_taxa, (1 - taxa_sucesso) * concentracao_taxa, size=n)
+    salvos = rng.binomial(vp, taxas)
+
+    # LTV e custo ~ lognormal com a média informada e coeficiente de variação
+    def lognormal(media, cv):
+        if cv <= 0:
+            return np.full(n, float(media))
+        sigma2 = np.log1p(cv ** 2)
+        return rng.lognormal(np.log(media) - sigma2 / 2, np.sqrt(sigma2), size=n)
+
+    ltvs = lognormal(ltv, incerteza_ltv)
+    custos = lognormal(custo_retencao, incerteza_custo)
+    return salvos * ltvs - contatados * custos
+
+
+def simular_roi(VP, FP, FN, VN, n_cenarios=100_000, ltv=2000, incerteza_ltv=0.25,
+                custo_retencao=300, incerteza_custo=0.10, taxa_sucesso=0.6,
+                concentracao_taxa=50, nivel_confianca=0.95, n_processos=1,
+                tamanho_fatia=250_000, semente=42, relatorio=True):
+    """
+    Simulação de Monte Carlo do ROI da estratégia de retenção.
+
+    Parâmetros:
+    -----------
+    VP, FP, FN, VN : int
+        Valores da matriz de confusão (como em `calcular_roi_retencao`)
+    n_cenarios : int
+        Número de cenários simulados
+    ltv, custo_retencao : float
+        Médias do LTV e do custo por cliente (R$)
+    incerteza_ltv, incerteza_custo : float
+        Coeficiente de variação das distribuições lognormais (0 = fixo)
+    taxa_sucesso : float
+        Taxa média de sucesso das campanhas (0-1)
+    concentracao_taxa : float ou None
+        Concentração da Beta da taxa de sucesso (maior = menos incerteza);
+        None ou np.inf mantêm a taxa fixa
+    nivel_confianca : float
+        Nível do intervalo de confiança do ROI
+    n_processos : int
+        Processos usados para as fatias de cenários (-1 = todos os núcleos)
+    tamanho_fatia : int
+        Cenários por fatia; cada fatia tem sua própria semente derivada de
+        `semente`, então o resultado não depende de `n_processos`
+    semente : int
+        Semente da simulação
+
+    Retorna:
+    --------
+    dict com 'roi' (array dos cenários), 'media', 'mediana', 'desvio_padrao',
+    'intervalo_confianca', 'prob_prejuizo' e 'faixas' (percentis 5/25/50/75/95)
+    """
+    if n_cenarios < 1:
+        raise ValueError(f"n_cenarios deve ser >= 1 (recebido: {n_cenarios})")
+    if not 0 <= taxa_sucesso <= 1:
+        raise ValueError(f"taxa_sucesso deve estar entre 0 e 1 (recebido: {taxa_sucesso})")
+
+    contatados = VP + FP
+    tamanhos = [tamanho_fatia] * (n_cenarios // tamanho_fatia)
+    if n_cenarios % tamanho_fatia:
+        tamanhos.append(n_cenarios % tamanho_fatia)
+    sementes = np.random.SeedSequence(semente).spawn(len(tamanhos))
+
+    argumentos = (VP, contatados, ltv, incerteza_ltv, custo_retencao,
+                  incerteza_custo, taxa_sucesso, concentracao_taxa)
+    if n_processos == 1 or len(tamanhos) == 1:
+        fatias = [_simular_fatia(s, n, *argumentos) for s, n in zip(sementes, tamanhos)]
+    else:
+        fatias = Parallel(n_jobs=n_processos)(
+            delayed(_simular_fatia)(s, n, *argumentos) for s, n in zip(sementes, tamanhos)
+        )
+    roi = np.concatenate(fatias)
+
+    alfa = (1 - nivel_confianca) / 2
+    inferior, superior = np.quantile(roi, [alfa, 1 - alfa])
+    percentis = np.percentile(roi, [5, 25, 50, 75, 95])
+
+    resultado = {
+        'roi': roi,
+        'media': float(roi.mean()),
+        'mediana': float(percentis[2]),
+        'desvio_padrao': float(roi.std()),
+        'intervalo_confianca': (float(inferior), float(superior)),
+        'nivel_confianca': nivel_confianca,
+        'prob_prejuizo': float((roi < 0).mean()),
+        'faixas': dict(zip(['p5', 'p25', 'p50', 'p75', 'p95'], percentis.tolist()))
+    }
+
+    if relatorio:
+        print(f"{'='*60}")
+        print("SIMULAÇÃO DE ROI - ESTRATÉGIA DE RETENÇÃO")
+        print(f"{'='*60}")
+        print(f"\n🎲 {n_cenarios:,} cenários (VP={VP}, FP={FP}, FN={FN}, VN={VN})")
+        print(f"   ROI médio: R$ {resultado['media']:,.2f} (mediana R$ {resultado['mediana']:,.2f})")
+        print(f"   IC {nivel_confianca:.0%}: R$ {inferior:,.2f} a R$ {superior:,.2f}")
+        print(f"   Faixas (p5 / p25 / p75 / p95): R$ {percentis[0]:,.0f} / {percentis[1]:,.0f} / "
+              f"{percentis[3]:,.0f} / {percentis[4]:,.0f}")
+        print(f"   Probabilidade de prejuízo: {resultado['prob_prejuizo']:.1%}")
+        print(f"{'='*60}")
+
+    return resultado
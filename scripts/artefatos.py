@@ -0,0 +1,274 @@
+"""
+Artefatos do Modelo de Churn
+
+Salvamento e carregamento dos artefatos de deploy (modelo, features, scaler e
+codificador). Este módulo faz parte da superfície de inferência e por isso só
+importa joblib e os módulos de pontuação, nunca bibliotecas de gráfico.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+import joblib
+
+from arvores_compiladas import carregar_arvores_compiladas
+from bundle import carregar_bundle, resolver_bundle, salvar_bundle, serializar_numpy
+from codificador import CodificadorCategorico
+
+
+def salvar_modelo_completo(modelo, feature_columns, scaler=None, 
+                           caminho_modelo='modelo_final.pkl',
+                           caminho_features='feature_columns.pkl',
+                           caminho_scaler='scaler.pkl',
+                           codificador=None,
+                           caminho_codificador='codificador.pkl',
+                           caminho_bundle=None,
+                           configuracao=None,
+                           caminho_configuracao='configuracao_modelo.json'):
+    """
+    Salva modelo e artefatos necessários para deploy.
+    
+    Parâmetros:
+    -----------
+    modelo : modelo treinado
+    feature_columns : list
+        Lista de nomes das features
+    scaler : objeto scaler, opcional
+        Normalizador (se usado)
+    codificador : CodificadorCategorico, opcional
+        Codificador ajustado nas features originais de treino
+        (tabelas categoria -> índice de coluna usadas na inferência)
+    caminho_* : str
+        Caminhos para salvar os arquivos
+    caminho_bundle : str, opcional
+        Se informado, também grava o bundle versionado (ver `bundle.py`)
+    configuracao : dict, opcional
+        Hiperparâmetros e score do modelo (ex.: de `ajuste_hiperparametros`);
+        gravada em JSON e no manifesto do bundle
+    """
+    joblib.dump(modelo, caminho_modelo)
+    print(f"✅ Modelo salvo: {caminho_modelo}")
+    
+    joblib.dump(feature_columns, caminho_features)
+    print(f"✅ Features salvas: {caminho_features}")
+    
+    if scaler is not None:
+        joblib.dump(scaler, caminho_scaler)
+        print(f"✅ Scaler salvo: {caminho_scaler}")
+    
+    if codificador is not None:
+        joblib.dump(codificador.para_dict(), caminho_codificador)
+        print(f"✅ Codificador salvo: {caminho_codificador}")
+    
+    if configuracao is not None:
+        with open(caminho_configuracao, 'w', encoding='utf-8') as f:
+            json.dump(configuracao, f, ensure_ascii=False, indent=1, default=serializar_numpy)
+        print(f"✅ Configuração salva: {caminho_configuracao}")
+    
+    if caminho_bundle is not None:
+        salvar_bundle(caminho_bundle, modelo, feature_columns, scaler, codificador,
+                      configuracao=configuracao)
+    
+    print("\n📦 Deploy pronto!")
+
+
+# Cache por processo: {caminhos absolutos: (assinatura, artefatos)}
+_CACHE_ARTEFATOS = {}
+_TRAVA_CACHE = threading.Lock()
+
+
+def _assinatura_artefatos(caminhos):
+    """
+    Identifica o conteúdo atual dos artefatos sem lê-los por inteiro.
+    
+    Arquivos são identificados por (mtime, tamanho); um bundle, pela versão
+    publicada (ponteiro ATUAL) e pelo hash do manifesto dela, que já contém o
+    sha256 de cada array.
+    """
+    assinatura = []
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            # Sem versão publicada = primeiro bundle ainda sendo gravado
+            versao = resolver_bundle(caminho)
+            try:
+                with open(os.path.join(versao or caminho, 'manifesto.json'), 'rb') as f:
+                    assinatura.append((versao, hashlib.sha256(f.read()).hexdigest()))
+            except FileNotFoundError:  # inclui versão apagada depois de resolvida
+                assinatura.append(None)
+        elif os.path.exists(caminho):
+            info = os.stat(caminho)
+            assinatura.append((info.st_mtime_ns, info.st_size))
+        else:
+            assinatura.append(None)
+    return tuple(assinatura)
+
+
+def carregar_modelo_completo(caminho_modelo='modelo_final.pkl',
+                             caminho_features='feature_columns.pkl',
+                             caminho_scaler='scaler.pkl',
+                             caminho_codificador='codificador.pkl',
+                             com_codificador=False,
+                             usar_cache=True):
+    """
+    Carrega modelo e artefatos para uso.
+    
+    Chamadas repetidas com os mesmos caminhos devolvem os mesmos objetos em
+    memória enquanto os arquivos não mudarem (mtime/tamanho ou hash do
+    manifesto); use `usar_cache=False` para forçar a releitura.
+    
+    Se `caminho_modelo` terminar em .npz, carrega o modelo de árvores
+    compilado por `arvores_compiladas.py` (sem scikit-learn). Se for o
+    diretório de um bundle, carrega a versão publicada do bundle com mmap e
+    ignora os demais caminhos (que também ficam fora da chave do cache).
+    
+    Parâmetros:
+    -----------
+    com_codificador : bool
+        Se True, inclui o `CodificadorCategorico` salvo como quarto elemento
+        (o padrão mantém o retorno de 3 valores)
+    
+    Retorna:
+    --------
+    tuple: (modelo, feature_columns, scaler) ou, com `com_codificador=True`,
+        (modelo, feature_columns, scaler, codificador); `scaler` e
+        `codificador` são None quando não foram salvos
+    """
+    caminhos = _caminhos_usados(caminho_modelo, caminho_features, caminho_scaler, caminho_codificador)
+    assinatura = _assinatura_artefatos(caminhos)
+    
+    if usar_cache:
+        with _TRAVA_CACHE:
+            em_cache = _CACHE_ARTEFATOS.get(caminhos)
+        if em_cache is not None and em_cache[0] == assinatura:
+            return em_cache[1] if com_codificador else em_cache[1][:3]
+    
+    artefatos = _ler_artefatos(caminho_modelo, caminho_features, caminho_scaler, caminho_codificador)
+    
+    with _TRAVA_CACHE:
+        _CACHE_ARTEFATOS[caminhos] = (assinatura, artefatos)
+    
+    return artefatos if com_codificador else artefatos[:3]
+
+
+def _caminhos_usados(caminho_modelo, caminho_features, caminho_scaler, caminho_codificador):
+    # Um bundle já traz features, scaler e codificador: os .pkl padrão não contam
+    if os.path.isdir(caminho_modelo):
+        return (os.path.abspath(caminho_modelo),)
+    return tuple(os.path.abspath(c) for c in
+                 (caminho_modelo, caminho_features, caminho_scaler, caminho_codificador))
+
+
+def _ler_artefatos(caminho_modelo, caminho_features, caminho_scaler, caminho_codificador):
+    if os.path.isdir(caminho_modelo):
+        return carregar_bundle(caminho_modelo)
+    
+    if caminho_modelo.endswith('.npz'):
+        modelo = carregar_arvores_compiladas(caminho_modelo)
+    else:
+        modelo = joblib.load(caminho_modelo)
+    feature_columns = joblib.load(caminho_features)
+    
+    try:
+        scaler = joblib.load(caminho_scaler)
+    except:
+        scaler = None
+    
+    try:
+        codificador = CodificadorCategorico.de_dict(joblib.load(caminho_codificador))
+    except FileNotFoundError:
+        codificador = None
+    
+    print("✅ Modelo carregado e pronto para uso!")
+    
+    return modelo, feature_columns, scaler, codificador
+
+
+class ArtefatosAoVivo:
+    """
+    Mantém os artefatos carregados e troca-os quando um novo modelo é publicado.
+    
+    Quem pontua lê `atual` uma vez por lote e usa essa tupla até o fim; a
+    recarga monta a nova tupla em segundo plano e só então substitui a
+    referência (atribuição atômica), então lotes em andamento nunca veem um
+    modelo pela metade e não há bloqueio no caminho de pontuação.
+    
+    A recarga só vale para bundles, que publicam cada versão de uma vez
+    (ponteiro ATUAL). Os .pkl/.npz são gravados um a um e poderiam ser lidos
+    no meio de uma publicação, com modelo novo e scaler antigo; com eles os
+    artefatos são carregados uma única vez.
+    
+    Parâmetros:
+    -----------
+    caminho_modelo, caminho_features, caminho_scaler, caminho_codificador : str
+        Mesmos caminhos de `carregar_modelo_completo` (ou diretório de bundle)
+    intervalo : float
+        Segundos entre verificações no monitoramento em segundo plano
+    """
+    
+    def __init__(self, caminho_modelo='modelo_final.pkl',
+                 caminho_features='feature_columns.pkl',
+                 caminho_scaler='scaler.pkl',
+                 caminho_codificador='codificador.pkl',
+                 intervalo=5.0):
+        self.caminhos = (caminho_modelo, caminho_features, caminho_scaler, caminho_codificador)
+        self.intervalo = intervalo
+        self.recargas = 0
+        self.recarregavel = os.path.isdir(caminho_modelo)
+        self._assinatura = _assinatura_artefatos(_caminhos_usados(*self.caminhos))
+        self.atual = carregar_modelo_completo(*self.caminhos, com_codificador=True)
+        self._parar = threading.Event()
+        self._thread = None
+    
+    def verificar(self):
+        """
+        Recarrega os artefatos se os arquivos mudaram.
+        
+        Retorna:
+        --------
+        bool: True se um novo modelo foi colocado em uso (sempre False fora
+        de um bundle)
+        """
+        if not self.recarregavel:
+            return False
+        assinatura = _assinatura_artefatos(_caminhos_usados(*self.caminhos))
+        if assinatura == self._assinatura or assinatura[0] is None:
+            return False
+        
+        try:
+            novos = carregar_modelo_completo(*self.caminhos, com_codificador=True)
+        except Exception as erro:
+            # Ex.: versão apagada entre a leitura do ponteiro e a dos arrays; tenta de novo depois
+            print(f"⚠️  Falha ao recarregar artefatos, mantendo o modelo atual: {erro}")
+            return False
+        
+        self.atual = novos
+        self._assinatura = assinatura
+        self.recargas += 1
+        print(f"🔄 Novo modelo em uso (recarga #{self.recargas})")
+        return True
+    
+    def iniciar_monitoramento(self):
+        """
+        Inicia uma thread daemon que chama `verificar` a cada `intervalo` s.
+        """
+        if self._thread is not None:
+            return
+        if not self.recarregavel:
+            print("⚠️  Recarga a quente só é suportada para bundles; artefatos carregados uma única vez.")
+            return
+        self._parar.clear()
+        
+        def monitorar():
+            while not self._parar.wait(self.intervalo):
+                self.verificar()
+        
+        self._thread = threading.Thread(target=monitorar, name='recarga-artefatos', daemon=True)
+        self._thread.start()
+    
+    def parar_monitoramento(self):
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
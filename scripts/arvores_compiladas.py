@@ -0,0 +1,196 @@
+"""
+Árvores Compiladas para Inferência sem scikit-learn
+
+Converte um DecisionTreeClassifier ou RandomForestClassifier treinado em
+arrays planos (feature, limiar, filhos, valor da folha) e avalia lotes de
+linhas já codificadas percorrendo esses arrays com NumPy.
+
+Exportação:
+    python scripts/arvores_compiladas.py modelo_final.pkl modelo_compilado.npz
+"""
+
+import numpy as np
+
+
+class ArvoresCompiladas:
+    """
+    Floresta (ou árvore única) em formato de arrays planos.
+
+    Todas as árvores ficam concatenadas nos mesmos arrays; `raizes` guarda o
+    índice do nó raiz de cada árvore. Folhas apontam para si mesmas e têm
+    limiar infinito, então todas as linhas podem avançar `profundidade`
+    passos sem tratamento especial.
+
+    Atributos:
+    ----------
+    feature : np.ndarray (int32)
+        Índice da feature testada em cada nó
+    limiar : np.ndarray (float64)
+        Limiar do nó (vai para a esquerda se x <= limiar)
+    esquerda, direita : np.ndarray (int32)
+        Índices globais dos filhos
+    valor : np.ndarray (float64)
+        Probabilidade da classe positiva em cada nó
+    raizes : np.ndarray (int32)
+        Nó raiz de cada árvore
+    profundidade : int
+        Profundidade máxima entre as árvores
+    classes_ : np.ndarray
+        Classes do modelo original
+    """
+
+    def __init__(self, feature, limiar, esquerda, direita, valor, raizes, profundidade, classes):
+        self.feature = feature
+        self.limiar = limiar
+        self.esquerda = esquerda
+        self.direita = direita
+        self.valor = valor
+        self.raizes = raizes
+        self.profundidade = int(profundidade)
+        self.classes_ = np.asarray(classes)
+
+    def predict_proba(self, X, tamanho_bloco=4096):
+        """
+        Calcula as probabilidades [P(negativa), P(positiva)] para cada linha.
+
+        Parâmetros:
+        -----------
+        X : array-like ou matriz esparsa (n_linhas, n_features)
+            Linhas já codificadas (e normalizadas, se for o caso); matrizes
+            esparsas são densificadas um bloco por vez
+        tamanho_bloco : int
+            Linhas processadas por vez (limita a memória da matriz de nós)
+        """
+        # O scikit-learn compara as features em float32
+        esparso = hasattr(X, 'tocsr')
+        X = X.tocsr() if esparso else np.asarray(X, dtype=np.float32)
+        positiva = np.empty(X.shape[0], dtype=np.float64)
+
+        for inicio in range(0, X.shape[0], tamanho_bloco):
+            bloco = X[inicio:inicio + tamanho_bloco]
+            if esparso:
+                bloco = bloco.toarray().astype(np.float32)
+            linhas = np.arange(bloco.shape[0])[:, None]
+            nos = np.broadcast_to(self.raizes, (bloco.shape[0], self.raizes.size))
+
+            for _ in range(self.profundidade):
+                vai_esquerda = bloco[linhas, self.feature[nos]] <= self.limiar[nos]
+                nos = np.where(vai_esquerda, self.esquerda[nos], self.direita[nos])
+
+            positiva[inicio:inicio + tamanho_bloco] = self.valor[nos].mean(axis=1)
+
+        return np.column_stack([1.0 - positiva, positiva])
+
+    def predict(self, X):
+        probas = self.predict_proba(X)
+        return self.classes_[probas.argmax(axis=1)]
+
+
+def compilar_arvores(modelo):
+    """
+    Converte um modelo de árvore do scikit-learn em `ArvoresCompiladas`.
+
+    Parâmetros:
+    -----------
+    modelo : DecisionTreeClassifier ou RandomForestClassifier treinado
+        Modelo binário (duas classes)
+
+    Retorna:
+    --------
+    ArvoresCompiladas
+    """
+    estimadores = getattr(modelo, 'estimators_', [modelo])
+    if not all(hasattr(est, 'tree_') for est in estimadores):
+        raise TypeError(f"Modelo {type(modelo).__name__} não é baseado em árvores.")
+    if len(modelo.classes_) != 2:
+        raise ValueError("Apenas modelos de classificação binária podem ser compilados.")
+
+    partes = {'feature': [], 'limiar': [], 'esquerda': [], 'direita': [], 'valor': []}
+    raizes = []
+    profundidade = 0
+    deslocamento = 0
+
+    for est in estimadores:
+        arvore = est.tree_
+        n_nos = arvore.node_count
+        nos = np.arange(n_nos)
+        folha = arvore.children_left == -1
+
+        valores = arvore.value[:, 0, :]
+        valores = valores / valores.sum(axis=1, keepdims=True)
+
+        partes['feature'].append(np.where(folha, 0, arvore.feature))
+        partes['limiar'].append(np.where(folha, np.inf, arvore.threshold))
+        partes['esquerda'].append(np.where(folha, nos, arvore.children_left) + deslocamento)
+        partes['direita'].append(np.where(folha, nos, arvore.children_right) + deslocamento)
+        partes['valor'].append(valores[:, 1])
+
+        raizes.append(deslocamento)
+        profundidade = max(profundidade, arvore.max_depth)
+        deslocamento += n_nos
+
+    return ArvoresCompiladas(
+        feature=np.concatenate(partes['feature']).astype(np.int32),
+        limiar=np.concatenate(partes['limiar']).astype(np.float64),
+        esquerda=np.concatenate(partes['esquerda']).astype(np.int32),
+        direita=np.concatenate(partes['direita']).astype(np.int32),
+        valor=np.concatenate(partes['valor']).astype(np.float64),
+        raizes=np.asarray(raizes, dtype=np.int32),
+        profundidade=profundidade,
+        classes=modelo.classes_
+    )
+
+
+def array_de_classes(classes):
+    """
+    Classes como array gravável sem pickle, preservando int/bool; rótulos
+    em dtype object (strings do pandas) viram unicode.
+    """
+    classes = np.asarray(classes)
+    return classes.astype(str) if classes.dtype == object else classes
+
+
+def salvar_arvores_compiladas(compilado, caminho='modelo_compilado.npz'):
+    """
+    Salva os arrays da árvore compilada em um único arquivo .npz.
+    """
+    np.savez(
+        caminho,
+        feature=compilado.feature,
+        limiar=compilado.limiar,
+        esquerda=compilado.esquerda,
+        direita=compilado.direita,
+        valor=compilado.valor,
+        raizes=compilado.raizes,
+        profundidade=np.asarray(compilado.profundidade),
+        classes=array_de_classes(compilado.classes_)
+    )
+    print(f"✅ Modelo compilado salvo: {caminho}")
+
+
+def carregar_arvores_compiladas(caminho='modelo_compilado.npz'):
+    """
+    Carrega um modelo salvo por `salvar_arvores_compiladas` (sem scikit-learn).
+    """
+    with np.load(caminho) as arrays:
+        return ArvoresCompiladas(
+            feature=arrays['feature'],
+            limiar=arrays['limiar'],
+            esquerda=arrays['esquerda'],
+            direita=arrays['direita'],
+            valor=arrays['valor'],
+            raizes=arrays['raizes'],
+            profundidade=arrays['profundidade'],
+            classes=arrays['classes']
+        )
+
+
+if __name__ == "__main__":
+    import sys
+    import joblib
+
+    if len(sys.argv) != 3:
+        print("Uso: python arvores_compiladas.py <modelo_final.pkl> <modelo_compilado.npz>")
+        sys.exit(1)
+
+    salvar_arvores_compiladas(compilar_arvores(joblib.load(sys.argv[1])), sys.argv[2])
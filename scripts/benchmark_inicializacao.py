@@ -0,0 +1,105 @@
+"""
+Benchmark de Inicialização a Frio da Inferência
+
+Mede, em processos Python novos, o tempo para importar a superfície de
+inferência (`artefatos` + `pontuacao_lote`), carregar os artefatos e pontuar
+o primeiro cliente. Falha (código de saída 1) se o orçamento for excedido ou
+se algum módulo pesado de gráfico/treino for importado no caminho.
+
+Uso:
+    python scripts/benchmark_inicializacao.py [diretorio_artefatos] [--repeticoes N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+DIRETORIO_SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+
+# Orçamento (em segundos, mediana das repetições) para cada etapa.
+# Desempacotar modelos/scalers do sklearn (.pkl) consome a maior parte do total.
+ORCAMENTO_IMPORTACAO_S = 0.8
+ORCAMENTO_INICIALIZACAO_S = 2.0
+
+# Módulos que a importação da superfície de inferência não pode puxar
+MODULOS_PROIBIDOS = ['matplotlib', 'seaborn', 'sklearn']
+
+CODIGO_MEDICAO = """
+import json, os, sys, time
+inicio = time.perf_counter()
+from artefatos import carregar_modelo_completo
+from pontuacao_lote import pontuar_lote
+importacao = time.perf_counter() - inicio
+modulos = sorted(sys.modules)
+
+from bundle import resolver_bundle
+d = sys.argv[1]
+if resolver_bundle(d) is not None:
+    caminho_modelo = d
+elif os.path.exists(os.path.join(d, 'modelo_compilado.npz')):
+    caminho_modelo = os.path.join(d, 'modelo_compilado.npz')
+else:
+    caminho_modelo = os.path.join(d, 'modelo_final.pkl')
+modelo, feature_columns, scaler, codificador = carregar_modelo_completo(
+    caminho_modelo, os.path.join(d, 'feature_columns.pkl'),
+    os.path.join(d, 'scaler.pkl'), caminho_codificador=os.path.join(d, 'codificador.pkl'),
+    com_codificador=True)
+pontuar_lote([{
+    'tenure': 12, 'MonthlyCharges': 70.0, 'TotalCharges': 840.0,
+    'Contract': 'Month-to-month', 'InternetService': 'DSL',
+    'PaymentMethod': 'Electronic check', 'OnlineSecurity': 'No',
+    'TechSupport': 'No', 'PaperlessBilling': 'Yes', 'SeniorCitizen': 0
+}], modelo, feature_columns, scaler, codificador)
+total = time.perf_counter() - inicio
+
+print(json.dumps({'importacao': importacao, 'total': total, 'modulos': modulos,
+                  'sklearn_na_carga': 'sklearn' in sys.modules}))
+"""
+
+
+def medir(diretorio_artefatos):
+    """
+    Executa uma medição em um processo novo e retorna o dict de resultados.
+    """
+    saida = subprocess.run(
+        [sys.executable, '-W', 'ignore', '-c', CODIGO_MEDICAO, diretorio_artefatos],
+        cwd=DIRETORIO_SCRIPTS, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(saida.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('diretorio', nargs='?',
+                        default=os.path.join(DIRETORIO_SCRIPTS, '..', 'test'))
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    medicoes = [medir(args.diretorio) for _ in range(args.repeticoes)]
+    importacao = statistics.median(m['importacao'] for m in medicoes)
+    total = statistics.median(m['total'] for m in medicoes)
+    proibidos = [m for m in MODULOS_PROIBIDOS if m in medicoes[0]['modulos']]
+
+    print("=" * 60)
+    print("BENCHMARK DE INICIALIZAÇÃO A FRIO")
+    print("=" * 60)
+    print(f"Importação:           {importacao:.3f}s (orçamento {ORCAMENTO_IMPORTACAO_S:.1f}s)")
+    print(f"Importação+carga+1ª:  {total:.3f}s (orçamento {ORCAMENTO_INICIALIZACAO_S:.1f}s)")
+    print(f"sklearn na carga:     {'sim' if medicoes[0]['sklearn_na_carga'] else 'não'}")
+
+    ok = (importacao <= ORCAMENTO_IMPORTACAO_S and total <= ORCAMENTO_INICIALIZACAO_S
+          and not proibidos)
+    if proibidos:
+        print(f"\n⚠️  Módulos proibidos importados: {', '.join(proibidos)}")
+    print(f"\n{'✅ Dentro do orçamento' if ok else '⚠️  Orçamento excedido'}")
+    print("=" * 60)
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
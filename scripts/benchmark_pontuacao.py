@@ -0,0 +1,142 @@
+"""
+Benchmark da Pontuação em Lote
+
+Mede, sobre o dataset Telco, o tempo por cliente de:
+
+- o caminho cliente a cliente que `pontuar_lote` substituiu (DataFrame de uma
+  linha + get_dummies + reindex + predict + predict_proba) contra uma única
+  chamada de `pontuar_lote` para a base inteira;
+- predict seguido de predict_proba (duas passadas pela floresta) contra uma
+  única passada de predict_proba, em uma RandomForest de 200 árvores como a
+  do notebook 02.
+
+Falha (código de saída 1) se alguma aceleração ficar abaixo da meta.
+
+Uso:
+    python scripts/benchmark_pontuacao.py [diretorio_artefatos] [--individuais N] [--repeticoes N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from artefatos import carregar_modelo_completo
+from funcoes_auxiliares import FEATURES_SELECIONADAS, carregar_e_limpar_dados
+from pontuacao_lote import pontuar_lote
+
+
+DIRETORIO_SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+CSV_TELCO = os.path.join(DIRETORIO_SCRIPTS, '..', 'datasets', 'WA_Fn-UseC_-Telco-Customer-Churn.csv')
+
+# Metas de aceleração (razão entre as medianas dos tempos por cliente)
+META_LOTE = 100.0
+META_PASSADA_UNICA = 1.8
+
+
+def _mediana(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def _individual(df, modelo, feature_columns, scaler):
+    # Caminho antigo do prever_churn, um cliente por vez
+    for _, cliente in df.iterrows():
+        linha = pd.get_dummies(pd.DataFrame([cliente]).infer_objects())
+        linha = linha.reindex(columns=feature_columns, fill_value=0).astype(np.float64)
+        if scaler is not None:
+            linha = scaler.transform(linha)
+        modelo.predict(linha)
+        modelo.predict_proba(linha)
+
+
+def medir_lote(df, modelo, feature_columns, scaler, individuais=200, repeticoes=5):
+    """
+    Tempo por cliente do caminho individual e de `pontuar_lote`.
+
+    Retorna:
+    --------
+    dict com 'individual_s', 'lote_s' (segundos por cliente) e 'aceleracao'
+    """
+    amostra = df.head(individuais)
+    individual = _mediana(lambda: _individual(amostra, modelo, feature_columns, scaler), 1) / len(amostra)
+    lote = _mediana(lambda: pontuar_lote(df, modelo, feature_columns, scaler), repeticoes) / len(df)
+    return {'individual_s': individual, 'lote_s': lote, 'aceleracao': individual / lote}
+
+
+def medir_passada_unica(df, n_arvores=200, repeticoes=5):
+    """
+    Tempo de predict + predict_proba contra um único predict_proba em uma
+    RandomForest, para a base inteira e para um cliente.
+
+    Retorna:
+    --------
+    dict com os tempos (s) e as acelerações 'aceleracao_base' e 'aceleracao_cliente'
+    """
+    from sklearn.ensemble import RandomForestClassifier
+
+    X = pd.get_dummies(df.drop(columns='Churn'), drop_first=True).astype(np.float64)
+    modelo = RandomForestClassifier(n_estimators=n_arvores, max_depth=10, n_jobs=1, random_state=42)
+    modelo.fit(X, df['Churn'])
+    um = X.head(1)
+
+    resultado = {
+        'duas_base_s': _mediana(lambda: (modelo.predict(X), modelo.predict_proba(X)), repeticoes),
+        'uma_base_s': _mediana(lambda: modelo.predict_proba(X), repeticoes),
+        'duas_cliente_s': _mediana(lambda: (modelo.predict(um), modelo.predict_proba(um)), repeticoes * 10),
+        'uma_cliente_s': _mediana(lambda: modelo.predict_proba(um), repeticoes * 10),
+    }
+    resultado['aceleracao_base'] = resultado['duas_base_s'] / resultado['uma_base_s']
+    resultado['aceleracao_cliente'] = resultado['duas_cliente_s'] / resultado['uma_cliente_s']
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('diretorio', nargs='?',
+                        default=os.path.join(DIRETORIO_SCRIPTS, '..', 'test'))
+    parser.add_argument('--individuais', type=int, default=200)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    modelo, feature_columns, scaler = carregar_modelo_completo(
+        os.path.join(args.diretorio, 'modelo_final.pkl'),
+        os.path.join(args.diretorio, 'feature_columns.pkl'),
+        os.path.join(args.diretorio, 'scaler.pkl'))
+    df = carregar_e_limpar_dados(caminho_csv=CSV_TELCO, colunas=FEATURES_SELECIONADAS + ['Churn'])
+
+    lote = medir_lote(df[FEATURES_SELECIONADAS], modelo, feature_columns, scaler,
+                      args.individuais, args.repeticoes)
+    passada = medir_passada_unica(df, repeticoes=args.repeticoes)
+
+    print("=" * 60)
+    print(f"BENCHMARK DE PONTUAÇÃO ({len(df):,} clientes)")
+    print("=" * 60)
+    print(f"Cliente a cliente:      {lote['individual_s'] * 1e6:10.1f} µs/cliente")
+    print(f"pontuar_lote:           {lote['lote_s'] * 1e6:10.1f} µs/cliente")
+    print(f"Aceleração:             {lote['aceleracao']:10.0f}x (meta {META_LOTE:.0f}x)")
+    print("\nRandomForest (200 árvores)")
+    print(f"predict + predict_proba: {passada['duas_base_s'] * 1e3:9.1f} ms (base), "
+          f"{passada['duas_cliente_s'] * 1e3:.2f} ms (1 cliente)")
+    print(f"predict_proba:           {passada['uma_base_s'] * 1e3:9.1f} ms (base), "
+          f"{passada['uma_cliente_s'] * 1e3:.2f} ms (1 cliente)")
+    print(f"Aceleração:              {passada['aceleracao_base']:9.2f}x (base), "
+          f"{passada['aceleracao_cliente']:.2f}x (1 cliente) (meta {META_PASSADA_UNICA:.1f}x)")
+
+    ok = lote['aceleracao'] >= META_LOTE and passada['aceleracao_base'] >= META_PASSADA_UNICA
+    print(f"\n{'✅ Metas atingidas' if ok else '⚠️  Meta não atingida'}")
+    print("=" * 60)
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
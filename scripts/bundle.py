@@ -0,0 +1,341 @@
+"""
+Bundle de Artefatos do Modelo de Churn
+
+Formato único e versionado que substitui os três pickles de deploy. Um bundle
+é um diretório com:
+
+    ATUAL            caminho (relativo) da versão publicada
+    versoes/<id>/    uma versão completa:
+        manifesto.json   versão do formato, tipo do modelo, classes, hash de cada
+                         array e, opcionalmente, a configuração do modelo
+        esquema.json     feature_columns e tabelas do codificador
+        *.npy            arrays numéricos (scaler e modelo) sem compressão e as
+                         classes com o dtype original (int/bool/str)
+
+Os .npy são abertos com `mmap_mode='r'`: a carga é quase instantânea e as
+páginas são compartilhadas (somente leitura) entre os workers do servidor.
+Cada `salvar_bundle` grava uma versão em diretório novo e só então troca o
+ponteiro ATUAL com `os.replace`; arquivos de uma versão publicada nunca são
+reescritos, então um leitor nunca mistura arrays de versões diferentes.
+Diretórios com manifesto.json na raiz (formato anterior) continuam legíveis.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from arvores_compiladas import ArvoresCompiladas, array_de_classes, compilar_arvores
+from codificador import CodificadorCategorico
+
+
+VERSAO_FORMATO = 1
+ARQUIVO_PONTEIRO = 'ATUAL'
+
+
+class ModeloLinearCompilado:
+    """
+    Regressão logística binária avaliada apenas com NumPy.
+
+    Atributos:
+    ----------
+    coef : np.ndarray (n_features,)
+    intercepto : float
+    classes_ : np.ndarray
+    """
+
+    def __init__(self, coef, intercepto, classes):
+        self.coef = coef
+        self.intercepto = float(intercepto)
+        self.classes_ = np.asarray(classes)
+
+    def predict_proba(self, X):
+        if not hasattr(X, 'tocsr'):  # matrizes esparsas seguem sem densificar
+            X = np.asarray(X)
+        positiva = 1.0 / (1.0 + np.exp(-(X @ self.coef + self.intercepto)))
+        return np.column_stack([1.0 - positiva, positiva])
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+class EscalonadorCompilado:
+    """
+    Equivalente ao `StandardScaler.transform` a partir de média e escala.
+    """
+
+    def __init__(self, media, escala):
+        self.media = media
+        self.escala = escala
+
+    def transform(self, X):
+        if hasattr(X, 'tocsr'):
+            # Como StandardScaler(with_mean=False): centralizar destruiria a esparsidade
+            if np.any(self.media != 0):
+                raise ValueError("Matriz esparsa exige um scaler salvo com with_mean=False.")
+            return X.multiply(1.0 / self.escala).tocsr()
+        return (np.asarray(X, dtype=np.float64) - self.media) / self.escala
+
+
+def serializar_numpy(objeto):
+    """
+    `default` do json.dump: escalares e arrays NumPy viram números e listas
+    (ex.: max_depth=np.int64(5) na configuração).
+    """
+    if isinstance(objeto, np.generic):
+        return objeto.item()
+    if isinstance(objeto, np.ndarray):
+        return objeto.tolist()
+    raise TypeError(f"Objeto do tipo {type(objeto).__name__} não é serializável em JSON.")
+
+
+def _arrays_do_modelo(modelo):
+    """
+    Retorna (tipo_modelo, {nome: array}) para os modelos suportados.
+
+    Só entram modelos cuja probabilidade o bundle reproduz exatamente: média
+    das folhas (DecisionTree, RandomForest, ExtraTrees) ou sigmoide de uma
+    função linear (LogisticRegression, SGDClassifier com loss='log_loss').
+    Boosting, SVMs lineares e RidgeClassifier também têm `estimators_` ou
+    `coef_`, mas pontuariam errado e por isso são recusados.
+    """
+    from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression, SGDClassifier
+    from sklearn.tree import DecisionTreeClassifier
+
+    arvores = (ArvoresCompiladas, DecisionTreeClassifier, RandomForestClassifier, ExtraTreesClassifier)
+    if isinstance(modelo, arvores):
+        compilado = modelo if isinstance(modelo, ArvoresCompiladas) else compilar_arvores(modelo)
+        return 'arvores', {
+            'arvore_feature': compilado.feature,
+            'arvore_limiar': compilado.limiar,
+            'arvore_esquerda': compilado.esquerda,
+            'arvore_direita': compilado.direita,
+            'arvore_valor': compilado.valor,
+            'arvore_raizes': compilado.raizes,
+            'arvore_profundidade': np.asarray([compilado.profundidade], dtype=np.int64)
+        }
+    linear = isinstance(modelo, LogisticRegression) or (
+        isinstance(modelo, SGDClassifier) and modelo.loss == 'log_loss')
+    if linear and np.asarray(modelo.coef_).shape[0] == 1:
+        return 'linear', {
+            'linear_coef': np.asarray(modelo.coef_[0], dtype=np.float64),
+            'linear_intercepto': np.asarray(modelo.intercept_, dtype=np.float64)
+        }
+    raise TypeError(
+        f"Modelo {type(modelo).__name__} não pode ser convertido em arrays; "
+        "use salvar_modelo_completo (joblib) para os demais modelos."
+    )
+
+
+def _arrays_do_scaler(scaler, n):
+    from sklearn.preprocessing import StandardScaler
+
+    if not isinstance(scaler, StandardScaler):
+        raise TypeError(
+            f"Scaler {type(scaler).__name__} não é suportado no bundle; "
+            "apenas StandardScaler (média e escala) é exportado."
+        )
+    # StandardScaler(with_mean=False) ainda calcula mean_, mas não o subtrai
+    media = scaler.mean_ if scaler.with_mean else None
+    escala = scaler.scale_ if scaler.with_std else None
+    return {
+        'scaler_media': np.zeros(n) if media is None else np.asarray(media, dtype=np.float64),
+        'scaler_escala': np.ones(n) if escala is None else np.asarray(escala, dtype=np.float64)
+    }
+
+
+def _sha256(caminho):
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def resolver_bundle(diretorio):
+    """
+    Diretório da versão publicada de um bundle.
+
+    Parâmetros:
+    -----------
+    diretorio : str
+        Diretório do bundle
+
+    Retorna:
+    --------
+    str com o diretório que contém o manifesto.json em uso, ou None se o
+    diretório não for um bundle (ou ainda não tiver versão publicada)
+    """
+    try:
+        with open(os.path.join(diretorio, ARQUIVO_PONTEIRO), encoding='utf-8') as f:
+            versao = os.path.join(diretorio, f.read().strip())
+    except FileNotFoundError:
+        versao = diretorio  # formato anterior: manifesto na raiz
+    return versao if os.path.exists(os.path.join(versao, 'manifesto.json')) else None
+
+
+def _remover_versoes_antigas(diretorio, publicada, manter):
+    raiz = os.path.join(diretorio, 'versoes')
+    versoes = sorted((os.path.join(raiz, nome) for nome in os.listdir(raiz)), key=os.path.getmtime)
+    # Quem já mapeou os arrays de uma versão removida continua lendo os inodes antigos
+    for versao in versoes[:-manter]:
+        if os.path.abspath(versao) != os.path.abspath(publicada):
+            shutil.rmtree(versao, ignore_errors=True)
+
+
+def salvar_bundle(diretorio, modelo, feature_columns, scaler=None, codificador=None,
+                  versao_modelo=None, configuracao=None, manter_versoes=3):
+    """
+    Salva modelo, esquema e scaler em um bundle versionado.
+
+    Parâmetros:
+    -----------
+    diretorio : str
+        Diretório do bundle (criado se não existir)
+    modelo : modelo treinado
+        DecisionTree, RandomForest ou ExtraTrees (compilados para arrays) ou
+        LogisticRegression/SGDClassifier(loss='log_loss') binários
+    feature_columns : list
+        Lista de nomes das features
+    scaler : StandardScaler, opcional
+        Normalizador (se usado); apenas média e escala são salvas
+    codificador : CodificadorCategorico, opcional
+        Codificador ajustado no treino
+    versao_modelo : str, opcional
+        Identificador do modelo (padrão: data/hora UTC)
+    configuracao : dict, opcional
+        Hiperparâmetros do modelo, registrados no manifesto
+    manter_versoes : int
+        Versões mantidas em disco (a publicada incluída); as mais antigas
+        são apagadas depois da publicação
+
+    Retorna:
+    --------
+    dict com o manifesto gravado
+    """
+    tipo_modelo, arrays = _arrays_do_modelo(modelo)
+    arrays['classes'] = array_de_classes(modelo.classes_)
+    if scaler is not None:
+        arrays.update(_arrays_do_scaler(scaler, len(feature_columns)))
+
+    versao_modelo = versao_modelo or datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    os.makedirs(os.path.join(diretorio, 'versoes'), exist_ok=True)
+    # Diretório novo a cada gravação, mesmo que versao_modelo se repita
+    destino = tempfile.mkdtemp(prefix=f"{versao_modelo}-", dir=os.path.join(diretorio, 'versoes'))
+    os.chmod(destino, 0o755)  # mkdtemp cria com 0o700
+
+    esquema = {'feature_columns': list(feature_columns)}
+    if codificador is not None:
+        esquema['codificador'] = codificador.para_dict()
+    with open(os.path.join(destino, 'esquema.json'), 'w', encoding='utf-8') as f:
+        json.dump(esquema, f, ensure_ascii=False, indent=1, default=serializar_numpy)
+
+    descricao_arrays = {}
+    for nome, array in arrays.items():
+        arquivo = f"{nome}.npy"
+        caminho = os.path.join(destino, arquivo)
+        with open(caminho, 'wb') as f:
+            np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+        descricao_arrays[nome] = {
+            'arquivo': arquivo,
+            'dtype': str(array.dtype),
+            'shape': list(array.shape),
+            'sha256': _sha256(caminho)
+        }
+
+    manifesto = {
+        'formato': 'churn-bundle',
+        'versao_formato': VERSAO_FORMATO,
+        'versao_modelo': versao_modelo,
+        'tipo_modelo': tipo_modelo,
+        'classes': [str(c) for c in modelo.classes_],
+        'esquema': 'esquema.json',
+        'arrays': descricao_arrays
+    }
+    if configuracao is not None:
+        manifesto['configuracao'] = configuracao
+    with open(os.path.join(destino, 'manifesto.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, ensure_ascii=False, indent=1, default=serializar_numpy)
+
+    # Publicação atômica: o ponteiro só passa a apontar para a versão completa
+    ponteiro = os.path.join(diretorio, ARQUIVO_PONTEIRO)
+    with open(ponteiro + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(os.path.relpath(destino, diretorio))
+    os.replace(ponteiro + '.tmp', ponteiro)
+    _remover_versoes_antigas(diretorio, destino, max(manter_versoes, 1))
+
+    print(f"✅ Bundle salvo: {diretorio} (versão {manifesto['versao_modelo']})")
+    return manifesto
+
+
+def carregar_bundle(diretorio, mmap=True, verificar_hash=False):
+    """
+    Carrega um bundle salvo por `salvar_bundle`.
+
+    Parâmetros:
+    -----------
+    diretorio : str
+        Diretório do bundle (a versão publicada é lida via ATUAL)
+    mmap : bool
+        Se True, os arrays são mapeados em memória (somente leitura)
+    verificar_hash : bool
+        Se True, confere o sha256 de cada array com o manifesto
+
+    Retorna:
+    --------
+    tuple: (modelo, feature_columns, scaler, codificador), como
+    `carregar_modelo_completo(..., com_codificador=True)`
+    """
+    versao = resolver_bundle(diretorio)
+    if versao is None:
+        raise FileNotFoundError(f"Nenhuma versão publicada no bundle {diretorio}.")
+    with open(os.path.join(versao, 'manifesto.json'), encoding='utf-8') as f:
+        manifesto = json.load(f)
+    if manifesto.get('formato') != 'churn-bundle':
+        raise ValueError(f"{diretorio} não é um bundle de churn.")
+    if manifesto['versao_formato'] > VERSAO_FORMATO:
+        raise ValueError(
+            f"Bundle na versão de formato {manifesto['versao_formato']}; "
+            f"este código lê até a versão {VERSAO_FORMATO}."
+        )
+
+    arrays = {}
+    for nome, info in manifesto['arrays'].items():
+        caminho = os.path.join(versao, info['arquivo'])
+        if verificar_hash and _sha256(caminho) != info['sha256']:
+            raise ValueError(f"Hash divergente para {info['arquivo']} no bundle {diretorio}.")
+        arrays[nome] = np.load(caminho, mmap_mode='r' if mmap else None, allow_pickle=False)
+
+    with open(os.path.join(versao, manifesto['esquema']), encoding='utf-8') as f:
+        esquema = json.load(f)
+
+    # Bundles antigos só têm as classes como texto no manifesto
+    classes = np.array(arrays.pop('classes')) if 'classes' in arrays else manifesto['classes']
+    if manifesto['tipo_modelo'] == 'arvores':
+        modelo = ArvoresCompiladas(
+            feature=arrays['arvore_feature'],
+            limiar=arrays['arvore_limiar'],
+            esquerda=arrays['arvore_esquerda'],
+            direita=arrays['arvore_direita'],
+            valor=arrays['arvore_valor'],
+            raizes=arrays['arvore_raizes'],
+            profundidade=arrays['arvore_profundidade'][0],
+            classes=classes
+        )
+    else:
+        modelo = ModeloLinearCompilado(arrays['linear_coef'], arrays['linear_intercepto'][0], classes)
+
+    scaler = None
+    if 'scaler_media' in arrays:
+        scaler = EscalonadorCompilado(arrays['scaler_media'], arrays['scaler_escala'])
+
+    codificador = None
+    if 'codificador' in esquema:
+        codificador = CodificadorCategorico.de_dict(esquema['codificador'])
+
+    return modelo, esquema['feature_columns'], scaler, codificador
@@ -0,0 +1,203 @@
+"""
+Codificador Categórico Pré-compilado para o Projeto de Churn
+
+Substitui o `pd.get_dummies(..., drop_first=True)` + alinhamento de colunas em
+tempo de inferência por tabelas fixas categoria -> índice de coluna, construídas
+a partir das categorias vistas no treino.
+
+Com `transformar(df, esparso=True)` a matriz sai em CSR, com as mesmas colunas
+de `feature_columns`; o caminho esparso de ponta a ponta é:
+
+    matriz = codificador.transformar(X, esparso=True)
+    scaler = StandardScaler(with_mean=False).fit(matriz)
+    modelo.fit(scaler.transform(matriz), y)
+    pontuar_lote(dados, modelo, codificador.feature_columns, scaler, codificador, esparso=True)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class CodificadorCategorico:
+    """
+    One-hot encoder congelado, compatível com `pd.get_dummies(drop_first=True)`.
+
+    Atributos:
+    ----------
+    feature_columns : list
+        Colunas codificadas, na mesma ordem usada no treino
+    colunas_numericas : list
+        Colunas copiadas diretamente para a matriz
+    indices_numericos : list
+        Índice de coluna de cada coluna numérica
+    niveis : dict
+        {coluna_categorica: [níveis]} na ordem do treino
+    indices : dict
+        {coluna_categorica: np.ndarray} com o índice de coluna de cada nível
+        (-1 para o nível de referência removido pelo drop_first)
+    """
+
+    def __init__(self):
+        self.feature_columns = []
+        self.colunas_numericas = []
+        self.indices_numericos = []
+        self.niveis = {}
+        self.indices = {}
+
+    def ajustar(self, X):
+        """
+        Aprende as tabelas a partir das features originais de treino.
+
+        Parâmetros:
+        -----------
+        X : DataFrame
+            Features antes do encoding (ex.: saída de `preparar_features`)
+
+        Retorna:
+        --------
+        self
+        """
+        # Colunas Sim/Não compactadas em bool voltam a ser tratadas como 'No'/'Yes'
+        colunas_cat = X.select_dtypes(include=['object', 'string', 'category', 'bool']).columns.tolist()
+        self.colunas_numericas = [c for c in X.columns if c not in colunas_cat]
+        self.indices_numericos = list(range(len(self.colunas_numericas)))
+        self.feature_columns = list(self.colunas_numericas)
+        self.niveis = {}
+        self.indices = {}
+
+        for col in colunas_cat:
+            if pd.api.types.is_bool_dtype(X[col]):
+                niveis = ['No', 'Yes']
+            elif isinstance(X[col].dtype, pd.CategoricalDtype):
+                niveis = [str(n) for n in X[col].cat.categories]
+            else:
+                niveis = sorted(X[col].dropna().astype(str).unique())
+            indices = np.full(len(niveis), -1, dtype=np.int64)
+            for k, nivel in enumerate(niveis[1:], start=1):
+                indices[k] = len(self.feature_columns)
+                self.feature_columns.append(f"{col}_{nivel}")
+            self.niveis[col] = niveis
+            self.indices[col] = indices
+
+        return self
+
+    @classmethod
+    def de_feature_columns(cls, feature_columns, colunas_originais):
+        """
+        Reconstrói as tabelas a partir de um `feature_columns.pkl` já existente.
+
+        O nível de referência não aparece em `feature_columns`; ele e qualquer
+        nível desconhecido são codificados como zeros, como no get_dummies.
+
+        Parâmetros:
+        -----------
+        feature_columns : list
+            Lista de nomes das features usadas no treino
+        colunas_originais : list
+            Nomes das colunas antes do encoding
+        """
+        cod = cls()
+        cod.feature_columns = list(feature_columns)
+        colunas_originais = [str(c) for c in colunas_originais]
+
+        for j, col in enumerate(feature_columns):
+            if col in colunas_originais:
+                cod.colunas_numericas.append(col)
+                cod.indices_numericos.append(j)
+                continue
+            candidatas = [c for c in colunas_originais if col.startswith(c + '_')]
+            if not candidatas:
+                raise KeyError(f"Coluna '{col}' do esquema não pode ser gerada a partir dos dados de entrada.")
+            original = max(candidatas, key=len)
+            cod.niveis.setdefault(original, []).append(col[len(original) + 1:])
+            cod.indices[original] = np.append(cod.indices.get(original, np.empty(0, dtype=np.int64)), j)
+
+        return cod
+
+    def transformar(self, df, esparso=False):
+        """
+        Preenche uma matriz NumPy pré-alocada com as features codificadas.
+
+        Parâmetros:
+        -----------
+        df : DataFrame
+            Clientes com as colunas originais
+        esparso : bool
+            Se True, retorna uma matriz CSR (scipy) sem materializar a versão
+            densa; colunas na mesma ordem de `feature_columns`
+
+        Retorna:
+        --------
+        np.ndarray (n_clientes, n_features) em float64, ou
+        scipy.sparse.csr_matrix se `esparso=True`
+        """
+        n = len(df)
+        linhas = np.arange(n)
+        if esparso:
+            partes_linhas, partes_colunas, partes_valores = [], [], []
+        else:
+            matriz = np.zeros((n, len(self.feature_columns)), dtype=np.float64)
+
+        for col, j in zip(self.colunas_numericas, self.indices_numericos):
+            valores = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+            if esparso:
+                nao_nulos = valores != 0
+                partes_linhas.append(linhas[nao_nulos])
+                partes_colunas.append(np.full(nao_nulos.sum(), j, dtype=np.int64))
+                partes_valores.append(valores[nao_nulos])
+            else:
+                matriz[:, j] = valores
+
+        for col, niveis in self.niveis.items():
+            if col not in df.columns:
+                raise KeyError(f"Coluna categórica '{col}' ausente nos dados de entrada.")
+            valores = df[col]
+            if pd.api.types.is_bool_dtype(valores):
+                valores = np.where(valores.to_numpy(), 'Yes', 'No')
+            else:
+                valores = valores.astype(str)
+            codigos = pd.Index(niveis).get_indexer(valores)
+            destino = np.where(codigos >= 0, self.indices[col][codigos], -1)
+            validos = destino >= 0
+            if esparso:
+                partes_linhas.append(linhas[validos])
+                partes_colunas.append(destino[validos])
+                partes_valores.append(np.ones(validos.sum()))
+            else:
+                matriz[linhas[validos], destino[validos]] = 1.0
+
+        if not esparso:
+            return matriz
+
+        from scipy import sparse
+        vazio = [np.empty(0, dtype=np.int64)]
+        return sparse.csr_matrix(
+            (np.concatenate(partes_valores + [np.empty(0)]),
+             (np.concatenate(partes_linhas + vazio), np.concatenate(partes_colunas + vazio))),
+            shape=(n, len(self.feature_columns))
+        )
+
+    def para_dict(self):
+        """
+        Exporta as tabelas como estruturas Python simples (para joblib/JSON).
+        """
+        return {
+            'feature_columns': list(self.feature_columns),
+            'colunas_numericas': list(self.colunas_numericas),
+            'indices_numericos': list(self.indices_numericos),
+            'niveis': {col: list(niveis) for col, niveis in self.niveis.items()},
+            'indices': {col: self.indices[col].tolist() for col in self.niveis}
+        }
+
+    @classmethod
+    def de_dict(cls, dados):
+        """
+        Reconstrói o codificador a partir de `para_dict()`.
+        """
+        cod = cls()
+        cod.feature_columns = list(dados['feature_columns'])
+        cod.colunas_numericas = list(dados['colunas_numericas'])
+        cod.indices_numericos = list(dados['indices_numericos'])
+        cod.niveis = {col: list(niveis) for col, niveis in dados['niveis'].items()}
+        cod.indices = {col: np.asarray(idx, dtype=np.int64) for col, idx in dados['indices'].items()}
+        return cod
@@ -0,0 +1,140 @@
+"""
+Comparação Paralela de Modelos de Churn
+
+Treina e avalia os modelos candidatos do notebook 02 ao mesmo tempo, um por
+processo (joblib/loky). As matrizes de treino e teste são passadas aos
+processos como memmaps somente leitura, sem cópia por modelo.
+
+Uso:
+    resultados, modelos = comparar_modelos_paralelo(X_train, X_test, y_train, y_test)
+    comparar_modelos(resultados)   # de funcoes_auxiliares
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+from joblib import Parallel, delayed
+
+
+def modelos_padrao():
+    """
+    Modelos e hiperparâmetros usados no notebook 02.
+
+    Retorna:
+    --------
+    dict {nome: (estimador, usa_dados_normalizados)}
+    """
+    from sklearn.tree import DecisionTreeClassifier
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.neighbors import KNeighborsClassifier
+    from sklearn.svm import SVC
+
+    return {
+        'Decision Tree': (DecisionTreeClassifier(max_depth=4, random_state=42), False),
+        'Random Forest': (RandomForestClassifier(n_estimators=200, max_depth=15, min_samples_split=5,
+                                                 random_state=42, n_jobs=1), False),
+        'Logistic Regression': (LogisticRegression(max_iter=1000, random_state=42), True),
+        'KNN': (KNeighborsClassifier(n_neighbors=7), True),
+        'SVM': (SVC(kernel='rbf', random_state=42), True)
+    }
+
+
+def _treinar_avaliar(nome, estimador, X_train, X_test, y_train, y_test, pos_label):
+    """
+    Executado no processo filho: treina, prediz e calcula as métricas.
+    """
+    from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+
+    inicio = time.perf_counter()
+    estimador.fit(X_train, y_train)
+    tempo = time.perf_counter() - inicio
+
+    y_pred = estimador.predict(X_test)
+    metricas = {
+        'acuracia': accuracy_score(y_test, y_pred),
+        'precisao': precision_score(y_test, y_pred, pos_label=pos_label),
+        'recall': recall_score(y_test, y_pred, pos_label=pos_label),
+        'f1_score': f1_score(y_test, y_pred, pos_label=pos_label),
+        'tempo': tempo
+    }
+    return nome, metricas, estimador
+
+
+def _para_memmap(array, diretorio, nome):
+    """
+    Grava o array em .npy e reabre como memmap somente leitura.
+    """
+    caminho = os.path.join(diretorio, f"{nome}.npy")
+    np.save(caminho, np.ascontiguousarray(array))
+    return np.load(caminho, mmap_mode='r')
+
+
+def comparar_modelos_paralelo(X_train, X_test, y_train, y_test, modelos=None,
+                              scaler=None, n_processos=-1, pos_label='Yes'):
+    """
+    Treina e avalia vários modelos em paralelo.
+
+    Parâmetros:
+    -----------
+    X_train, X_test : DataFrame ou array
+        Features já codificadas (ex.: saída de get_dummies / CodificadorCategorico)
+    y_train, y_test : array-like
+        Target ('Yes'/'No')
+    modelos : dict, opcional
+        {nome: (estimador, usa_dados_normalizados)}; padrão: `modelos_padrao()`
+    scaler : objeto scaler, opcional
+        Normalizador para os modelos que usam dados normalizados
+        (padrão: StandardScaler ajustado em X_train)
+    n_processos : int
+        Número de processos (-1 = todos os núcleos)
+    pos_label : str
+        Classe positiva para precisão/recall/F1
+
+    Retorna:
+    --------
+    tuple: (resultados_dict, modelos_treinados)
+        resultados_dict no formato de `comparar_modelos`:
+        {nome: {'acuracia', 'precisao', 'recall', 'f1_score', 'tempo'}}
+    """
+    if modelos is None:
+        modelos = modelos_padrao()
+
+    X_train = np.asarray(X_train, dtype=np.float64)
+    X_test = np.asarray(X_test, dtype=np.float64)
+    y_train = np.asarray(y_train)
+    y_test = np.asarray(y_test)
+
+    if any(usa_escala for _, usa_escala in modelos.values()) and scaler is None:
+        from sklearn.preprocessing import StandardScaler
+        scaler = StandardScaler().fit(X_train)
+
+    # Modelos mais caros primeiro, para equilibrar a ocupação dos processos
+    ordem = sorted(modelos, key=lambda nome: nome not in ('SVM', 'Random Forest'))
+
+    inicio = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix='comparacao_') as diretorio:
+        dados = {
+            False: (_para_memmap(X_train, diretorio, 'X_train'),
+                    _para_memmap(X_test, diretorio, 'X_test'))
+        }
+        if scaler is not None:
+            dados[True] = (_para_memmap(scaler.transform(X_train), diretorio, 'X_train_scaled'),
+                           _para_memmap(scaler.transform(X_test), diretorio, 'X_test_scaled'))
+
+        saidas = Parallel(n_jobs=n_processos, mmap_mode='r')(
+            delayed(_treinar_avaliar)(nome, modelos[nome][0], *dados[modelos[nome][1]],
+                                      y_train, y_test, pos_label)
+            for nome in ordem
+        )
+    tempo_total = time.perf_counter() - inicio
+
+    resultados = {nome: metricas for nome, metricas, _ in saidas}
+    treinados = {nome: estimador for nome, _, estimador in saidas}
+
+    print(f"✅ {len(resultados)} modelos comparados em {tempo_total:.2f}s "
+          f"(soma dos treinos: {sum(r['tempo'] for r in resultados.values()):.2f}s)")
+
+    return {nome: resultados[nome] for nome in modelos}, {nome: treinados[nome] for nome in modelos}
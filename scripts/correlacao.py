@@ -0,0 +1,184 @@
+"""
+Serviço de Correlação
+
+Calcula a matriz de correlação (Pearson ou Spearman) uma única vez, por
+produtos matriciais sobre os dados centralizados, e guarda o resultado em
+cache: o heatmap e as anotações do pair plot leem a mesma matriz, em vez de
+`df.corr()` + um `serie.corr(outra)` por par de variáveis.
+
+Os dados podem ser processados em blocos (DataFrame grande, CSV ou iterável
+de DataFrames); por bloco acumulam-se apenas matrizes k x k, então a memória
+não depende do número de linhas. Valores ausentes seguem `df.corr()`: cada
+par usa as linhas em que as duas colunas estão preenchidas.
+
+Uso:
+    servico = ServicoCorrelacao(df, colunas=numeric_columns)
+    sns.heatmap(servico.matriz(), ...)
+    servico.par('PlayTimeHours', 'PlayerLevel')
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class AcumuladorCorrelacao:
+    """
+    Acumula, bloco a bloco, as somas necessárias para a correlação de Pearson
+    par a par.
+
+    Os valores são deslocados pela média do primeiro bloco antes dos
+    produtos, o que evita o cancelamento numérico das somas brutas.
+
+    Parâmetros:
+    -----------
+    colunas : list
+        Colunas numéricas, na ordem da matriz
+    """
+
+    def __init__(self, colunas):
+        self.colunas = list(colunas)
+        k = len(self.colunas)
+        self.deslocamento = None
+        self.n = np.zeros((k, k))
+        self.soma = np.zeros((k, k))       # soma de x_i nas linhas em que x_j é válido
+        self.soma_quad = np.zeros((k, k))  # idem para x_i²
+        self.produtos = np.zeros((k, k))   # soma de x_i * x_j
+
+    def atualizar(self, bloco):
+        """
+        Acrescenta um bloco (DataFrame com as colunas do acumulador).
+        """
+        valores = bloco[self.colunas].to_numpy(dtype=np.float64)
+        if valores.shape[0] == 0:
+            return self
+        if self.deslocamento is None:
+            self.deslocamento = np.nan_to_num(np.nanmean(valores, axis=0))
+
+        centrados = valores - self.deslocamento
+        validos = ~np.isnan(centrados)
+        if validos.all():
+            self.n += centrados.shape[0]
+            self.soma += centrados.sum(axis=0)[:, None]
+            self.soma_quad += (centrados ** 2).sum(axis=0)[:, None]
+        else:
+            centrados = np.where(validos, centrados, 0.0)
+            mascara = validos.astype(np.float64)
+            self.n += mascara.T @ mascara
+            self.soma += centrados.T @ mascara
+            self.soma_quad += (centrados ** 2).T @ mascara
+        self.produtos += centrados.T @ centrados
+        return self
+
+    def matriz(self):
+        """
+        Matriz de correlação (DataFrame k x k).
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariancia = self.produtos - self.soma * self.soma.T / self.n
+            variancia = self.soma_quad - self.soma ** 2 / self.n
+            correlacao = covariancia / np.sqrt(variancia * variancia.T)
+        correlacao = np.clip(correlacao, -1.0, 1.0)
+        correlacao[self.n < 2] = np.nan
+
+        diagonal = np.diag_indices_from(correlacao)
+        correlacao[diagonal] = np.where(np.isnan(correlacao[diagonal]), np.nan, 1.0)
+        return pd.DataFrame(correlacao, index=self.colunas, columns=self.colunas)
+
+
+def _blocos(fonte, tamanho_bloco, opcoes_leitura):
+    if isinstance(fonte, pd.DataFrame):
+        for inicio in range(0, max(len(fonte), 1), tamanho_bloco):
+            yield fonte.iloc[inicio:inicio + tamanho_bloco]
+    elif isinstance(fonte, str):
+        with pd.read_csv(fonte, chunksize=tamanho_bloco, **opcoes_leitura) as leitor:
+            yield from leitor
+    else:
+        yield from fonte
+
+
+class ServicoCorrelacao:
+    """
+    Matrizes de correlação calculadas sob demanda e mantidas em cache.
+
+    Parâmetros:
+    -----------
+    fonte : DataFrame, caminho de CSV ou iterável de DataFrames
+    colunas : list, opcional
+        Colunas numéricas (padrão: todas as numéricas do DataFrame; obrigatório
+        para CSV/iterável)
+    tamanho_bloco : int
+        Linhas por bloco
+    **opcoes_leitura
+        Repassadas a `pd.read_csv`
+
+    Observação:
+    -----------
+    Spearman precisa dos postos globais de cada coluna, então exige um
+    DataFrame. Com valores ausentes, `df.corr('spearman')` recalcula os postos
+    em cada par, e o serviço delega a ele nesse caso.
+    """
+
+    METODOS = ('pearson', 'spearman')
+
+    def __init__(self, fonte, colunas=None, tamanho_bloco=200_000, **opcoes_leitura):
+        if colunas is None:
+            if not isinstance(fonte, pd.DataFrame):
+                raise ValueError("Informe `colunas` quando a fonte não for um DataFrame")
+            colunas = fonte.select_dtypes(include=[np.number]).columns.tolist()
+        self.fonte = fonte
+        self.colunas = list(colunas)
+        self.tamanho_bloco = tamanho_bloco
+        self.opcoes_leitura = opcoes_leitura
+        self._cache = {}
+
+    def _calcular(self, metodo):
+        if metodo == 'pearson':
+            acumulador = AcumuladorCorrelacao(self.colunas)
+            for bloco in _blocos(self.fonte, self.tamanho_bloco, self.opcoes_leitura):
+                acumulador.atualizar(bloco)
+            return acumulador.matriz()
+
+        if not isinstance(self.fonte, pd.DataFrame):
+            raise ValueError("Spearman requer a fonte como DataFrame (postos globais)")
+        dados = self.fonte[self.colunas]
+        if dados.isna().to_numpy().any():
+            return dados.corr(method='spearman')
+        postos = dados.rank()
+        acumulador = AcumuladorCorrelacao(self.colunas)
+        for inicio in range(0, max(len(postos), 1), self.tamanho_bloco):
+            acumulador.atualizar(postos.iloc[inicio:inicio + self.tamanho_bloco])
+        return acumulador.matriz()
+
+    def matriz(self, metodo='pearson', colunas=None):
+        """
+        Matriz de correlação (calculada na primeira chamada de cada método).
+
+        Parâmetros:
+        -----------
+        metodo : str
+            'pearson' ou 'spearman'
+        colunas : list, opcional
+            Subconjunto das colunas do serviço
+
+        Retorna:
+        --------
+        DataFrame
+        """
+        if metodo not in self.METODOS:
+            raise ValueError(f"Método '{metodo}' não suportado. Use: {self.METODOS}")
+        if metodo not in self._cache:
+            self._cache[metodo] = self._calcular(metodo)
+        matriz = self._cache[metodo]
+        return matriz if colunas is None else matriz.loc[colunas, colunas]
+
+    def par(self, coluna_a, coluna_b, metodo='pearson'):
+        """
+        Correlação entre duas colunas, lida da matriz em cache.
+        """
+        return float(self.matriz(metodo).at[coluna_a, coluna_b])
+
+    def limpar_cache(self):
+        """
+        Descarta as matrizes calculadas (ex.: após alterar o DataFrame).
+        """
+        self._cache.clear()
@@ -2,17 +2,189 @@
 Funções Auxiliares para o Projeto de Churn
 
 Este módulo contém funções utilitárias para análise e predição de churn.
+
+matplotlib, seaborn e sklearn.metrics são importados apenas dentro das funções
+de gráfico/relatório; o carregamento de artefatos fica em `artefatos.py`
+(reexportado aqui) para que a inferência não pague esse custo de importação.
 """
 
+import hashlib
+import json
+import os
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.metrics import confusion_matrix, classification_report
-import joblib
 
+from artefatos import salvar_modelo_completo, carregar_modelo_completo
+from metricas import AcumuladorMetricas
+
+
+# Tipos explícitos do dataset Telco para a leitura em blocos. As categorias são
+# fixas (e em ordem alfabética, como no get_dummies) para que todos os blocos
+# compartilhem os mesmos códigos; os inteiros são anuláveis (Int8/Int16), então
+# um valor ausente não interrompe a leitura.
+_SIM_NAO = pd.CategoricalDtype(['No', 'Yes'])
+_SERVICO_INTERNET = pd.CategoricalDtype(['No', 'No internet service', 'Yes'])
+
+DTYPES_CHURN = {
+    'customerID': 'string',
+    'gender': pd.CategoricalDtype(['Female', 'Male']),
+    'SeniorCitizen': 'Int8',
+    'Partner': _SIM_NAO,
+    'Dependents': _SIM_NAO,
+    'tenure': 'Int16',
+    'PhoneService': _SIM_NAO,
+    'MultipleLines': pd.CategoricalDtype(['No', 'No phone service', 'Yes']),
+    'InternetService': pd.CategoricalDtype(['DSL', 'Fiber optic', 'No']),
+    'OnlineSecurity': _SERVICO_INTERNET,
+    'OnlineBackup': _SERVICO_INTERNET,
+    'DeviceProtection': _SERVICO_INTERNET,
+    'TechSupport': _SERVICO_INTERNET,
+    'StreamingTV': _SERVICO_INTERNET,
+    'StreamingMovies': _SERVICO_INTERNET,
+    'Contract': pd.CategoricalDtype(['Month-to-month', 'One year', 'Two year']),
+    'PaperlessBilling': _SIM_NAO,
+    'PaymentMethod': pd.CategoricalDtype(['Bank transfer (automatic)', 'Credit card (automatic)',
+                                          'Electronic check', 'Mailed check']),
+    'MonthlyCharges': 'float32',
+    'TotalCharges': 'string',  # contém espaços em branco; convertido na limpeza
+    'Churn': _SIM_NAO
+}
+
+# Tipos passados ao read_csv: as categóricas são lidas como texto e só depois
+# convertidas por `aplicar_categorias`, que avisa sobre valores fora das
+# categorias declaradas (o read_csv os transformaria em NaN sem aviso)
+DTYPES_LEITURA_CHURN = {col: ('string' if isinstance(tipo, pd.CategoricalDtype) else tipo)
+                        for col, tipo in DTYPES_CHURN.items()}
+
+
+def aplicar_categorias(df, dtypes=None):
+    """
+    Converte as colunas categóricas para as categorias fixas de `DTYPES_CHURN`.
+    
+    Valores fora das categorias declaradas viram NaN (os códigos precisam ser
+    os mesmos em todos os blocos), mas cada ocorrência é informada com a
+    contagem e exemplos dos valores desconhecidos.
+    
+    Retorna:
+    --------
+    DataFrame (o mesmo objeto, com as colunas convertidas)
+    """
+    dtypes = DTYPES_CHURN if dtypes is None else dtypes
+    for col, tipo in dtypes.items():
+        if col not in df.columns or not isinstance(tipo, pd.CategoricalDtype):
+            continue
+        codigos = tipo.categories.get_indexer(df[col])
+        desconhecidos = df[col].notna().to_numpy() & (codigos < 0)
+        if desconhecidos.any():
+            exemplos = list(df.loc[desconhecidos, col].unique()[:5])
+            print(f"⚠️  {col}: {int(desconhecidos.sum())} valor(es) fora das categorias "
+                  f"{list(tipo.categories)} tratados como ausentes: {exemplos}")
+        df[col] = pd.Categorical.from_codes(codigos, dtype=tipo)
+    return df
+
+
+def _limpar_bloco(df, dtype_totais='float64', categorias=False):
+    """
+    Converte TotalCharges para numérico e remove as linhas inválidas.
+    """
+    if categorias:
+        aplicar_categorias(df)
+    df['TotalCharges'] = pd.to_numeric(df['TotalCharges'], errors='coerce').astype(dtype_totais)
+    return df.dropna(subset=['TotalCharges'])
+
+
+def _blocos_limpos(leitor):
+    with leitor:
+        for bloco in leitor:
+            yield _limpar_bloco(bloco, dtype_totais='float32', categorias=True)
+
+
+# Features usadas na modelagem (notebook 02)
+FEATURES_SELECIONADAS = [
+    'tenure', 'MonthlyCharges', 'TotalCharges',
+    'Contract', 'InternetService', 'PaymentMethod',
+    'OnlineSecurity', 'TechSupport', 'PaperlessBilling',
+    'SeniorCitizen'
+]
 
-def carregar_e_limpar_dados(url=None, caminho_csv=None):
+
+def _hash_arquivo(caminho, diretorio_cache):
+    """
+    sha256 do arquivo, reaproveitado enquanto (tamanho, mtime) não mudar.
+    """
+    info = os.stat(caminho)
+    chave = f"{os.path.abspath(caminho)}|{info.st_size}|{info.st_mtime_ns}"
+    caminho_indice = os.path.join(diretorio_cache, 'hashes.json')
+    
+    try:
+        with open(caminho_indice, encoding='utf-8') as f:
+            indice = json.load(f)
+    except (FileNotFoundError, ValueError):
+        indice = {}
+    
+    if chave not in indice:
+        h = hashlib.sha256()
+        with open(caminho, 'rb') as f:
+            for bloco in iter(lambda: f.read(1 << 20), b''):
+                h.update(bloco)
+        indice[chave] = h.hexdigest()
+        with open(caminho_indice, 'w', encoding='utf-8') as f:
+            json.dump(indice, f, indent=1)
+    
+    return indice[chave]
+
+
+def _caminho_cache_parquet(caminho_csv, diretorio_cache=None, tamanho_bloco=500_000):
+    """
+    Retorna o Parquet limpo e tipado do CSV, criando-o na primeira chamada.
+    
+    O arquivo é nomeado pelo hash do CSV, então um CSV novo gera um novo
+    cache. A gravação é feita bloco a bloco (um row group por bloco).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    if diretorio_cache is None:
+        diretorio_cache = os.path.join(os.path.dirname(os.path.abspath(caminho_csv)), '.cache_churn')
+    os.makedirs(diretorio_cache, exist_ok=True)
+    
+    nome = os.path.splitext(os.path.basename(caminho_csv))[0]
+    hash_csv = _hash_arquivo(caminho_csv, diretorio_cache)
+    caminho_cache = os.path.join(diretorio_cache, f"{nome}-{hash_csv[:16]}.parquet")
+    if os.path.exists(caminho_cache):
+        return caminho_cache
+    
+    print(f"🗂️  Criando cache colunar: {caminho_cache}")
+    escritor = None
+    try:
+        leitor = pd.read_csv(caminho_csv, dtype=DTYPES_LEITURA_CHURN, chunksize=tamanho_bloco)
+        for bloco in _blocos_limpos(leitor):
+            tabela = pa.Table.from_pandas(bloco, preserve_index=False)
+            if escritor is None:
+                escritor = pq.ParquetWriter(caminho_cache + '.tmp', tabela.schema)
+            escritor.write_table(tabela)
+    finally:
+        if escritor is not None:
+            escritor.close()
+    os.replace(caminho_cache + '.tmp', caminho_cache)
+    
+    return caminho_cache
+
+
+def _ler_cache_parquet(caminho_cache, colunas=None, tamanho_bloco=None):
+    import pyarrow.parquet as pq
+    
+    if tamanho_bloco is None:
+        return pd.read_parquet(caminho_cache, columns=colunas)
+    
+    arquivo = pq.ParquetFile(caminho_cache)
+    return (lote.to_pandas() for lote in arquivo.iter_batches(batch_size=tamanho_bloco, columns=colunas))
+
+
+def carregar_e_limpar_dados(url=None, caminho_csv=None, tamanho_bloco=None,
+                            usar_cache=False, colunas=None, diretorio_cache=None,
+                            compacto=False):
     """
     Carrega e limpa o dataset de churn.
     
@@ -22,30 +194,136 @@ def carregar_e_limpar_dados(url=None, caminho_csv=None):
         URL para baixar o dataset
     caminho_csv : str, opcional
         Caminho local do CSV
+    tamanho_bloco : int, opcional
+        Se informado, lê o CSV em blocos desse número de linhas com os tipos
+        de `DTYPES_CHURN` (categóricas, float32) e devolve um gerador de
+        blocos já limpos, sem manter o arquivo inteiro em memória
+    usar_cache : bool
+        Se True (apenas com `caminho_csv`), grava na primeira chamada um
+        Parquet limpo e tipado (ver `DTYPES_CHURN`), identificado pelo hash do
+        CSV, e lê dele nas chamadas seguintes. Requer pyarrow.
+    colunas : list, opcional
+        Colunas a carregar (ex.: FEATURES_SELECIONADAS + ['Churn']); com o
+        cache, apenas essas colunas são lidas do disco
+    diretorio_cache : str, opcional
+        Onde guardar o cache (padrão: `.cache_churn/` ao lado do CSV)
+    compacto : bool
+        Se True, aplica `compactar_dataframe` (Sim/Não -> bool, categorias,
+        inteiros pequenos e float32, pelo esquema de `DTYPES_CHURN`) e
+        imprime a economia de memória
     
     Retorna:
     --------
-    DataFrame com dados limpos
+    DataFrame com dados limpos (ou gerador de DataFrames, com `tamanho_bloco`)
     """
     # Definir URL padrão
     if url is None and caminho_csv is None:
         url = "https://raw.githubusercontent.com/IBM/telco-customer-churn-on-icp4d/master/data/Telco-Customer-Churn.csv"
     
+    if compacto:
+        dados = carregar_e_limpar_dados(url, caminho_csv, tamanho_bloco, usar_cache,
+                                        colunas, diretorio_cache)
+        if tamanho_bloco is None:
+            return compactar_dataframe(dados)
+        return (compactar_dataframe(bloco, relatorio=False) for bloco in dados)
+    
+    if usar_cache and caminho_csv:
+        try:
+            caminho_cache = _caminho_cache_parquet(caminho_csv, diretorio_cache)
+            return _ler_cache_parquet(caminho_cache, colunas, tamanho_bloco)
+        except ImportError:
+            print("⚠️  pyarrow não instalado: lendo o CSV sem cache colunar")
+    
+    opcoes = {}
+    if colunas is not None:
+        # TotalCharges é necessária para a limpeza mesmo se não for pedida
+        opcoes['usecols'] = list(dict.fromkeys(list(colunas) + ['TotalCharges']))
+    if tamanho_bloco is not None:
+        opcoes.update({'dtype': DTYPES_LEITURA_CHURN, 'chunksize': tamanho_bloco})
+    
     # Carregar dados
     if caminho_csv:
-        df = pd.read_csv(caminho_csv)
+        df = pd.read_csv(caminho_csv, **opcoes)
     else:
         try:
-            df = pd.read_csv(url)
+            df = pd.read_csv(url, **opcoes)
         except:
             url_alt = "https://raw.githubusercontent.com/marvin-rubia/Churn-Analysis-Prediction/main/WA_Fn-UseC_-Telco-Customer-Churn.csv"
-            df = pd.read_csv(url_alt)
+            df = pd.read_csv(url_alt, **opcoes)
+    
+    if tamanho_bloco is not None:
+        blocos = _blocos_limpos(df)
+        return blocos if colunas is None else (bloco[colunas] for bloco in blocos)
     
     # Limpeza
-    df['TotalCharges'] = pd.to_numeric(df['TotalCharges'], errors='coerce')
-    df_clean = df.dropna(subset=['TotalCharges']).copy()
+    df_clean = _limpar_bloco(df)
+    
+    return df_clean if colunas is None else df_clean[colunas]
+
+
+def compactar_dataframe(df, preservar=('Churn',), dtypes=None, relatorio=True):
+    """
+    Converte o DataFrame para tipos compactos derivados do esquema declarado.
+    
+    O tipo de cada coluna sai do esquema (não dos valores), então blocos
+    compactados separadamente têm os mesmos dtypes da leitura inteira:
+    
+    - categóricas Sim/Não ('No'/'Yes') -> bool (boolean anulável se houver ausentes)
+    - demais categóricas -> category com as categorias fixas do esquema
+    - inteiros (Int8/Int16) -> int8/int16 (Int8/Int16 anuláveis se houver ausentes)
+    - floats (inclusive TotalCharges já convertida) -> float32
+    - textos (ex.: customerID) -> tipo declarado ('string')
+    
+    Colunas fora do esquema só têm floats convertidos para float32.
+    
+    Parâmetros:
+    -----------
+    df : DataFrame
+        Dados limpos (ex.: saída de `carregar_e_limpar_dados`)
+    preservar : tuple
+        Colunas Sim/Não mantidas como category com 'No'/'Yes' (ex.: o target,
+        para continuar compatível com `pos_label='Yes'`)
+    dtypes : dict, opcional
+        Esquema {coluna: tipo} (padrão: `DTYPES_CHURN`)
+    relatorio : bool
+        Se True, imprime a memória antes/depois
     
-    return df_clean
+    Retorna:
+    --------
+    DataFrame compacto; `df.attrs['memoria']` guarda os bytes antes/depois
+    """
+    dtypes = DTYPES_CHURN if dtypes is None else dtypes
+    memoria_antes = int(df.memory_usage(deep=True).sum())
+    df_compacto = aplicar_categorias(df.copy(), dtypes)
+    
+    for col in df_compacto.columns:
+        serie = df_compacto[col]
+        tipo = dtypes.get(col)
+        if isinstance(tipo, pd.CategoricalDtype):
+            if list(tipo.categories) == ['No', 'Yes'] and col not in preservar:
+                codigos = serie.cat.codes.to_numpy()
+                ausentes = codigos < 0
+                df_compacto[col] = (pd.arrays.BooleanArray(codigos == 1, ausentes)
+                                    if ausentes.any() else codigos == 1)
+        elif tipo is not None and pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(tipo)):
+            tipo = pd.api.types.pandas_dtype(tipo)
+            if not serie.isna().any():
+                tipo = getattr(tipo, 'numpy_dtype', tipo)
+            df_compacto[col] = serie.astype(tipo)
+        elif pd.api.types.is_float_dtype(serie):
+            df_compacto[col] = serie.astype('float32')
+        elif tipo is not None:
+            df_compacto[col] = serie.astype(tipo)
+    
+    memoria_depois = int(df_compacto.memory_usage(deep=True).sum())
+    df_compacto.attrs['memoria'] = {'antes': memoria_antes, 'depois': memoria_depois}
+    
+    if relatorio:
+        print(f"📦 Memória: {memoria_antes / 1e6:,.2f} MB -> {memoria_depois / 1e6:,.2f} MB "
+              f"({memoria_antes / max(memoria_depois, 1):.1f}x menor, "
+              f"{memoria_depois / max(len(df), 1):.0f} bytes/cliente)")
+    
+    return df_compacto
 
 
 def preparar_features(df, features_selecionadas=None):
@@ -65,13 +343,9 @@ def preparar_features(df, features_selecionadas=None):
         Features e target preparados
     """
     if features_selecionadas is None:
-        features_selecionadas = [
-            'tenure', 'MonthlyCharges', 'TotalCharges',
-            'Contract', 'InternetService', 'PaymentMethod',
-            'OnlineSecurity', 'TechSupport', 'PaperlessBilling',
-            'SeniorCitizen'
-        ]
+        features_selecionadas = FEATURES_SELECIONADAS
     
+    # Cópia explícita: quem altera X (ex.: imputação) não mexe em df
     X = df[features_selecionadas].copy()
     y = df['Churn'].copy()
     
@@ -96,6 +370,10 @@ def plotar_matriz_confusao(y_true, y_pred, labels=['Não Churn', 'Churn'],
     salvar : str, opcional
         Caminho para salvar o gráfico
     """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from sklearn.metrics import confusion_matrix
+    
     cm = confusion_matrix(y_true, y_pred)
     
     plt.figure(figsize=(10, 8))
@@ -112,7 +390,8 @@ def plotar_matriz_confusao(y_true, y_pred, labels=['Não Churn', 'Churn'],
     plt.show()
 
 
-def calcular_metricas_detalhadas(y_true, y_pred, modelo_nome='Modelo'):
+def calcular_metricas_detalhadas(y_true, y_pred, modelo_nome='Modelo', pos_label='Yes',
+                                 probabilidade=None):
     """
     Calcula e exibe métricas detalhadas do modelo.
     
@@ -124,36 +403,42 @@ def calcular_metricas_detalhadas(y_true, y_pred, modelo_nome='Modelo'):
         Valores preditos
     modelo_nome : str
         Nome do modelo para exibição
+    pos_label : str, int ou bool
+        Valor da classe positiva (churn), ex.: 'Yes', 1 ou True
+    probabilidade : array-like, opcional
+        Probabilidade da classe positiva; se informada, inclui a ROC-AUC
     
     Retorna:
     --------
     dict com métricas
     """
-    from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
-    
-    acc = accuracy_score(y_true, y_pred)
-    prec = precision_score(y_true, y_pred, pos_label='Yes')
-    rec = recall_score(y_true, y_pred, pos_label='Yes')
-    f1 = f1_score(y_true, y_pred, pos_label='Yes')
+    # Matriz de confusão calculada uma vez; todas as métricas saem dela
+    acumulador = AcumuladorMetricas(pos_label).atualizar(y_true, y_pred, probabilidade)
+    metricas = acumulador.metricas()
     
     print(f"{'='*60}")
     print(f"MÉTRICAS - {modelo_nome}")
     print(f"{'='*60}")
-    print(f"Acurácia:  {acc:.2%}")
-    print(f"Precisão:  {prec:.2%}")
-    print(f"Recall:    {rec:.2%}")
-    print(f"F1-Score:  {f1:.2%}")
+    print(f"Acurácia:  {metricas['acuracia']:.2%}")
+    print(f"Precisão:  {metricas['precisao']:.2%}")
+    print(f"Recall:    {metricas['recall']:.2%}")
+    print(f"F1-Score:  {metricas['f1_score']:.2%}")
+    if metricas['roc_auc'] is not None:
+        print(f"ROC-AUC:   {metricas['roc_auc']:.2%}")
     print(f"{'='*60}\n")
     
     print("Classification Report:")
-    print(classification_report(y_true, y_pred, target_names=['Não Churn', 'Churn']))
+    print(acumulador.relatorio_classificacao(target_names=['Não Churn', 'Churn']))
     
-    return {
-        'acuracia': acc,
-        'precisao': prec,
-        'recall': rec,
-        'f1_score': f1
+    resultado = {
+        'acuracia': metricas['acuracia'],
+        'precisao': metricas['precisao'],
+        'recall': metricas['recall'],
+        'f1_score': metricas['f1_score']
     }
+    if metricas['roc_auc'] is not None:
+        resultado['roc_auc'] = metricas['roc_auc']
+    return resultado
 
 
 def comparar_modelos(resultados_dict):
@@ -165,6 +450,8 @@ def comparar_modelos(resultados_dict):
     resultados_dict : dict
         Dicionário com {nome_modelo: {metricas}}
     """
+    import matplotlib.pyplot as plt
+    
     df = pd.DataFrame(resultados_dict).T
     
     fig, axes = plt.subplots(1, 4, figsize=(18, 5))
@@ -202,6 +489,8 @@ def analise_feature_importance(modelo, feature_names, top_n=10, salvar=None):
         print("⚠️  Modelo não suporta feature_importances_")
         return
     
+    import matplotlib.pyplot as plt
+    
     importances = modelo.feature_importances_
     
     df_imp = pd.DataFrame({
@@ -295,59 +584,6 @@ def calcular_roi_retencao(VP, FP, FN, VN, ltv=2000, custo_retencao=300, taxa_suc
     return resultado
 
 
-def salvar_modelo_completo(modelo, feature_columns, scaler=None, 
-                           caminho_modelo='modelo_final.pkl',
-                           caminho_features='feature_columns.pkl',
-                           caminho_scaler='scaler.pkl'):
-    """
-    Salva modelo e artefatos necessários para deploy.
-    
-    Parâmetros:
-    -----------
-    modelo : modelo treinado
-    feature_columns : list
-        Lista de nomes das features
-    scaler : objeto scaler, opcional
-        Normalizador (se usado)
-    caminho_* : str
-        Caminhos para salvar os arquivos
-    """
-    joblib.dump(modelo, caminho_modelo)
-    print(f"✅ Modelo salvo: {caminho_modelo}")
-    
-    joblib.dump(feature_columns, caminho_features)
-    print(f"✅ Features salvas: {caminho_features}")
-    
-    if scaler is not None:
-        joblib.dump(scaler, caminho_scaler)
-        print(f"✅ Scaler salvo: {caminho_scaler}")
-    
-    print("\n📦 Deploy pronto!")
-
-
-def carregar_modelo_completo(caminho_modelo='modelo_final.pkl',
-                             caminho_features='feature_columns.pkl',
-                             caminho_scaler='scaler.pkl'):
-    """
-    Carrega modelo e artefatos para uso.
-    
-    Retorna:
-    --------
-    tuple: (modelo, feature_columns, scaler)
-    """
-    modelo = joblib.load(caminho_modelo)
-    feature_columns = joblib.load(caminho_features)
-    
-    try:
-        scaler = joblib.load(caminho_scaler)
-    except:
-        scaler = None
-    
-    print("✅ Modelo carregado e pronto para uso!")
-    
-    return modelo, feature_columns, scaler
-
-
 # Função de exemplo de uso
 if __name__ == "__main__":
     print("="*60)
@@ -355,6 +591,7 @@ if __name__ == "__main__":
     print("="*60)
     print("\nFunções disponíveis:")
     print("  • carregar_e_limpar_dados()")
+    print("  • compactar_dataframe()")
     print("  • preparar_features()")
     print("  • plotar_matriz_confusao()")
     print("  • calcular_metricas_detalhadas()")
@@ -0,0 +1,274 @@
+"""
+Gráficos de EDA para Bases Grandes
+
+`sns.pairplot` e `sns.scatterplot` desenham todos os pontos; com milhões de
+linhas isso leva minutos e gigabytes. Aqui, acima de `limite_linhas`, os
+gráficos de dispersão mudam automaticamente para:
+
+    'amostra'     amostra estratificada (por `hue`, se informado) de até
+                  `orcamento_pontos` linhas
+    'densidade'   histograma 2-D calculado em NumPy (cada coluna é discretizada
+                  uma vez; cada par é um np.bincount) e desenhado como mapa de
+                  calor
+
+Até `limite_linhas` (modo 'completo'), `pairplot_amostrado` delega ao próprio
+`sns.pairplot`. Os histogramas da diagonal sempre usam todas as linhas.
+
+Uso:
+    grade = pairplot_amostrado(df_important, orcamento_pontos=20_000)
+    grade.fig.suptitle('...')
+    grade.axes[i, j]
+"""
+
+import numpy as np
+import pandas as pd
+
+LIMITE_LINHAS = 50_000
+ORCAMENTO_PONTOS = 20_000
+MODOS = ('auto', 'completo', 'amostra', 'densidade')
+
+
+def _cotas_proporcionais(tamanhos, orcamento):
+    """
+    Divide `orcamento` entre os estratos proporcionalmente ao tamanho (maiores
+    restos), com no mínimo 1 por estrato enquanto o orçamento permitir; a soma
+    nunca passa de `orcamento`.
+    """
+    presentes = tamanhos > 0
+    minimo = presentes.astype(np.int64)
+    if minimo.sum() > orcamento:
+        # Mais estratos que pontos: um ponto para cada um dos maiores
+        cotas = np.zeros_like(minimo)
+        cotas[np.argsort(-tamanhos, kind='stable')[:orcamento]] = 1
+        return cotas
+    exata = (tamanhos - minimo) * (orcamento - minimo.sum()) / max((tamanhos - minimo).sum(), 1)
+    cotas = np.floor(exata).astype(np.int64)
+    sobra = orcamento - minimo.sum() - cotas.sum()
+    cotas[np.argsort(-(exata - cotas), kind='stable')[:sobra]] += 1
+    return np.minimum(cotas + minimo, tamanhos)
+
+
+def amostra_estratificada(df, orcamento=ORCAMENTO_PONTOS, estrato=None, semente=42):
+    """
+    Amostra de até `orcamento` linhas preservando a proporção de cada estrato.
+
+    Parâmetros:
+    -----------
+    df : DataFrame
+    orcamento : int
+        Número máximo de linhas
+    estrato : str, opcional
+        Coluna categórica; cada nível recebe uma fatia proporcional (mínimo 1,
+        se o orçamento permitir)
+    semente : int
+
+    Retorna:
+    --------
+    DataFrame (o próprio df se já couber no orçamento)
+    """
+    if len(df) <= orcamento:
+        return df
+    rng = np.random.default_rng(semente)
+    if estrato is None:
+        return df.iloc[np.sort(rng.choice(len(df), orcamento, replace=False))]
+
+    codigos, _ = pd.factorize(df[estrato])
+    ordem = np.argsort(codigos, kind='stable')
+    tamanhos = np.bincount(codigos + 1)  # posição 0: nulos
+    cotas = _cotas_proporcionais(tamanhos, orcamento)
+
+    selecionados = []
+    for inicio, tamanho, cota in zip(np.cumsum(tamanhos) - tamanhos, tamanhos, cotas):
+        if cota:
+            selecionados.append(ordem[inicio + rng.choice(tamanho, cota, replace=False)])
+    return df.iloc[np.sort(np.concatenate(selecionados))]
+
+
+def escolher_modo(n_linhas, modo='auto', limite_linhas=LIMITE_LINHAS, hue=None):
+    """
+    Resolve o modo 'auto': todos os pontos até `limite_linhas`; acima disso,
+    amostra estratificada se houver `hue` (para manter as cores) ou densidade.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo '{modo}' não suportado. Use: {MODOS}")
+    if modo != 'auto':
+        return modo
+    if n_linhas <= limite_linhas:
+        return 'completo'
+    return 'amostra' if hue is not None else 'densidade'
+
+
+def _discretizar(valores, bins):
+    """
+    Bordas (bins + 1) e índice do bin de cada valor (-1 para nulos e ±inf).
+    """
+    validos = np.isfinite(valores)
+    minimo, maximo = (valores[validos].min(), valores[validos].max()) if validos.any() else (0.0, 1.0)
+    if minimo == maximo:
+        minimo, maximo = minimo - 0.5, maximo + 0.5
+    bordas = np.linspace(minimo, maximo, bins + 1)
+    indices = np.clip(((valores - minimo) / (maximo - minimo) * bins), 0, bins - 1)
+    return bordas, np.where(validos, np.nan_to_num(indices), -1).astype(np.int64)
+
+
+def _desenhar_densidade(ax, discreto_x, discreto_y, bins):
+    """
+    Histograma 2-D (np.bincount sobre os índices já discretizados) em escala log.
+    """
+    from matplotlib.colors import LogNorm
+
+    (bordas_x, ix), (bordas_y, iy) = discreto_x, discreto_y
+    validos = (ix >= 0) & (iy >= 0)
+    grade = np.bincount(iy[validos] * bins + ix[validos], minlength=bins ** 2).reshape(bins, bins)
+    grade = np.ma.masked_equal(grade, 0)
+    norma = LogNorm(vmin=1, vmax=max(grade.max(), 2)) if grade.count() else None
+    return ax.pcolormesh(bordas_x, bordas_y, grade, norm=norma, cmap='viridis')
+
+
+class GradePares:
+    """
+    Resultado de `pairplot_amostrado` (mesmos atributos usados de um PairGrid).
+
+    Atributos:
+    ----------
+    fig : Figure
+    axes : np.ndarray de Axes (k x k)
+    diag_axes : list de Axes
+        Eixos dos histogramas da diagonal (no modo 'completo', os eixos
+        gêmeos criados pelo seaborn)
+    modo : str
+        Modo efetivamente usado nos gráficos fora da diagonal
+    n_pontos : int
+        Linhas desenhadas em cada dispersão (ou agregadas, no modo densidade)
+    """
+
+    def __init__(self, fig, axes, modo, n_pontos, diag_axes=None):
+        self.fig = fig
+        self.axes = axes
+        self.diag_axes = list(np.diag(axes)) if diag_axes is None else list(diag_axes)
+        self.modo = modo
+        self.n_pontos = n_pontos
+
+
+def _pairplot_completo(df, variaveis, hue, bins, plot_kws, diag_kws, altura):
+    """
+    Modo 'completo': o `sns.pairplot` original, com ±inf tratados como ausentes.
+    """
+    import seaborn as sns
+
+    dados = df[variaveis + ([hue] if hue else [])].copy()
+    dados[variaveis] = dados[variaveis].apply(pd.to_numeric, errors='coerce').replace([np.inf, -np.inf], np.nan)
+    grade = sns.pairplot(dados, vars=variaveis, hue=hue, diag_kind='hist', height=altura,
+                         plot_kws=plot_kws, diag_kws={'bins': bins, **diag_kws})
+    return GradePares(grade.figure, grade.axes, 'completo', len(df), grade.diag_axes)
+
+
+def pairplot_amostrado(df, variaveis=None, hue=None, modo='auto', limite_linhas=LIMITE_LINHAS,
+                       orcamento_pontos=ORCAMENTO_PONTOS, bins=30, bins_densidade=60,
+                       plot_kws=None, diag_kws=None, altura=2.5, semente=42):
+    """
+    Pair plot que escala para milhões de linhas.
+
+    Parâmetros:
+    -----------
+    df : DataFrame
+    variaveis : list, opcional
+        Colunas numéricas (padrão: todas as numéricas, exceto `hue`)
+    hue : str, opcional
+        Coluna categórica para cores e estratificação da amostra
+    modo : str
+        'auto', 'completo' (`sns.pairplot` com todos os pontos), 'amostra'
+        ou 'densidade'
+    limite_linhas : int
+        Acima deste número de linhas, 'auto' deixa de desenhar todos os pontos
+    orcamento_pontos : int
+        Pontos por dispersão no modo 'amostra'
+    bins : int
+        Bins dos histogramas da diagonal
+    bins_densidade : int
+        Bins por eixo no modo 'densidade'
+    plot_kws, diag_kws : dict, opcional
+        Repassados a `ax.scatter` e `ax.bar` (ex.: alpha, s); no modo
+        'completo', aos gráficos de dispersão e histogramas do seaborn
+    altura : float
+        Tamanho (polegadas) de cada painel
+    semente : int
+
+    Retorna:
+    --------
+    GradePares
+    """
+    import matplotlib.pyplot as plt
+
+    if variaveis is None:
+        variaveis = [c for c in df.select_dtypes(include=[np.number]).columns if c != hue]
+    variaveis = list(variaveis)
+    plot_kws = dict(plot_kws or {})
+    diag_kws = dict(diag_kws or {})
+    bins = diag_kws.pop('bins', bins)
+    k = len(variaveis)
+
+    modo = escolher_modo(len(df), modo, limite_linhas, hue)
+    if modo == 'completo':
+        return _pairplot_completo(df, variaveis, hue, bins, plot_kws, diag_kws, altura)
+
+    valores = {c: pd.to_numeric(df[c], errors='coerce').to_numpy(dtype=np.float64) for c in variaveis}
+
+    fig, axes = plt.subplots(k, k, figsize=(altura * k, altura * k), squeeze=False)
+
+    # Diagonal: histogramas com todas as linhas
+    for i, c in enumerate(variaveis):
+        bordas, indices = _discretizar(valores[c], bins)
+        contagens = np.bincount(indices[indices >= 0], minlength=bins)
+        axes[i, i].bar(bordas[:-1], contagens, width=np.diff(bordas), align='edge', **diag_kws)
+
+    if modo == 'densidade':
+        discretos = {c: _discretizar(valores[c], bins_densidade) for c in variaveis}
+        for i, cy in enumerate(variaveis):
+            for j, cx in enumerate(variaveis):
+                if i != j:
+                    _desenhar_densidade(axes[i, j], discretos[cx], discretos[cy], bins_densidade)
+        n_pontos = len(df)
+    else:
+        amostra = amostra_estratificada(df[variaveis + ([hue] if hue else [])], orcamento_pontos, hue, semente)
+        grupos = [(None, amostra)] if hue is None else list(amostra.groupby(hue, sort=False))
+        for i, cy in enumerate(variaveis):
+            for j, cx in enumerate(variaveis):
+                if i == j:
+                    continue
+                for nivel, grupo in grupos:
+                    axes[i, j].scatter(grupo[cx], grupo[cy], label=None if nivel is None else str(nivel),
+                                       **plot_kws)
+        n_pontos = len(amostra)
+        if hue is not None and k > 1:
+            axes[0, 1].legend(title=hue, fontsize=8)
+
+    for i, c in enumerate(variaveis):
+        axes[-1, i].set_xlabel(c)
+        axes[i, 0].set_ylabel(c)
+    fig.tight_layout()
+    return GradePares(fig, axes, modo, n_pontos)
+
+
+def dispersao_amostrada(ax, x, y, modo='auto', limite_linhas=LIMITE_LINHAS,
+                        orcamento_pontos=ORCAMENTO_PONTOS, bins_densidade=80, semente=42, **kwargs):
+    """
+    Gráfico de dispersão de x vs y em `ax` com a mesma troca automática de
+    `pairplot_amostrado` (todos os pontos, amostra ou densidade).
+
+    Retorna:
+    --------
+    str : modo usado
+    """
+    dados = pd.DataFrame({'x': np.asarray(x, dtype=np.float64), 'y': np.asarray(y, dtype=np.float64)})
+    modo = escolher_modo(len(dados), modo, limite_linhas)
+
+    if modo == 'densidade':
+        malha = _desenhar_densidade(ax, _discretizar(dados['x'].to_numpy(), bins_densidade),
+                                    _discretizar(dados['y'].to_numpy(), bins_densidade), bins_densidade)
+        ax.figure.colorbar(malha, ax=ax, label='Contagem')
+    else:
+        if modo == 'amostra':
+            dados = amostra_estratificada(dados, orcamento_pontos, semente=semente)
+        ax.scatter(dados['x'], dados['y'], **kwargs)
+    return modo
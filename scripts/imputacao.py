@@ -0,0 +1,241 @@
+"""
+Imputação com Sketches
+
+`ImputadorAproximado` aprende os valores de preenchimento (mediana das
+colunas numéricas, moda das demais) em fluxo, bloco a bloco, com sketches de
+memória limitada (`sketches.py`) em vez de `df[col].median()` / `mode()` sobre
+o DataFrame inteiro. Depois de ajustado, é salvo como artefato e aplicado
+bloco a bloco.
+
+Uso:
+    imputador = ImputadorAproximado().ajustar(pd.read_csv(caminho, chunksize=500_000))
+    imputador.salvar('imputador.pkl')
+    for bloco in imputador.transformar_em_fluxo(pd.read_csv(caminho, chunksize=500_000)):
+        ...
+"""
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from sketches import ContadorFrequentes, SketchQuantis
+
+
+class ImputadorAproximado:
+    """
+    Imputador de mediana/moda ajustado em fluxo.
+
+    A estratégia de cada coluna vem, nesta ordem, de `estrategias`, do tipo
+    declarado em `dtypes` ou do primeiro bloco com valores na coluna. Uma
+    estratégia inferida como 'mediana' é revista para 'moda' se um bloco
+    posterior trouxer valores não numéricos; para isso as colunas inferidas
+    também alimentam um `ContadorFrequentes` (memória limitada).
+
+    Parâmetros:
+    -----------
+    estrategias : dict, opcional
+        {coluna: 'mediana' | 'media' | 'moda'}; colunas omitidas usam
+        'mediana' se numéricas e 'moda' caso contrário
+    colunas : list, opcional
+        Colunas a imputar (padrão: todas)
+    k_quantis, capacidade_frequentes : int
+        Precisão dos sketches
+    dtypes : dict, opcional
+        Esquema declarado {coluna: tipo} (ex.: `DTYPES_CHURN` com
+        TotalCharges já numérica); evita inferir a estratégia pelos dados
+
+    Atributos:
+    ----------
+    valores : dict
+        {coluna: valor de preenchimento}, disponível após `finalizar`/`ajustar`
+    """
+
+    def __init__(self, estrategias=None, colunas=None, k_quantis=1000, capacidade_frequentes=100,
+                 dtypes=None):
+        self.estrategias = dict(estrategias or {})
+        self.colunas = list(colunas) if colunas is not None else None
+        self.k_quantis = k_quantis
+        self.capacidade_frequentes = capacidade_frequentes
+        self.dtypes = dict(dtypes or {})
+        self.valores = {}
+        self.contagens = {}
+        self._sketches = {}
+        self._somas = {}
+        self._inferidas = set()
+        self._frequencias_inferidas = {}
+        self._sem_valores = set()
+
+    def _estrategia(self, col, serie):
+        if col in self.estrategias:
+            return self.estrategias[col]
+        if col in self.dtypes:
+            tipo = pd.api.types.pandas_dtype(self.dtypes[col])
+        elif serie.notna().any():
+            tipo = serie.dtype
+            self._inferidas.add(col)
+        else:
+            self._sem_valores.add(col)  # sem valores até aqui: decide no próximo bloco
+            return None
+        self._sem_valores.discard(col)
+        numerica = pd.api.types.is_numeric_dtype(tipo) and not pd.api.types.is_bool_dtype(tipo)
+        self.estrategias[col] = 'mediana' if numerica else 'moda'
+        return self.estrategias[col]
+
+    def _frequencias(self, col):
+        """
+        Contagens de valores de `col`: o sketch da moda ou, para uma coluna
+        numérica inferida, o contador mantido em paralelo.
+        """
+        contagens = (self._sketches if self.estrategias.get(col) == 'moda' else self._frequencias_inferidas).get(col)
+        return contagens if contagens is not None else ContadorFrequentes(self.capacidade_frequentes)
+
+    def _mudar_para_moda(self, col, frequencias):
+        self.estrategias[col] = 'moda'
+        self._sketches[col] = frequencias
+        self._somas.pop(col, None)
+        self._frequencias_inferidas.pop(col, None)
+        self._inferidas.discard(col)
+
+    def ajustar_parcial(self, bloco):
+        """
+        Acumula um bloco nos sketches.
+        """
+        for col in (self.colunas or bloco.columns):
+            serie = bloco[col]
+            estrategia = self._estrategia(col, serie)
+            if estrategia is None:
+                continue
+            validos = serie.dropna()
+            if estrategia == 'moda':
+                sketch = self._sketches.setdefault(col, ContadorFrequentes(self.capacidade_frequentes))
+                sketch.atualizar(validos)
+                continue
+
+            numeros = pd.to_numeric(validos, errors='coerce')
+            if col in self._inferidas:
+                frequencias = self._frequencias(col).atualizar(validos)
+                if numeros.isna().any():
+                    exemplos = list(pd.unique(validos[numeros.isna()])[:5])
+                    print(f"⚠️  Coluna '{col}': valores não numéricos em um bloco posterior "
+                          f"({exemplos}); estratégia revista de {estrategia} para moda")
+                    self._mudar_para_moda(col, frequencias)
+                    continue
+                self._frequencias_inferidas[col] = frequencias
+
+            valores = numeros.to_numpy(dtype=np.float64)
+            if estrategia == 'mediana':
+                self._sketches.setdefault(col, SketchQuantis(self.k_quantis)).atualizar(valores)
+            soma, n = self._somas.get(col, (0.0, 0))
+            self._somas[col] = (soma + np.nansum(valores), n + int(np.count_nonzero(~np.isnan(valores))))
+        return self
+
+    def mesclar(self, outro):
+        """
+        Soma os sketches de outro imputador (ex.: ajustado em outro processo).
+        """
+        for col, dele in outro.estrategias.items():
+            minha = self.estrategias.get(col)
+            if minha is not None and minha != dele and 'moda' in (minha, dele):
+                # Um dos lados viu valores não numéricos: o outro contribui com suas contagens
+                self._mudar_para_moda(col, self._frequencias(col).mesclar(outro._frequencias(col)))
+                continue
+            if minha is None:
+                self.estrategias[col] = dele
+                if col in outro._inferidas:
+                    self._inferidas.add(col)
+            elif col not in outro._inferidas:
+                self._inferidas.discard(col)
+            if col in outro._sketches:
+                if col in self._sketches:
+                    self._sketches[col].mesclar(outro._sketches[col])
+                else:
+                    self._sketches[col] = outro._sketches[col]
+            if col in outro._somas:
+                soma_atual, n_atual = self._somas.get(col, (0.0, 0))
+                soma, n = outro._somas[col]
+                self._somas[col] = (soma_atual + soma, n_atual + n)
+            if col in self._inferidas and col in outro._frequencias_inferidas:
+                self._frequencias_inferidas[col] = self._frequencias(col).mesclar(
+                    outro._frequencias_inferidas[col])
+        self._sem_valores = (self._sem_valores | outro._sem_valores) - set(self.estrategias)
+        return self
+
+    def finalizar(self):
+        """
+        Converte os sketches nos valores de preenchimento.
+        """
+        for col in self._sem_valores:  # colunas sempre nulas: nada a preencher
+            self.valores[col], self.contagens[col] = np.nan, 0
+        for col, estrategia in self.estrategias.items():
+            if estrategia == 'moda':
+                sketch = self._sketches.get(col)
+                self.valores[col] = sketch.moda() if sketch is not None else None
+                self.contagens[col] = sketch.n if sketch is not None else 0
+            elif estrategia == 'mediana':
+                sketch = self._sketches.get(col)
+                self.valores[col] = float(sketch.mediana()) if sketch is not None and sketch.n else np.nan
+                self.contagens[col] = sketch.n if sketch is not None else 0
+            else:
+                soma, n = self._somas.get(col, (0.0, 0))
+                self.valores[col] = soma / n if n else np.nan
+                self.contagens[col] = n
+        return self
+
+    def ajustar(self, dados):
+        """
+        Ajusta em um DataFrame ou em um iterável de blocos (ex.: leitor de
+        `pd.read_csv(..., chunksize=...)`).
+
+        Retorna:
+        --------
+        self
+        """
+        blocos = [dados] if isinstance(dados, pd.DataFrame) else dados
+        for bloco in blocos:
+            self.ajustar_parcial(bloco)
+        return self.finalizar()
+
+    def transformar(self, bloco, relatorio=False):
+        """
+        Preenche os valores ausentes de um bloco (retorna uma cópia).
+        """
+        valores = {col: valor for col, valor in self.valores.items()
+                   if col in bloco.columns and valor is not None and not pd.isna(valor)}
+        if relatorio:
+            nulos = bloco[list(valores)].isna().sum()
+            for col, n in nulos[nulos > 0].items():
+                print(f"Coluna '{col}' preenchida com {self.estrategias[col]}: {valores[col]} ({n} valores)")
+        return bloco.fillna(valores)
+
+    def transformar_em_fluxo(self, blocos):
+        """
+        Gerador que aplica `transformar` a cada bloco.
+        """
+        for bloco in blocos:
+            yield self.transformar(bloco)
+
+    def para_dict(self):
+        """
+        Exporta o imputador ajustado (valores e estratégias) como dict simples.
+        """
+        return {
+            'estrategias': dict(self.estrategias),
+            'valores': {col: (valor.item() if isinstance(valor, np.generic) else valor)
+                        for col, valor in self.valores.items()},
+            'contagens': dict(self.contagens)
+        }
+
+    @classmethod
+    def de_dict(cls, dados):
+        imputador = cls(estrategias=dados['estrategias'])
+        imputador.valores = dict(dados['valores'])
+        imputador.contagens = dict(dados.get('contagens', {}))
+        return imputador
+
+    def salvar(self, caminho='imputador.pkl'):
+        joblib.dump(self.para_dict(), caminho)
+        print(f"✅ Imputador salvo: {caminho}")
+
+    @classmethod
+    def carregar(cls, caminho='imputador.pkl'):
+        return cls.de_dict(joblib.load(caminho))
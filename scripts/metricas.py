@@ -0,0 +1,235 @@
+"""
+Métricas de Classificação Incrementais
+
+`AcumuladorMetricas` guarda apenas a matriz de confusão e dois histogramas de
+probabilidade (positivos/negativos). Lotes podem ser acumulados em fluxo e
+acumuladores de processos diferentes podem ser somados, então a avaliação de
+um arquivo de scores com bilhões de linhas não mantém y_true/y_pred em memória.
+
+Acurácia, precisão, recall e F1 saem da matriz de confusão; a ROC-AUC sai dos
+histogramas (exata quando as probabilidades caem em faixas distintas; erro
+limitado aos pares dentro da mesma faixa).
+
+Uso:
+    acumulador = AcumuladorMetricas()
+    for bloco in blocos:
+        acumulador.atualizar(bloco['Churn'], bloco['classe'], bloco['probabilidade'])
+    acumulador.metricas()
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class AcumuladorMetricas:
+    """
+    Matriz de confusão e histogramas de score mescláveis.
+
+    Parâmetros:
+    -----------
+    pos_label : str, int ou bool
+        Valor que indica a classe positiva (churn) em y_true/y_pred
+    n_faixas : int
+        Número de faixas do histograma de probabilidades (ROC-AUC)
+    limiar : float
+        Limiar para derivar y_pred quando apenas a probabilidade é informada
+
+    Atributos:
+    ----------
+    vp, fp, fn, vn : int
+        Contagens da matriz de confusão
+    hist_positivos, hist_negativos : np.ndarray
+        Contagem de probabilidades por faixa, para cada classe real
+    """
+
+    def __init__(self, pos_label='Yes', n_faixas=1000, limiar=0.5):
+        self.pos_label = pos_label
+        self.n_faixas = n_faixas
+        self.limiar = limiar
+        self.vp = self.fp = self.fn = self.vn = 0
+        self.hist_positivos = np.zeros(n_faixas, dtype=np.int64)
+        self.hist_negativos = np.zeros(n_faixas, dtype=np.int64)
+
+    @staticmethod
+    def _tipo_rotulo(rotulo):
+        if isinstance(rotulo, (bool, np.bool_)):
+            return 'bool'
+        return 'texto' if isinstance(rotulo, str) else 'numero'
+
+    def _verificar_pos_label(self, y_true, y_pred):
+        # pos_label ausente do lote é erro quando há dois ou mais rótulos (regra
+        # do scikit-learn) ou quando os rótulos são de outro tipo (ex.: 0/1 ou
+        # True/False com o padrão 'Yes'); um lote só com negativos ('No') é válido
+        rotulos = set(pd.unique(y_true.ravel()))
+        if y_pred is not None:
+            rotulos |= set(pd.unique(y_pred.ravel()))
+        if not rotulos or self.pos_label in rotulos:
+            return
+        outro_tipo = self._tipo_rotulo(self.pos_label) not in {self._tipo_rotulo(r) for r in rotulos}
+        if len(rotulos) >= 2 or outro_tipo:
+            raise ValueError(f"pos_label={self.pos_label!r} não está entre os rótulos "
+                             f"{sorted(rotulos, key=str)}")
+
+    def atualizar(self, y_true, y_pred=None, probabilidade=None):
+        """
+        Acumula um lote.
+
+        Parâmetros:
+        -----------
+        y_true : array-like
+            Classes reais do lote
+        y_pred : array-like, opcional
+            Classes preditas (padrão: probabilidade >= limiar)
+        probabilidade : array-like, opcional
+            Probabilidade da classe positiva (necessária para a ROC-AUC)
+
+        Retorna:
+        --------
+        self
+        """
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred) if y_pred is not None else None
+        self._verificar_pos_label(y_true, y_pred)
+
+        real = y_true == self.pos_label
+        if y_pred is not None:
+            previsto = y_pred == self.pos_label
+        elif probabilidade is not None:
+            previsto = np.asarray(probabilidade, dtype=np.float64) >= self.limiar
+        else:
+            raise ValueError("Informe y_pred ou probabilidade.")
+
+        # Uma contagem só: código 0..3 = 2*real + previsto
+        contagens = np.bincount(2 * real.astype(np.int64) + previsto, minlength=4)
+        self.vn += int(contagens[0])
+        self.fp += int(contagens[1])
+        self.fn += int(contagens[2])
+        self.vp += int(contagens[3])
+
+        if probabilidade is not None:
+            faixa = np.clip((np.asarray(probabilidade, dtype=np.float64) * self.n_faixas).astype(np.int64),
+                            0, self.n_faixas - 1)
+            self.hist_positivos += np.bincount(faixa[real], minlength=self.n_faixas)
+            self.hist_negativos += np.bincount(faixa[~real], minlength=self.n_faixas)
+
+        return self
+
+    def mesclar(self, outro):
+        """
+        Soma as contagens de outro acumulador (ex.: de outro processo).
+        """
+        if outro.n_faixas != self.n_faixas or outro.pos_label != self.pos_label:
+            raise ValueError("Acumuladores com pos_label ou n_faixas diferentes.")
+        self.vp += outro.vp
+        self.fp += outro.fp
+        self.fn += outro.fn
+        self.vn += outro.vn
+        self.hist_positivos += outro.hist_positivos
+        self.hist_negativos += outro.hist_negativos
+        return self
+
+    def __add__(self, outro):
+        soma = AcumuladorMetricas(self.pos_label, self.n_faixas, self.limiar)
+        return soma.mesclar(self).mesclar(outro)
+
+    @property
+    def total(self):
+        return self.vp + self.fp + self.fn + self.vn
+
+    def matriz_confusao(self):
+        """
+        Matriz 2x2 no formato do scikit-learn: [[VN, FP], [FN, VP]].
+        """
+        return np.array([[self.vn, self.fp], [self.fn, self.vp]], dtype=np.int64)
+
+    def roc_auc(self):
+        """
+        ROC-AUC a partir dos histogramas (None se não houver probabilidades
+        ou se faltar uma das classes).
+        """
+        n_pos = self.hist_positivos.sum()
+        n_neg = self.hist_negativos.sum()
+        if n_pos == 0 or n_neg == 0:
+            return None
+        # P(score_pos > score_neg) + 0.5 * P(mesma faixa)
+        negativos_abaixo = np.cumsum(self.hist_negativos) - self.hist_negativos
+        pares = (self.hist_positivos * (negativos_abaixo + 0.5 * self.hist_negativos)).sum()
+        return float(pares / (n_pos * n_neg))
+
+    @staticmethod
+    def _prf(vp, fp, fn):
+        precisao = vp / (vp + fp) if vp + fp else 0.0
+        recall = vp / (vp + fn) if vp + fn else 0.0
+        f1 = 2 * precisao * recall / (precisao + recall) if precisao + recall else 0.0
+        return precisao, recall, f1
+
+    def metricas(self):
+        """
+        Retorna:
+        --------
+        dict com 'acuracia', 'precisao', 'recall', 'f1_score' (classe positiva)
+        e 'roc_auc' (None sem probabilidades)
+        """
+        precisao, recall, f1 = self._prf(self.vp, self.fp, self.fn)
+        return {
+            'acuracia': (self.vp + self.vn) / self.total if self.total else 0.0,
+            'precisao': precisao,
+            'recall': recall,
+            'f1_score': f1,
+            'roc_auc': self.roc_auc()
+        }
+
+    def relatorio_classificacao(self, target_names=('Não Churn', 'Churn'), digitos=2):
+        """
+        Texto no formato de `sklearn.metrics.classification_report`, a partir
+        da matriz de confusão.
+        """
+        linhas_classe = [
+            (target_names[0], *self._prf(self.vn, self.fn, self.fp), self.vn + self.fp),
+            (target_names[1], *self._prf(self.vp, self.fp, self.fn), self.vp + self.fn)
+        ]
+        suporte = self.total
+        macro = [np.mean([linha[i] for linha in linhas_classe]) for i in (1, 2, 3)]
+        ponderada = [sum(linha[i] * linha[4] for linha in linhas_classe) / max(suporte, 1)
+                     for i in (1, 2, 3)]
+        acuracia = (self.vp + self.vn) / suporte if suporte else 0.0
+
+        largura = max(len('weighted avg'), *(len(nome) for nome in target_names), digitos)
+        cabecalho = ['precision', 'recall', 'f1-score', 'support']
+        texto = ' ' * (largura + 1) + ''.join(f' {h:>9}' for h in cabecalho) + '\n\n'
+        for nome, p, r, f, s in linhas_classe:
+            texto += f"{nome:>{largura}}  {p:>9.{digitos}f} {r:>9.{digitos}f} {f:>9.{digitos}f} {s:>9}\n"
+        texto += '\n'
+        texto += f"{'accuracy':>{largura}}  {'':>9} {'':>9} {acuracia:>9.{digitos}f} {suporte:>9}\n"
+        for nome, valores in (('macro avg', macro), ('weighted avg', ponderada)):
+            p, r, f = valores
+            texto += f"{nome:>{largura}}  {p:>9.{digitos}f} {r:>9.{digitos}f} {f:>9.{digitos}f} {suporte:>9}\n"
+        return texto
+
+
+def metricas_em_fluxo(blocos, coluna_real='Churn', coluna_predita='classe',
+                      coluna_probabilidade='probabilidade', pos_label='Yes'):
+    """
+    Acumula métricas sobre uma sequência de DataFrames de scores.
+
+    Parâmetros:
+    -----------
+    blocos : iterável de DataFrames
+        Cada bloco com a classe real e as colunas de `pontuar_lote`
+    coluna_real, coluna_predita, coluna_probabilidade : str
+        Nomes das colunas (coluna_predita/coluna_probabilidade podem faltar)
+    pos_label : str, int ou bool
+        Valor da classe positiva
+
+    Retorna:
+    --------
+    AcumuladorMetricas
+    """
+    acumulador = AcumuladorMetricas(pos_label)
+    for bloco in blocos:
+        acumulador.atualizar(
+            bloco[coluna_real],
+            bloco[coluna_predita] if coluna_predita in bloco.columns else None,
+            bloco[coluna_probabilidade] if coluna_probabilidade in bloco.columns else None
+        )
+    return acumulador
@@ -0,0 +1,350 @@
+"""
+Perfil Exploratório em Uma Passada
+
+Substitui `df.info()`, `df.describe()`, `df.isnull().sum()`,
+`df.duplicated().sum()` e `value_counts` (cada um uma varredura completa) por
+uma única passada em blocos. Cada bloco gera um `PerfilDados` parcial, e os
+parciais são mesclados: contagens, nulos, mínimo/máximo, média/variância
+(fórmula de Chan), quantis (KLL), categorias mais frequentes (Misra-Gries),
+distintos (HyperLogLog) e as linhas duplicadas pelo hash de 64 bits de cada
+linha: contagem exata enquanto os hashes distintos cabem em
+`limite_hashes_exatos`, estimativa HyperLogLog (memória fixa) depois disso.
+
+Uso:
+    perfil = perfilar('extrato.csv', tamanho_bloco=200_000, n_processos=4)
+    perfil.relatorio()
+    perfil.resumo()
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from sketches import ContadorFrequentes, EstimadorDistintos, SketchQuantis
+
+
+# Hash dos nulos em `_hash_linhas` (qualquer constante fixa serve)
+_HASH_NULO = np.uint64(0x9E3779B97F4A7C15)
+_MULTIPLICADOR_HASH = np.uint64(0x100000001B3)
+
+
+def _hash_linhas(bloco):
+    """
+    Hash de 64 bits de cada linha sobre um esquema fixo: números (inteiros,
+    anuláveis, bool) como float64, demais valores como texto e nulos como uma
+    constante. Assim a mesma linha tem o mesmo hash quando um bloco lê a
+    coluna como int e outro como float (por causa de um NaN).
+    """
+    hashes = np.zeros(len(bloco), dtype=np.uint64)
+    for col in bloco.columns:
+        serie = bloco[col]
+        if pd.api.types.is_numeric_dtype(serie) or pd.api.types.is_bool_dtype(serie):
+            h = pd.util.hash_array(serie.to_numpy(dtype=np.float64, na_value=0.0))
+        else:
+            h = pd.util.hash_array(serie.astype(str).to_numpy(dtype=object))
+        h[serie.isna().to_numpy()] = _HASH_NULO
+        hashes = (hashes ^ h) * _MULTIPLICADOR_HASH
+    return hashes
+
+
+class PerfilColuna:
+    """
+    Estatísticas mescláveis de uma coluna.
+
+    Atributos:
+    ----------
+    numerica : bool
+    dtypes : set
+        Tipos vistos nos blocos
+    n, nulos : int
+    minimo, maximo, media, m2 : float
+        Apenas colunas numéricas (m2 = soma dos quadrados dos desvios)
+    quantis : SketchQuantis (numéricas)
+    frequentes : ContadorFrequentes (não numéricas)
+    distintos : EstimadorDistintos
+    """
+
+    def __init__(self, numerica, k_quantis=1000, capacidade_frequentes=100):
+        self.numerica = numerica
+        self.dtypes = set()
+        self.n = 0
+        self.nulos = 0
+        self.minimo = np.inf
+        self.maximo = -np.inf
+        self.media = 0.0
+        self.m2 = 0.0
+        self.quantis = SketchQuantis(k_quantis) if numerica else None
+        self.frequentes = None if numerica else ContadorFrequentes(capacidade_frequentes)
+        self.distintos = EstimadorDistintos()
+
+    def atualizar(self, serie):
+        self.dtypes.add(str(serie.dtype))
+        nulos = serie.isna()
+        self.nulos += int(nulos.sum())
+        validos = serie[~nulos]
+        self.distintos.atualizar(validos)
+
+        if not self.numerica:
+            self.n += len(validos)
+            self.frequentes.atualizar(validos)
+            return self
+
+        valores = pd.to_numeric(validos, errors='coerce').to_numpy(dtype=np.float64)
+        if valores.size == 0:
+            return self
+        parcial = PerfilColuna(True, self.quantis.k)
+        parcial.n = valores.size
+        parcial.minimo = valores.min()
+        parcial.maximo = valores.max()
+        parcial.media = valores.mean()
+        parcial.m2 = float(((valores - parcial.media) ** 2).sum())
+        self._mesclar_momentos(parcial)
+        self.quantis.atualizar(valores)
+        return self
+
+    def _mesclar_momentos(self, outro):
+        n = self.n + outro.n
+        if n == 0:
+            return
+        delta = outro.media - self.media
+        self.media += delta * outro.n / n
+        self.m2 += outro.m2 + delta ** 2 * self.n * outro.n / n
+        self.n = n
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+
+    def mesclar(self, outro):
+        self.dtypes |= outro.dtypes
+        self.nulos += outro.nulos
+        self.distintos.mesclar(outro.distintos)
+        if self.numerica:
+            self._mesclar_momentos(outro)
+            self.quantis.mesclar(outro.quantis)
+        else:
+            self.n += outro.n
+            self.frequentes.mesclar(outro.frequentes)
+        return self
+
+    @property
+    def desvio_padrao(self):
+        # ddof=1, como em df.describe()
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else np.nan
+
+
+class PerfilDados:
+    """
+    Perfil mesclável de um conjunto de dados.
+
+    Parâmetros:
+    -----------
+    k_quantis : int
+        Precisão dos sketches de quantis
+    capacidade_frequentes : int
+        Valores acompanhados por coluna categórica
+    limite_hashes_exatos : int
+        Hashes de linha distintos guardados para a contagem exata de
+        duplicatas (8 bytes cada); acima disso, a contagem passa a ser
+        estimada pelo HyperLogLog
+    """
+
+    def __init__(self, k_quantis=1000, capacidade_frequentes=100, limite_hashes_exatos=2_000_000):
+        self.k_quantis = k_quantis
+        self.capacidade_frequentes = capacidade_frequentes
+        self.limite_hashes_exatos = limite_hashes_exatos
+        self.linhas = 0
+        self.memoria = 0
+        self.colunas = {}
+        self._distintos_linhas = EstimadorDistintos(p=16)
+        self._hashes_linhas = []  # None depois de passar do limite
+
+    @classmethod
+    def de_bloco(cls, bloco, **kwargs):
+        """
+        Perfil de um único DataFrame (unidade de trabalho dos processos).
+        """
+        return cls(**kwargs).atualizar(bloco)
+
+    def atualizar(self, bloco):
+        """
+        Acrescenta um bloco (DataFrame) ao perfil.
+        """
+        self.linhas += len(bloco)
+        self.memoria += int(bloco.memory_usage(deep=True).sum())
+        for col in bloco.columns:
+            if col not in self.colunas:
+                numerica = (pd.api.types.is_numeric_dtype(bloco[col])
+                            and not pd.api.types.is_bool_dtype(bloco[col]))
+                self.colunas[col] = PerfilColuna(numerica, self.k_quantis, self.capacidade_frequentes)
+            self.colunas[col].atualizar(bloco[col])
+        hashes = _hash_linhas(bloco)
+        self._distintos_linhas.atualizar_hashes(hashes)
+        if self._hashes_linhas is not None:
+            # Hashes distintos do bloco; as duplicatas entre blocos saem na união
+            self._hashes_linhas.append(np.unique(hashes))
+            self._limitar_hashes()
+        return self
+
+    def _limitar_hashes(self):
+        if sum(h.size for h in self._hashes_linhas) <= self.limite_hashes_exatos:
+            return
+        unicos = np.unique(np.concatenate(self._hashes_linhas))
+        self._hashes_linhas = [unicos] if unicos.size <= self.limite_hashes_exatos else None
+
+    def mesclar(self, outro):
+        self.linhas += outro.linhas
+        self.memoria += outro.memoria
+        for col, perfil in outro.colunas.items():
+            if col in self.colunas:
+                self.colunas[col].mesclar(perfil)
+            else:
+                self.colunas[col] = perfil
+        self._distintos_linhas.mesclar(outro._distintos_linhas)
+        if self._hashes_linhas is not None and outro._hashes_linhas is not None:
+            self._hashes_linhas.extend(outro._hashes_linhas)
+            self._limitar_hashes()
+        else:
+            self._hashes_linhas = None
+        return self
+
+    @property
+    def duplicatas_exatas(self):
+        """
+        True enquanto `duplicatas` é exata (hashes dentro do limite).
+        """
+        return self._hashes_linhas is not None
+
+    @property
+    def duplicatas(self):
+        """
+        Linhas duplicadas, como `df.duplicated().sum()` (linhas - hashes
+        distintos); estimada pelo HyperLogLog se `duplicatas_exatas` for False.
+        """
+        if self._hashes_linhas is None:
+            return max(0, int(round(self.linhas - self._distintos_linhas.estimativa())))
+        if not self._hashes_linhas:
+            return 0
+        if len(self._hashes_linhas) > 1:
+            self._hashes_linhas = [np.unique(np.concatenate(self._hashes_linhas))]
+        return self.linhas - self._hashes_linhas[0].size
+
+    def resumo(self):
+        """
+        DataFrame com uma linha por coluna, no espírito de `describe(include='all')`
+        + `isnull().sum()` + `nunique()`.
+        """
+        linhas = {}
+        for col, perfil in self.colunas.items():
+            linha = {
+                'dtype': '/'.join(sorted(perfil.dtypes)),
+                'nao_nulos': perfil.n,
+                'nulos': perfil.nulos,
+                'pct_nulos': perfil.nulos / self.linhas if self.linhas else 0.0,
+                'distintos_aprox': int(round(perfil.distintos.estimativa()))
+            }
+            if perfil.numerica:
+                q1, mediana, q3 = perfil.quantis.quantis([0.25, 0.5, 0.75]) if perfil.n else [np.nan] * 3
+                linha.update({
+                    'media': perfil.media if perfil.n else np.nan,
+                    'desvio_padrao': perfil.desvio_padrao,
+                    'min': perfil.minimo if perfil.n else np.nan,
+                    '25%': q1, '50%': mediana, '75%': q3,
+                    'max': perfil.maximo if perfil.n else np.nan
+                })
+            else:
+                topo = perfil.frequentes.mais_frequentes(1)
+                linha.update({
+                    'top': topo.index[0] if len(topo) else None,
+                    'freq_top': int(topo.iloc[0]) if len(topo) else 0
+                })
+            linhas[col] = linha
+
+        colunas = ['dtype', 'nao_nulos', 'nulos', 'pct_nulos', 'distintos_aprox', 'media',
+                   'desvio_padrao', 'min', '25%', '50%', '75%', 'max', 'top', 'freq_top']
+        return pd.DataFrame.from_dict(linhas, orient='index').reindex(columns=colunas)
+
+    def mais_frequentes(self, coluna, k=10):
+        """
+        Valores mais frequentes de uma coluna categórica (como `value_counts().head(k)`).
+        """
+        return self.colunas[coluna].frequentes.mais_frequentes(k)
+
+    def quantis(self, coluna, q):
+        """
+        Quantis aproximados de uma coluna numérica.
+        """
+        return self.colunas[coluna].quantis.quantis(q)
+
+    def relatorio(self):
+        """
+        Imprime o equivalente a info() + isnull().sum() + duplicated().sum().
+        """
+        resumo = self.resumo()
+        print(f"{'='*60}")
+        print("PERFIL DO DATASET (uma passada)")
+        print(f"{'='*60}")
+        print(f"Dimensões: {self.linhas:,} linhas × {len(self.colunas)} colunas")
+        print(f"Memória (pandas): {self.memoria / 1e6:,.2f} MB")
+        numericas = sum(p.numerica for p in self.colunas.values())
+        print(f"Colunas numéricas: {numericas} | não numéricas: {len(self.colunas) - numericas}")
+        print(f"Valores ausentes total: {int(resumo['nulos'].sum()):,}")
+        com_nulos = resumo.loc[resumo['nulos'] > 0, ['nulos', 'pct_nulos']]
+        if len(com_nulos):
+            print("\nColunas com valores ausentes:")
+            print(com_nulos.to_string())
+        metodo = 'por hash da linha' if self.duplicatas_exatas else 'estimativa HyperLogLog'
+        print(f"\nLinhas duplicadas ({metodo}): {self.duplicatas:,}")
+        print(f"{'='*60}")
+
+
+def _blocos(fonte, tamanho_bloco, opcoes_leitura):
+    if isinstance(fonte, pd.DataFrame):
+        for inicio in range(0, len(fonte), tamanho_bloco):
+            yield fonte.iloc[inicio:inicio + tamanho_bloco]
+    elif isinstance(fonte, str):
+        with pd.read_csv(fonte, chunksize=tamanho_bloco, **opcoes_leitura) as leitor:
+            yield from leitor
+    else:
+        yield from fonte
+
+
+def perfilar(fonte, tamanho_bloco=200_000, n_processos=1, k_quantis=1000,
+             capacidade_frequentes=100, limite_hashes_exatos=2_000_000, **opcoes_leitura):
+    """
+    Calcula o perfil completo dos dados em uma passada.
+
+    Parâmetros:
+    -----------
+    fonte : DataFrame, caminho de CSV ou iterável de DataFrames
+        Ex.: `carregar_e_limpar_dados(caminho_csv=..., tamanho_bloco=...)`
+    tamanho_bloco : int
+        Linhas por bloco (DataFrame/CSV)
+    n_processos : int
+        Processos que perfilam os blocos em paralelo (-1 = todos os núcleos);
+        os blocos são lidos sob demanda, então a memória fica limitada
+    k_quantis, capacidade_frequentes : int
+        Precisão dos sketches (ver `sketches.py`)
+    limite_hashes_exatos : int
+        Ver `PerfilDados`
+    **opcoes_leitura
+        Repassadas a `pd.read_csv` (ex.: dtype=DTYPES_LEITURA_CHURN)
+
+    Retorna:
+    --------
+    PerfilDados
+    """
+    opcoes_perfil = {'k_quantis': k_quantis, 'capacidade_frequentes': capacidade_frequentes,
+                     'limite_hashes_exatos': limite_hashes_exatos}
+    perfil = PerfilDados(**opcoes_perfil)
+    blocos = _blocos(fonte, tamanho_bloco, opcoes_leitura)
+
+    if n_processos == 1:
+        for bloco in blocos:
+            perfil.atualizar(bloco)
+        return perfil
+
+    parciais = Parallel(n_jobs=n_processos, return_as='generator_unordered')(
+        delayed(PerfilDados.de_bloco)(bloco, **opcoes_perfil) for bloco in blocos
+    )
+    for parcial in parciais:
+        perfil.mesclar(parcial)
+    return perfil
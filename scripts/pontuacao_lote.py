@@ -0,0 +1,157 @@
+"""
+Pontuação em Lote para o Projeto de Churn
+
+Este módulo substitui a predição cliente a cliente (`prever_churn`) por uma
+pontuação vetorizada: todos os clientes são codificados de uma vez contra o
+esquema salvo (`codificador.pkl` ou `feature_columns.pkl`) e o modelo é
+chamado uma única vez.
+"""
+
+import numpy as np
+import pandas as pd
+
+from codificador import CodificadorCategorico
+
+
+# Probabilidade mínima para classificar o cliente como churn
+LIMIAR_DECISAO = 0.5
+
+# Probabilidades mínimas para as faixas ALTO e MÉDIO (abaixo disso: BAIXO)
+LIMITES_RISCO = (0.7, 0.4)
+
+ACOES_POR_RISCO = {
+    'ALTO': "AÇÃO URGENTE: Contato imediato, desconto 25%, migrar para contrato anual",
+    'MÉDIO': "MONITORAR: Incluir em campanha de engajamento, oferecer upgrade",
+    'BAIXO': "MANTER: Cliente estável, continuar comunicação regular"
+}
+
+
+def _para_dataframe(dados):
+    """
+    Converte a entrada (DataFrame, tabela Arrow ou iterável de dicts) em DataFrame.
+    """
+    if isinstance(dados, pd.DataFrame):
+        return dados
+    if isinstance(dados, dict):
+        return pd.DataFrame([dados])
+    if hasattr(dados, 'to_pandas'):  # pyarrow.Table / RecordBatch
+        return dados.to_pandas()
+    return pd.DataFrame.from_records(dados)
+
+
+def _com_nomes(matriz, estimador, feature_columns):
+    """
+    Devolve a matriz como DataFrame se o estimador foi ajustado com nomes de
+    colunas (`feature_names_in_`); senão o scikit-learn avisa a cada chamada.
+    """
+    if hasattr(estimador, 'feature_names_in_') and not hasattr(matriz, 'tocsr'):
+        return pd.DataFrame(matriz, columns=feature_columns, copy=False)
+    return matriz
+
+
+def classificar_probabilidades(probabilidade, classes, limiar=LIMIAR_DECISAO,
+                               limites_risco=LIMITES_RISCO):
+    """
+    Deriva classe e faixa de risco a partir das probabilidades de churn.
+
+    Parâmetros:
+    -----------
+    probabilidade : np.ndarray
+        Probabilidade da classe positiva para cada cliente
+    classes : array-like
+        Classes do modelo (`modelo.classes_`), na ordem (negativa, positiva)
+    limiar : float
+        Probabilidade mínima para prever a classe positiva
+    limites_risco : tuple
+        (limite_alto, limite_medio) para as faixas ALTO e MÉDIO
+
+    Retorna:
+    --------
+    tuple: (classe, risco) como np.ndarray
+    """
+    limite_alto, limite_medio = limites_risco
+    classes = np.asarray(classes)
+
+    classe = np.where(probabilidade >= limiar, classes[1], classes[0])
+    risco = np.select(
+        [probabilidade >= limite_alto, probabilidade >= limite_medio],
+        ['ALTO', 'MÉDIO'],
+        default='BAIXO'
+    )
+    return classe, risco
+
+
+def pontuar_lote(dados, modelo, feature_columns, scaler=None, codificador=None,
+                 limiar=LIMIAR_DECISAO, limites_risco=LIMITES_RISCO, esparso=False):
+    """
+    Faz a predição de churn para um lote inteiro de clientes.
+
+    Parâmetros:
+    -----------
+    dados : DataFrame, pyarrow.Table ou iterável de dicts
+        Clientes com as mesmas colunas usadas em `prever_churn`
+    modelo : modelo treinado
+        Classificador com `predict_proba` (ex.: modelo_final.pkl)
+    feature_columns : list
+        Lista de nomes das features (feature_columns.pkl)
+    scaler : objeto scaler, opcional
+        Normalizador (scaler.pkl), se o modelo precisar
+    codificador : CodificadorCategorico, opcional
+        Codificador salvo no treino. Se omitido, é reconstruído a partir de
+        `feature_columns` e das colunas da entrada
+    limiar : float
+        Probabilidade mínima para classificar como churn (padrão 0.5)
+    limites_risco : tuple
+        (limite_alto, limite_medio) das faixas de risco (padrão 0.7/0.4)
+    esparso : bool
+        Se True, codifica em CSR (modelo e scaler devem aceitar matrizes
+        esparsas, ex.: StandardScaler(with_mean=False))
+
+    Retorna:
+    --------
+    DataFrame com as colunas 'classe', 'probabilidade', 'risco' e 'acao',
+    na mesma ordem (e índice) da entrada
+    """
+    df = _para_dataframe(dados)
+    if codificador is None:
+        codificador = CodificadorCategorico.de_feature_columns(feature_columns, df.columns)
+    matriz = codificador.transformar(df, esparso=esparso)
+
+    if scaler is not None:
+        matriz = scaler.transform(_com_nomes(matriz, scaler, codificador.feature_columns))
+
+    # Uma única passada pelo modelo; a classe é derivada da probabilidade
+    probabilidade = modelo.predict_proba(_com_nomes(matriz, modelo, codificador.feature_columns))[:, 1]
+    classe, risco = classificar_probabilidades(probabilidade, modelo.classes_,
+                                               limiar, limites_risco)
+    acao = pd.Series(risco).map(ACOES_POR_RISCO).to_numpy()
+
+    return pd.DataFrame({
+        'classe': classe,
+        'probabilidade': probabilidade,
+        'risco': risco,
+        'acao': acao
+    }, index=df.index)
+
+
+def pontuar_em_fluxo(blocos, modelo, feature_columns, scaler=None, codificador=None,
+                     limiar=LIMIAR_DECISAO, limites_risco=LIMITES_RISCO, esparso=False):
+    """
+    Pontua uma sequência de blocos de clientes, um bloco por vez.
+
+    Parâmetros:
+    -----------
+    blocos : iterável de DataFrames
+        Ex.: `carregar_e_limpar_dados(caminho_csv=..., tamanho_bloco=100_000)`
+    demais parâmetros :
+        Iguais aos de `pontuar_lote`
+
+    Retorna:
+    --------
+    Gerador de DataFrames com as predições de cada bloco
+    """
+    for bloco in blocos:
+        if codificador is None:
+            codificador = CodificadorCategorico.de_feature_columns(feature_columns, bloco.columns)
+        yield pontuar_lote(bloco, modelo, feature_columns, scaler, codificador,
+                           limiar, limites_risco, esparso)
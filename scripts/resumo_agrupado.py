@@ -0,0 +1,164 @@
+"""
+Resumos Agrupados Vetorizados
+
+Tabelas por grupo para os gráficos de EDA, calculadas com cada coluna
+categórica fatorada uma única vez:
+
+    tabelas_cruzadas      contagens/proporções (como pd.crosstab) de várias
+                          colunas contra o target, via np.bincount
+    estatisticas_caixa    estatísticas de boxplot (quartis, bigodes, outliers,
+                          média) por grupo para várias colunas numéricas, com
+                          uma ordenação por coluna e reduções por segmento
+
+`para_bxp` converte as estatísticas no formato de `Axes.bxp`, que desenha o
+boxplot sem recalcular nada.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def fatorar(serie, ordenar=True):
+    """
+    Códigos inteiros (-1 para nulos) e níveis da série.
+
+    Parâmetros:
+    -----------
+    ordenar : bool
+        Se True, níveis em ordem crescente (como crosstab); senão, na ordem
+        de aparição (como `serie.unique()`)
+    """
+    codigos, niveis = pd.factorize(serie, sort=ordenar)
+    return codigos, pd.Index(niveis, name=serie.name)
+
+
+def tabelas_cruzadas(df, colunas, target='Churn', normalizar='index'):
+    """
+    Tabela cruzada de cada coluna contra o target.
+
+    Parâmetros:
+    -----------
+    df : DataFrame
+    colunas : list
+        Colunas categóricas
+    target : str
+        Coluna das classes (colunas da tabela)
+    normalizar : 'index', 'columns', 'all' ou False
+        Como o `normalize` de pd.crosstab
+
+    Retorna:
+    --------
+    dict {coluna: DataFrame (níveis x classes)}
+    """
+    codigos_target, classes = fatorar(df[target])
+    n_classes = len(classes)
+    tabelas = {}
+
+    for col in colunas:
+        codigos, niveis = fatorar(df[col])
+        validos = (codigos >= 0) & (codigos_target >= 0)
+        contagens = np.bincount(codigos[validos] * n_classes + codigos_target[validos],
+                                minlength=len(niveis) * n_classes).reshape(len(niveis), n_classes)
+
+        tabela = pd.DataFrame(contagens, index=niveis, columns=classes)
+        tabela.columns.name = target
+        if normalizar == 'index':
+            tabela = tabela.div(tabela.sum(axis=1), axis=0)
+        elif normalizar == 'columns':
+            tabela = tabela.div(tabela.sum(axis=0), axis=1)
+        elif normalizar == 'all':
+            tabela = tabela / tabela.to_numpy().sum()
+        tabelas[col] = tabela
+
+    return tabelas
+
+
+def _quantil_segmentos(valores, inicio, tamanho, q):
+    # Interpolação linear, como np.percentile
+    posicao = inicio + q * (tamanho - 1)
+    baixo = np.floor(posicao).astype(np.int64)
+    alto = np.minimum(baixo + 1, inicio + tamanho - 1)
+    return valores[baixo] + (valores[alto] - valores[baixo]) * (posicao - baixo)
+
+
+def estatisticas_caixa(df, grupo, colunas, whis=1.5, ordenar=False):
+    """
+    Estatísticas de boxplot por grupo, como `matplotlib.cbook.boxplot_stats`.
+
+    Parâmetros:
+    -----------
+    df : DataFrame
+    grupo : str
+        Coluna categórica que define os grupos
+    colunas : list
+        Colunas numéricas
+    whis : float
+        Comprimento dos bigodes em IQRs
+    ordenar : bool
+        Ordem dos grupos: crescente (True) ou de aparição (False)
+
+    Retorna:
+    --------
+    dict {coluna: DataFrame indexado pelo grupo com n, media, q1, mediana, q3,
+    whislo, whishi e fliers (array de outliers)}
+    """
+    codigos, niveis = fatorar(df[grupo], ordenar=ordenar)
+    tabelas = {}
+
+    for col in colunas:
+        valores = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+        validos = (codigos >= 0) & ~np.isnan(valores)
+        cod, val = codigos[validos], valores[validos]
+
+        # Uma ordenação: por grupo e, dentro do grupo, por valor
+        ordem = np.lexsort((val, cod))
+        cod, val = cod[ordem], val[ordem]
+
+        tamanho = np.bincount(cod, minlength=len(niveis))
+        presentes = np.flatnonzero(tamanho)
+        tamanho = tamanho[presentes]
+        if presentes.size == 0:
+            tabelas[col] = pd.DataFrame(columns=['n', 'media', 'q1', 'mediana', 'q3',
+                                                 'whislo', 'whishi', 'fliers'],
+                                        index=niveis[:0])
+            continue
+        inicio = np.concatenate([[0], np.cumsum(tamanho)[:-1]])
+
+        q1 = _quantil_segmentos(val, inicio, tamanho, 0.25)
+        mediana = _quantil_segmentos(val, inicio, tamanho, 0.5)
+        q3 = _quantil_segmentos(val, inicio, tamanho, 0.75)
+        media = np.add.reduceat(val, inicio) / tamanho
+
+        iqr = q3 - q1
+        limite_inf = np.repeat(q1 - whis * iqr, tamanho)
+        limite_sup = np.repeat(q3 + whis * iqr, tamanho)
+        dentro = (val >= limite_inf) & (val <= limite_sup)
+
+        # Bigodes: extremos dos dados dentro dos limites (ou os quartis, se vazio)
+        whislo = np.minimum.reduceat(np.where(dentro, val, np.inf), inicio)
+        whishi = np.maximum.reduceat(np.where(dentro, val, -np.inf), inicio)
+        whislo = np.where(np.isinf(whislo), q1, np.minimum(whislo, q1))
+        whishi = np.where(np.isinf(whishi), q3, np.maximum(whishi, q3))
+
+        fora = (val < np.repeat(whislo, tamanho)) | (val > np.repeat(whishi, tamanho))
+        fliers = np.split(val[fora], np.cumsum(np.bincount(cod[fora], minlength=len(niveis))[presentes])[:-1])
+
+        tabelas[col] = pd.DataFrame({
+            'n': tamanho, 'media': media, 'q1': q1, 'mediana': mediana, 'q3': q3,
+            'whislo': whislo, 'whishi': whishi, 'fliers': fliers
+        }, index=niveis[presentes])
+
+    return tabelas
+
+
+def para_bxp(tabela):
+    """
+    Lista de dicts aceita por `Axes.bxp` a partir de uma tabela de
+    `estatisticas_caixa`.
+    """
+    return [
+        {'label': str(nivel), 'mean': linha['media'], 'med': linha['mediana'],
+         'q1': linha['q1'], 'q3': linha['q3'], 'whislo': linha['whislo'],
+         'whishi': linha['whishi'], 'fliers': linha['fliers']}
+        for nivel, linha in tabela.iterrows()
+    ]
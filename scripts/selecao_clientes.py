@@ -0,0 +1,210 @@
+"""
+Seleção de Clientes para Campanhas de Retenção
+
+Pontua o valor esperado da retenção de cada cliente
+
+    valor = probabilidade de churn x LTV x taxa de sucesso - custo da ação
+
+com LTV individual estimado a partir de `MonthlyCharges` e `tenure`, e
+escolhe os K clientes de maior valor que cabem no orçamento da campanha.
+
+A seleção é parcial (np.argpartition) e incremental: os lotes de scores
+chegam em fluxo e só os K melhores até o momento ficam em memória, então a
+lista pode ser montada sobre dezenas de milhões de clientes.
+
+Uso:
+    selecao = selecionar_clientes_em_fluxo(
+        carregar_e_limpar_dados(caminho_csv=..., tamanho_bloco=500_000),
+        modelo, feature_columns, scaler, codificador, orcamento=150_000)
+"""
+
+import numpy as np
+import pandas as pd
+
+from pontuacao_lote import pontuar_lote
+
+
+# Horizonte de permanência esperado, em meses: o tempo de casa já observado,
+# limitado a este intervalo
+HORIZONTE_MIN_MESES = 12
+HORIZONTE_MAX_MESES = 60
+
+
+def ltv_estimado(df, horizonte_min=HORIZONTE_MIN_MESES, horizonte_max=HORIZONTE_MAX_MESES):
+    """
+    LTV individual = MonthlyCharges x horizonte de permanência esperado.
+
+    Parâmetros:
+    -----------
+    df : DataFrame
+        Clientes com as colunas 'MonthlyCharges' e 'tenure'
+    horizonte_min, horizonte_max : int
+        Limites (em meses) do horizonte, que segue o tempo de casa
+
+    Retorna:
+    --------
+    np.ndarray (float64) com o LTV de cada cliente
+    """
+    mensalidade = pd.to_numeric(df['MonthlyCharges'], errors='coerce').to_numpy(dtype=np.float64)
+    tenure = pd.to_numeric(df['tenure'], errors='coerce').to_numpy(dtype=np.float64)
+    return mensalidade * np.clip(tenure, horizonte_min, horizonte_max)
+
+
+def valor_esperado(probabilidade, ltv, taxa_sucesso=0.6, custo_retencao=300):
+    """
+    Valor esperado (R$) de incluir cada cliente na campanha.
+    """
+    return np.asarray(probabilidade) * np.asarray(ltv) * taxa_sucesso - custo_retencao
+
+
+def selecionar_top_k(valores, k):
+    """
+    Índices dos k maiores valores, do maior para o menor, sem ordenar tudo.
+    """
+    valores = np.asarray(valores)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < valores.size:
+        candidatos = np.argpartition(-valores, k - 1)[:k]
+    else:
+        candidatos = np.arange(valores.size)
+    return candidatos[np.argsort(-valores[candidatos], kind='stable')]
+
+
+class SelecaoCampanha:
+    """
+    Mantém os K clientes de maior valor esperado à medida que os lotes chegam.
+
+    Parâmetros:
+    -----------
+    orcamento : float
+        Orçamento total da campanha (R$); K = orcamento // custo_retencao
+    custo_retencao : float
+        Custo da ação de retenção por cliente (R$)
+    taxa_sucesso : float
+        Taxa de sucesso das campanhas (0-1)
+    apenas_positivos : bool
+        Se True, clientes com valor esperado <= 0 nunca são selecionados
+
+    Atributos:
+    ----------
+    k : int
+        Número máximo de clientes na campanha
+    clientes_vistos : int
+    """
+
+    def __init__(self, orcamento, custo_retencao=300, taxa_sucesso=0.6, apenas_positivos=True):
+        self.custo_retencao = custo_retencao
+        self.taxa_sucesso = taxa_sucesso
+        self.apenas_positivos = apenas_positivos
+        self.k = int(orcamento // custo_retencao)
+        self.clientes_vistos = 0
+        self._colunas = {
+            'id': np.empty(0, dtype=object),
+            'probabilidade': np.empty(0),
+            'ltv': np.empty(0),
+            'valor_esperado': np.empty(0)
+        }
+
+    @property
+    def valor_minimo(self):
+        """
+        Valor que um novo cliente precisa superar para entrar na seleção.
+        """
+        if self.k <= 0:
+            # Orçamento menor que o custo de uma ação: ninguém entra
+            return np.inf
+        base = 0.0 if self.apenas_positivos else -np.inf
+        valores = self._colunas['valor_esperado']
+        if valores.size < self.k:
+            return base
+        return max(base, valores.min())
+
+    def adicionar(self, probabilidade, ltv, ids=None):
+        """
+        Processa um lote de clientes.
+
+        Parâmetros:
+        -----------
+        probabilidade : array-like
+            Probabilidade de churn de cada cliente do lote
+        ltv : array-like
+            LTV de cada cliente (ex.: `ltv_estimado(bloco)`)
+        ids : array-like, opcional
+            Identificadores (padrão: posição global do cliente)
+
+        Retorna:
+        --------
+        self
+        """
+        probabilidade = np.asarray(probabilidade, dtype=np.float64)
+        ltv = np.asarray(ltv, dtype=np.float64)
+        if ids is None:
+            ids = np.arange(self.clientes_vistos, self.clientes_vistos + probabilidade.size)
+        ids = np.asarray(ids, dtype=object)
+        self.clientes_vistos += probabilidade.size
+
+        valores = valor_esperado(probabilidade, ltv, self.taxa_sucesso, self.custo_retencao)
+        # Descarta de imediato quem não supera o pior selecionado até aqui
+        entram = valores > self.valor_minimo
+        if not entram.any():
+            return self
+
+        novos = {'id': ids[entram], 'probabilidade': probabilidade[entram],
+                 'ltv': ltv[entram], 'valor_esperado': valores[entram]}
+        juntos = {nome: np.concatenate([self._colunas[nome], novos[nome]]) for nome in novos}
+        manter = selecionar_top_k(juntos['valor_esperado'], self.k)
+        self._colunas = {nome: coluna[manter] for nome, coluna in juntos.items()}
+        return self
+
+    def adicionar_lote(self, df, probabilidade, coluna_id='customerID'):
+        """
+        Atalho para um DataFrame de clientes (com MonthlyCharges e tenure).
+        """
+        ids = df[coluna_id].to_numpy() if coluna_id in df.columns else None
+        return self.adicionar(probabilidade, ltv_estimado(df), ids)
+
+    def resultado(self):
+        """
+        DataFrame com os clientes selecionados, do maior para o menor valor.
+        """
+        selecionados = pd.DataFrame(self._colunas)
+        selecionados['custo_acumulado'] = self.custo_retencao * np.arange(1, len(selecionados) + 1)
+        selecionados['valor_acumulado'] = selecionados['valor_esperado'].cumsum()
+        return selecionados
+
+
+def selecionar_clientes_em_fluxo(blocos, modelo, feature_columns, scaler=None, codificador=None,
+                                 orcamento=100_000, custo_retencao=300, taxa_sucesso=0.6,
+                                 coluna_id='customerID', relatorio=True):
+    """
+    Pontua os blocos de clientes e monta a lista da campanha.
+
+    Parâmetros:
+    -----------
+    blocos : iterável de DataFrames
+        Ex.: `carregar_e_limpar_dados(caminho_csv=..., tamanho_bloco=500_000)`
+    modelo, feature_columns, scaler, codificador :
+        Artefatos de `carregar_modelo_completo(..., com_codificador=True)`
+    orcamento, custo_retencao, taxa_sucesso :
+        Parâmetros da campanha (ver `SelecaoCampanha`)
+    coluna_id : str
+        Coluna com o identificador do cliente
+
+    Retorna:
+    --------
+    DataFrame de `SelecaoCampanha.resultado()`
+    """
+    selecao = SelecaoCampanha(orcamento, custo_retencao, taxa_sucesso)
+    for bloco in blocos:
+        scores = pontuar_lote(bloco, modelo, feature_columns, scaler, codificador)
+        selecao.adicionar_lote(bloco, scores['probabilidade'].to_numpy(), coluna_id)
+
+    resultado = selecao.resultado()
+    if relatorio:
+        valor_total = resultado['valor_esperado'].sum()
+        print(f"🎯 Campanha: {len(resultado):,} de {selecao.clientes_vistos:,} clientes "
+              f"(limite {selecao.k:,} pelo orçamento)")
+        print(f"   Custo: R$ {len(resultado) * custo_retencao:,.2f} | "
+              f"Valor esperado: R$ {valor_total:,.2f}")
+    return resultado
@@ -0,0 +1,251 @@
+"""
+Serviço HTTP de Predição de Churn
+
+API ASGI (FastAPI) que carrega os artefatos do modelo uma única vez e agrupa
+requisições concorrentes de clientes individuais em micro-lotes, pontuados com
+uma única chamada vetorizada (`pontuar_lote`).
+
+Execução:
+    uvicorn servico_api:app --app-dir scripts --port 8000
+
+Variáveis de ambiente:
+    CHURN_ARTEFATOS      diretório com modelo_final.pkl, feature_columns.pkl, scaler.pkl
+                         (modelo_compilado.npz, se existir, é usado no lugar do .pkl),
+                         ou diretório de um bundle (ATUAL + versoes/, ver bundle.py)
+    CHURN_LOTE_MAX       tamanho máximo do micro-lote (padrão 64)
+    CHURN_ESPERA_MAX_MS  espera máxima para completar um lote, em ms (padrão 5)
+    CHURN_RECARGA_S      intervalo para detectar um novo modelo, em s (padrão 5; 0 desliga;
+                         só vale para bundles)
+"""
+
+import asyncio
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from typing import List
+
+import numpy as np
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from artefatos import ArtefatosAoVivo
+from bundle import resolver_bundle
+from pontuacao_lote import pontuar_lote
+
+
+DIRETORIO_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'test')
+
+
+class Cliente(BaseModel):
+    """Dados de um cliente, no mesmo formato de `prever_churn`."""
+    tenure: int
+    MonthlyCharges: float
+    TotalCharges: float
+    Contract: str
+    InternetService: str
+    PaymentMethod: str
+    OnlineSecurity: str
+    TechSupport: str
+    PaperlessBilling: str
+    SeniorCitizen: int
+
+
+class EstatisticasLatencia:
+    """
+    Guarda as latências mais recentes (em segundos) por tamanho de lote.
+    """
+
+    def __init__(self, janela=10_000):
+        self.latencias = defaultdict(lambda: deque(maxlen=janela))
+
+    def registrar(self, tamanho_lote, latencias):
+        self.latencias[tamanho_lote].extend(latencias)
+
+    def resumo(self):
+        """
+        Retorna {tamanho_lote: {'n', 'p50_ms', 'p99_ms'}} ordenado por tamanho.
+        """
+        resumo = {}
+        for tamanho in sorted(self.latencias):
+            valores = np.fromiter(self.latencias[tamanho], dtype=np.float64) * 1000
+            resumo[tamanho] = {
+                'n': int(valores.size),
+                'p50_ms': float(np.percentile(valores, 50)),
+                'p99_ms': float(np.percentile(valores, 99))
+            }
+        return resumo
+
+
+class AgrupadorLotes:
+    """
+    Junta requisições individuais em micro-lotes.
+
+    Um lote é enviado quando atinge `tamanho_max` clientes ou quando a
+    primeira requisição do lote espera `espera_max` segundos, o que ocorrer
+    primeiro. A pontuação roda em uma thread para não bloquear o event loop.
+
+    Parâmetros:
+    -----------
+    funcao_pontuar : callable
+        Recebe uma lista de dicts e retorna um DataFrame (ex.: `pontuar_lote`)
+    tamanho_max : int
+        Número máximo de clientes por lote
+    espera_max : float
+        Tempo máximo de espera (s) para completar o lote
+    """
+
+    def __init__(self, funcao_pontuar, tamanho_max=64, espera_max=0.005):
+        self.funcao_pontuar = funcao_pontuar
+        self.tamanho_max = tamanho_max
+        self.espera_max = espera_max
+        self.estatisticas = EstatisticasLatencia()
+        self._fila = None
+        self._tarefa = None
+
+    async def iniciar(self):
+        self._fila = asyncio.Queue()
+        self._tarefa = asyncio.create_task(self._processar())
+
+    async def parar(self):
+        if self._tarefa is not None:
+            self._tarefa.cancel()
+            try:
+                await self._tarefa
+            except asyncio.CancelledError:
+                pass
+            self._tarefa = None
+
+    async def pontuar(self, cliente_dict):
+        """
+        Enfileira um cliente e aguarda o resultado do lote em que ele entrar.
+        """
+        futuro = asyncio.get_running_loop().create_future()
+        await self._fila.put((cliente_dict, futuro, time.perf_counter()))
+        return await futuro
+
+    async def _coletar_lote(self):
+        loop = asyncio.get_running_loop()
+        lote = [await self._fila.get()]
+        prazo = loop.time() + self.espera_max
+
+        while len(lote) < self.tamanho_max:
+            restante = prazo - loop.time()
+            if restante <= 0:
+                break
+            try:
+                lote.append(await asyncio.wait_for(self._fila.get(), restante))
+            except asyncio.TimeoutError:
+                break
+
+        return lote
+
+    async def _processar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = await self._coletar_lote()
+            dados = [cliente for cliente, _, _ in lote]
+
+            try:
+                resultado = await loop.run_in_executor(None, self.funcao_pontuar, dados)
+            except Exception as erro:
+                for _, futuro, _ in lote:
+                    if not futuro.done():
+                        futuro.set_exception(erro)
+                continue
+
+            fim = time.perf_counter()
+            registros = resultado.to_dict('records')
+            for (_, futuro, _), registro in zip(lote, registros):
+                if not futuro.done():
+                    futuro.set_result(registro)
+
+            self.estatisticas.registrar(len(lote), [fim - inicio for _, _, inicio in lote])
+
+
+def criar_app(diretorio_artefatos=None, tamanho_max=None, espera_max=None, intervalo_recarga=None):
+    """
+    Cria a aplicação FastAPI.
+
+    Parâmetros:
+    -----------
+    diretorio_artefatos : str, opcional
+        Diretório com os arquivos .pkl (padrão: $CHURN_ARTEFATOS ou test/)
+    tamanho_max : int, opcional
+        Tamanho máximo do micro-lote (padrão: $CHURN_LOTE_MAX ou 64)
+    espera_max : float, opcional
+        Espera máxima em segundos (padrão: $CHURN_ESPERA_MAX_MS ou 5 ms)
+    intervalo_recarga : float, opcional
+        Segundos entre verificações de novo modelo (padrão: $CHURN_RECARGA_S
+        ou 5); 0 desliga a recarga a quente
+    """
+    diretorio = diretorio_artefatos or os.environ.get('CHURN_ARTEFATOS', DIRETORIO_PADRAO)
+    tamanho_max = tamanho_max or int(os.environ.get('CHURN_LOTE_MAX', 64))
+    espera_max = espera_max or float(os.environ.get('CHURN_ESPERA_MAX_MS', 5)) / 1000
+    if intervalo_recarga is None:
+        intervalo_recarga = float(os.environ.get('CHURN_RECARGA_S', 5))
+    estado = {}
+
+    @asynccontextmanager
+    async def ciclo_de_vida(app):
+        # Artefatos carregados uma única vez, na inicialização
+        if resolver_bundle(diretorio) is not None:
+            caminho_modelo = diretorio
+        elif os.path.exists(os.path.join(diretorio, 'modelo_compilado.npz')):
+            caminho_modelo = os.path.join(diretorio, 'modelo_compilado.npz')
+        else:
+            caminho_modelo = os.path.join(diretorio, 'modelo_final.pkl')
+
+        artefatos = ArtefatosAoVivo(
+            caminho_modelo=caminho_modelo,
+            caminho_features=os.path.join(diretorio, 'feature_columns.pkl'),
+            caminho_scaler=os.path.join(diretorio, 'scaler.pkl'),
+            caminho_codificador=os.path.join(diretorio, 'codificador.pkl'),
+            intervalo=intervalo_recarga
+        )
+        if intervalo_recarga > 0 and artefatos.recarregavel:
+            artefatos.iniciar_monitoramento()
+
+        def pontuar(dados):
+            # Cada lote usa uma única versão do modelo, mesmo se houver troca no meio
+            modelo, feature_columns, scaler, codificador = artefatos.atual
+            return pontuar_lote(dados, modelo, feature_columns, scaler, codificador)
+
+        estado['artefatos'] = artefatos
+        estado['pontuar'] = pontuar
+        estado['agrupador'] = AgrupadorLotes(pontuar, tamanho_max, espera_max)
+        await estado['agrupador'].iniciar()
+        yield
+        await estado['agrupador'].parar()
+        artefatos.parar_monitoramento()
+
+    app = FastAPI(title="API de Predição de Churn", lifespan=ciclo_de_vida)
+
+    @app.post("/prever")
+    async def prever(cliente: Cliente):
+        return await estado['agrupador'].pontuar(cliente.model_dump())
+
+    @app.post("/prever/lote")
+    async def prever_lote(clientes: List[Cliente]):
+        dados = [cliente.model_dump() for cliente in clientes]
+        resultado = await asyncio.get_running_loop().run_in_executor(None, estado['pontuar'], dados)
+        return resultado.to_dict('records')
+
+    @app.get("/metricas")
+    async def metricas():
+        agrupador = estado['agrupador']
+        return {
+            'lote_max': agrupador.tamanho_max,
+            'espera_max_ms': agrupador.espera_max * 1000,
+            'recargas_modelo': estado['artefatos'].recargas,
+            'latencia_por_tamanho_lote': agrupador.estatisticas.resumo()
+        }
+
+    @app.get("/saude")
+    async def saude():
+        return {'status': 'ok'}
+
+    return app
+
+
+app = criar_app()
@@ -0,0 +1,206 @@
+"""
+Sketches de Memória Limitada
+
+Estruturas aproximadas, mescláveis e alimentadas em lotes (arrays NumPy):
+
+    SketchQuantis        quantis aproximados (KLL)
+    ContadorFrequentes   valores mais frequentes (Misra-Gries)
+    EstimadorDistintos   número de valores distintos (HyperLogLog)
+
+Cada uma tem `atualizar(valores)` para um lote e `mesclar(outro)` para somar
+sketches construídos em blocos ou processos diferentes. São a base do perfil
+de dados em fluxo (`perfil_eda.py`) e do imputador (`imputacao.py`).
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class SketchQuantis:
+    """
+    Sketch KLL para quantis aproximados.
+
+    Os itens ficam em níveis ("compactadores"); um item no nível h representa
+    2^h itens originais. Quando um nível excede sua capacidade, ele é ordenado
+    e metade dos itens (posições pares ou ímpares, ao acaso) sobe de nível.
+    O erro de posto é da ordem de n / k.
+
+    Parâmetros:
+    -----------
+    k : int
+        Capacidade do nível mais alto (maior = mais preciso e mais memória)
+    semente : int, opcional
+        Semente do sorteio das compactações
+    """
+
+    def __init__(self, k=1000, semente=None):
+        self.k = k
+        self.n = 0
+        self.minimo = np.inf
+        self.maximo = -np.inf
+        self.niveis = [np.empty(0)]
+        self._rng = np.random.default_rng(semente)
+
+    def _capacidade(self, nivel):
+        altura = len(self.niveis)
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (altura - nivel - 1))))
+
+    def _compactar(self):
+        nivel = 0
+        while nivel < len(self.niveis):
+            itens = self.niveis[nivel]
+            if itens.size > self._capacidade(nivel):
+                itens = np.sort(itens)
+                # Número ímpar de itens: o último fica neste nível
+                sobra = itens[-1:] if itens.size % 2 else itens[:0]
+                pares = itens[:itens.size - sobra.size]
+                promovidos = pares[self._rng.integers(2)::2]
+                if nivel + 1 == len(self.niveis):
+                    self.niveis.append(np.empty(0))
+                self.niveis[nivel + 1] = np.concatenate([self.niveis[nivel + 1], promovidos])
+                self.niveis[nivel] = sobra
+            nivel += 1
+
+    def atualizar(self, valores):
+        """
+        Acrescenta um lote de valores (NaN são ignorados).
+        """
+        valores = np.asarray(valores, dtype=np.float64).ravel()
+        valores = valores[~np.isnan(valores)]
+        if valores.size == 0:
+            return self
+        self.n += valores.size
+        self.minimo = min(self.minimo, valores.min())
+        self.maximo = max(self.maximo, valores.max())
+        self.niveis[0] = np.concatenate([self.niveis[0], valores])
+        self._compactar()
+        return self
+
+    def mesclar(self, outro):
+        """
+        Soma outro sketch a este (mesmo `k`).
+        """
+        while len(self.niveis) < len(outro.niveis):
+            self.niveis.append(np.empty(0))
+        for nivel, itens in enumerate(outro.niveis):
+            self.niveis[nivel] = np.concatenate([self.niveis[nivel], itens])
+        self.n += outro.n
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        self._compactar()
+        return self
+
+    def quantis(self, q):
+        """
+        Quantis aproximados para as frações em `q` (escalar ou array).
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        itens = np.concatenate(self.niveis)
+        pesos = np.concatenate([np.full(nivel.size, 2.0 ** h) for h, nivel in enumerate(self.niveis)])
+        ordem = np.argsort(itens, kind='stable')
+        itens, acumulado = itens[ordem], np.cumsum(pesos[ordem])
+
+        posicao = np.searchsorted(acumulado, q * acumulado[-1], side='left')
+        resultado = itens[np.minimum(posicao, itens.size - 1)]
+        resultado = np.where(q <= 0, self.minimo, np.where(q >= 1, self.maximo, resultado))
+        return resultado if resultado.ndim else float(resultado)
+
+    def mediana(self):
+        return self.quantis(0.5)
+
+    def __len__(self):
+        return sum(nivel.size for nivel in self.niveis)
+
+
+class ContadorFrequentes:
+    """
+    Contador de valores frequentes (Misra-Gries) com no máximo `capacidade` chaves.
+
+    Valores com frequência acima de n / (capacidade + 1) estão sempre
+    presentes; as contagens são limites inferiores, exatas enquanto houver
+    no máximo `capacidade` valores distintos.
+    """
+
+    def __init__(self, capacidade=100):
+        self.capacidade = capacidade
+        self.n = 0
+        self.contagens = pd.Series(dtype=np.int64)
+
+    def _reduzir(self, contagens):
+        if len(contagens) > self.capacidade:
+            corte = contagens.nlargest(self.capacidade + 1).iloc[-1]
+            contagens = contagens[contagens > corte] - corte
+        return contagens
+
+    def atualizar(self, valores):
+        """
+        Acrescenta um lote de valores (nulos são ignorados).
+        """
+        contagens = pd.Series(valores).value_counts(dropna=True)
+        contagens.index = contagens.index.astype(object)
+        self.n += int(contagens.sum())
+        self.contagens = self._reduzir(self.contagens.add(contagens, fill_value=0).astype(np.int64))
+        return self
+
+    def mesclar(self, outro):
+        self.n += outro.n
+        self.contagens = self._reduzir(self.contagens.add(outro.contagens, fill_value=0).astype(np.int64))
+        return self
+
+    def mais_frequentes(self, k=10):
+        """
+        Series com os k valores mais frequentes e suas contagens.
+        """
+        return self.contagens.sort_values(ascending=False, kind='stable').head(k)
+
+    def moda(self):
+        return self.contagens.idxmax() if len(self.contagens) else None
+
+
+class EstimadorDistintos:
+    """
+    HyperLogLog: estima o número de valores distintos com 2^p registradores.
+
+    O erro relativo típico é 1.04 / sqrt(2^p) (≈0.4% com p=16).
+    """
+
+    def __init__(self, p=14):
+        self.p = p
+        self.registradores = np.zeros(1 << p, dtype=np.uint8)
+
+    def atualizar_hashes(self, hashes):
+        """
+        Acrescenta hashes de 64 bits (ex.: `pd.util.hash_pandas_object`).
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        bits_restantes = 64 - self.p
+        indice = (hashes >> np.uint64(bits_restantes)).astype(np.int64)
+        resto = hashes & np.uint64((1 << bits_restantes) - 1)
+        # Valores < 2^53 são exatos em float64: frexp dá o número de bits
+        tamanho_bits = np.frexp(resto.astype(np.float64))[1]
+        posto = (bits_restantes - tamanho_bits + 1).astype(np.uint8)
+        np.maximum.at(self.registradores, indice, posto)
+        return self
+
+    def atualizar(self, valores):
+        """
+        Acrescenta um lote de valores (nulos são ignorados).
+        """
+        serie = pd.Series(valores).dropna()
+        return self.atualizar_hashes(pd.util.hash_pandas_object(serie, index=False).to_numpy())
+
+    def mesclar(self, outro):
+        np.maximum(self.registradores, outro.registradores, out=self.registradores)
+        return self
+
+    def estimativa(self):
+        m = self.registradores.size
+        alfa = 0.7213 / (1 + 1.079 / m)
+        estimativa = alfa * m * m / np.sum(2.0 ** -self.registradores.astype(np.float64))
+        zeros = np.count_nonzero(self.registradores == 0)
+        if estimativa <= 2.5 * m and zeros:
+            # Correção para cardinalidades pequenas (linear counting)
+            estimativa = m * np.log(m / zeros)
+        return float(estimativa)
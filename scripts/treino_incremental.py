@@ -0,0 +1,260 @@
+"""
+Treino Incremental do Modelo de Churn
+
+Atualiza o modelo a cada novo extrato mensal em vez de retreinar sobre todo o
+histórico. Dois modos:
+
+    'floresta'  RandomForest com warm_start: cada lote acrescenta árvores
+                treinadas apenas nas linhas novas; acima de `max_arvores`
+                as mais antigas são descartadas (janela dos lotes recentes)
+    'linear'    SGDClassifier (log_loss) + StandardScaler com partial_fit
+
+O codificador é congelado no primeiro lote (ou vem do modelo anterior), então
+`feature_columns` não muda entre versões. Cada versão é gravada com
+`salvar_modelo_completo` em um subdiretório próprio.
+
+Uso:
+    python scripts/treino_incremental.py modelos/ extrato_2025_01.csv extrato_2025_02.csv \\
+        [--tipo floresta|linear] [--base modelos/<versão anterior>]
+"""
+
+import datetime
+import os
+
+import joblib
+import numpy as np
+
+from artefatos import salvar_modelo_completo
+from codificador import CodificadorCategorico
+from funcoes_auxiliares import carregar_e_limpar_dados, preparar_features
+
+
+class TreinoIncremental:
+    """
+    Modelo de churn treinado lote a lote.
+
+    Parâmetros:
+    -----------
+    tipo : str
+        'floresta' (warm_start) ou 'linear' (partial_fit)
+    codificador : CodificadorCategorico, opcional
+        Codificador fixo (padrão: ajustado no primeiro lote)
+    arvores_por_lote : int
+        Árvores acrescentadas a cada lote no modo 'floresta'
+    max_arvores : int ou None
+        Tamanho máximo da floresta; ao passar dele, as árvores mais antigas
+        (de lotes anteriores) são descartadas. None deixa a floresta crescer
+        sem limite (memória e latência crescem com o número de lotes)
+    parametros : dict, opcional
+        Hiperparâmetros extras do estimador (ex.: a configuração vencedora
+        de `ajuste_hiperparametros`)
+    esparso : bool
+        Se True, codifica cada lote em CSR
+
+    Atributos:
+    ----------
+    modelo, scaler, codificador
+    lotes : int
+        Lotes já consumidos
+    n_amostras : int
+        Linhas vistas desde o início
+    """
+
+    CLASSES = np.array(['No', 'Yes'])
+
+    def __init__(self, tipo='floresta', codificador=None, arvores_por_lote=20,
+                 max_arvores=500, parametros=None, esparso=False):
+        if tipo not in ('floresta', 'linear'):
+            raise ValueError("tipo deve ser 'floresta' ou 'linear'.")
+        self.tipo = tipo
+        self.codificador = codificador
+        self.arvores_por_lote = arvores_por_lote
+        self.max_arvores = max_arvores
+        self.parametros = dict(parametros or {})
+        self.esparso = esparso
+        self.modelo = None
+        self.scaler = None
+        self.lotes = 0
+        self.n_amostras = 0
+
+    @classmethod
+    def continuar(cls, diretorio, tipo=None, **kwargs):
+        """
+        Retoma o treino a partir de uma versão salva por `salvar`.
+
+        Parâmetros:
+        -----------
+        diretorio : str
+            Diretório da versão (com modelo_final.pkl e codificador.pkl)
+        tipo : str, opcional
+            Inferido do modelo salvo se omitido
+        """
+        modelo = joblib.load(os.path.join(diretorio, 'modelo_final.pkl'))
+        if tipo is None:
+            tipo = 'floresta' if hasattr(modelo, 'estimators_') else 'linear'
+
+        codificador = CodificadorCategorico.de_dict(
+            joblib.load(os.path.join(diretorio, 'codificador.pkl')))
+        treino = cls(tipo, codificador=codificador, **kwargs)
+        treino.modelo = modelo
+
+        caminho_scaler = os.path.join(diretorio, 'scaler.pkl')
+        if os.path.exists(caminho_scaler):
+            treino.scaler = joblib.load(caminho_scaler)
+
+        caminho_estado = os.path.join(diretorio, 'estado_incremental.pkl')
+        if os.path.exists(caminho_estado):
+            estado = joblib.load(caminho_estado)
+            treino.lotes = estado['lotes']
+            treino.n_amostras = estado['n_amostras']
+        return treino
+
+    def _novo_modelo(self):
+        if self.tipo == 'floresta':
+            from sklearn.ensemble import RandomForestClassifier
+            parametros = {'max_depth': 15, 'min_samples_split': 5, 'random_state': 42, 'n_jobs': -1,
+                          **self.parametros}
+            parametros.update(n_estimators=0, warm_start=True)
+            return RandomForestClassifier(**parametros)
+
+        from sklearn.linear_model import SGDClassifier
+        from sklearn.preprocessing import StandardScaler
+        self.scaler = StandardScaler(with_mean=not self.esparso)
+        return SGDClassifier(**{'loss': 'log_loss', 'alpha': 1e-4, 'random_state': 42,
+                                **self.parametros})
+
+    def atualizar(self, X, y):
+        """
+        Consome um lote de dados novos.
+
+        Parâmetros:
+        -----------
+        X : DataFrame
+            Features originais do lote (saída de `preparar_features`)
+        y : array-like
+            Target ('Yes'/'No') do lote
+
+        Retorna:
+        --------
+        self
+        """
+        if self.codificador is None:
+            self.codificador = CodificadorCategorico().ajustar(X)
+        if self.modelo is None:
+            self.modelo = self._novo_modelo()
+
+        matriz = self.codificador.transformar(X, esparso=self.esparso)
+        y = np.asarray(y).astype(str)
+
+        if self.tipo == 'floresta':
+            if len(np.unique(y)) < 2:
+                print(f"⚠️  Lote {self.lotes + 1} com uma única classe: ignorado")
+                return self
+            # Só as árvores novas são treinadas, e apenas com as linhas deste lote
+            self.modelo.n_estimators += self.arvores_por_lote
+            self.modelo.fit(matriz, y)
+            self._limitar_arvores()
+        else:
+            self.scaler.partial_fit(matriz)
+            self.modelo.partial_fit(self.scaler.transform(matriz), y, classes=self.CLASSES)
+
+        self.lotes += 1
+        self.n_amostras += len(y)
+        return self
+
+    def _limitar_arvores(self):
+        if self.max_arvores is None or len(self.modelo.estimators_) <= self.max_arvores:
+            return
+        descartadas = len(self.modelo.estimators_) - self.max_arvores
+        # estimators_ está na ordem de criação: as primeiras são as mais antigas
+        self.modelo.estimators_ = self.modelo.estimators_[descartadas:]
+        self.modelo.n_estimators = len(self.modelo.estimators_)
+        print(f"🌲 {descartadas} árvore(s) mais antiga(s) descartada(s) (limite {self.max_arvores})")
+
+    def treinar_em_fluxo(self, blocos, features_selecionadas=None):
+        """
+        Consome uma sequência de DataFrames limpos (um por extrato/bloco).
+
+        Parâmetros:
+        -----------
+        blocos : iterável de DataFrames
+            Ex.: `carregar_e_limpar_dados(caminho_csv=..., tamanho_bloco=100_000)`
+        features_selecionadas : list, opcional
+            Repassado a `preparar_features`
+        """
+        for bloco in blocos:
+            X, y = preparar_features(bloco, features_selecionadas)
+            self.atualizar(X, y)
+            print(f"✅ Lote {self.lotes}: {len(y):,} linhas (total {self.n_amostras:,})")
+        return self
+
+    def salvar(self, diretorio_base, versao=None, caminho_bundle=None):
+        """
+        Grava uma nova versão com `salvar_modelo_completo`.
+
+        Parâmetros:
+        -----------
+        diretorio_base : str
+            Diretório que agrupa as versões
+        versao : str, opcional
+            Nome da versão (padrão: data/hora UTC)
+        caminho_bundle : str, opcional
+            Se informado, grava também o bundle versionado
+
+        Retorna:
+        --------
+        str com o diretório da versão
+        """
+        versao = versao or datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        diretorio = os.path.join(diretorio_base, versao)
+        os.makedirs(diretorio, exist_ok=True)
+
+        configuracao = {
+            'modelo': 'incremental',
+            'tipo': self.tipo,
+            'versao': versao,
+            'lotes': self.lotes,
+            'n_amostras': self.n_amostras,
+            'parametros': self.parametros
+        }
+        if self.tipo == 'floresta':
+            configuracao['n_arvores'] = int(self.modelo.n_estimators)
+
+        salvar_modelo_completo(
+            self.modelo, self.codificador.feature_columns, self.scaler,
+            caminho_modelo=os.path.join(diretorio, 'modelo_final.pkl'),
+            caminho_features=os.path.join(diretorio, 'feature_columns.pkl'),
+            caminho_scaler=os.path.join(diretorio, 'scaler.pkl'),
+            codificador=self.codificador,
+            caminho_codificador=os.path.join(diretorio, 'codificador.pkl'),
+            caminho_bundle=caminho_bundle,
+            configuracao=configuracao,
+            caminho_configuracao=os.path.join(diretorio, 'configuracao_modelo.json')
+        )
+        joblib.dump({'lotes': self.lotes, 'n_amostras': self.n_amostras},
+                    os.path.join(diretorio, 'estado_incremental.pkl'))
+        return diretorio
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Treino incremental a partir de extratos mensais")
+    parser.add_argument('diretorio_saida')
+    parser.add_argument('extratos', nargs='+')
+    parser.add_argument('--tipo', choices=['floresta', 'linear'], default=None)
+    parser.add_argument('--base', default=None, help="versão anterior a continuar")
+    parser.add_argument('--tamanho-bloco', type=int, default=None)
+    parser.add_argument('--max-arvores', type=int, default=500)
+    args = parser.parse_args()
+
+    if args.base:
+        treino = TreinoIncremental.continuar(args.base, tipo=args.tipo, max_arvores=args.max_arvores)
+    else:
+        treino = TreinoIncremental(args.tipo or 'floresta', max_arvores=args.max_arvores)
+
+    for extrato in args.extratos:
+        dados = carregar_e_limpar_dados(caminho_csv=extrato, tamanho_bloco=args.tamanho_bloco)
+        treino.treinar_em_fluxo([dados] if args.tamanho_bloco is None else dados)
+
+    print(f"\n📁 Versão salva em {treino.salvar(args.diretorio_saida)}")
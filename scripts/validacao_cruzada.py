@@ -0,0 +1,178 @@
+"""
+Validação Cruzada com Pré-processamento em Cache
+
+Substitui `cross_val_score(Pipeline([ColumnTransformer+OneHotEncoder, modelo]), X, y)`
+por uma codificação única dos dados: o one-hot é aprendido uma vez, a matriz
+codificada, os índices das dobras e as transformações ajustadas por dobra
+(ex.: StandardScaler) ficam em cache e as dobras rodam em paralelo.
+
+O OneHotEncoder não usa o target, então ajustá-lo uma vez em todo o X só
+acrescenta colunas zeradas para categorias ausentes em alguma dobra de treino;
+transformações que aprendem estatísticas (scaler, imputação) continuam sendo
+ajustadas apenas na dobra de treino, via `transformador`.
+
+Uso:
+    vc = ValidacaoCruzadaCache(X, y, cv=5)
+    scores = vc.avaliar(DecisionTreeClassifier(max_depth=4), scoring='accuracy')
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Memory, Parallel, delayed, hash as hash_joblib
+
+
+def _ajustar_transformar_dobra(transformador, matriz, treino, teste):
+    """
+    Ajusta `transformador` na dobra de treino e transforma treino e teste.
+    """
+    from sklearn.base import clone
+
+    ajustado = clone(transformador).fit(matriz[treino])
+    return ajustado.transform(matriz[treino]), ajustado.transform(matriz[teste])
+
+
+def _avaliar_dobra(estimador, X_treino, X_teste, y_treino, y_teste, scorer):
+    from sklearn.base import clone
+
+    return scorer(clone(estimador).fit(X_treino, y_treino), X_teste, y_teste)
+
+
+class ValidacaoCruzadaCache:
+    """
+    Validação cruzada que reaproveita a codificação e as dobras entre experimentos.
+
+    Parâmetros:
+    -----------
+    X : DataFrame
+        Features originais (colunas numéricas e categóricas)
+    y : array-like
+        Target
+    cv : int ou objeto de validação cruzada
+        Como em `cross_val_score` (int -> StratifiedKFold para classificadores,
+        KFold para regressores)
+    esparso : bool
+        Se True, a matriz codificada é CSR (útil com muitas categorias)
+    n_processos : int
+        Processos usados para avaliar as dobras (-1 = todos os núcleos)
+    diretorio_cache : str, opcional
+        Se informado, as transformações por dobra também são guardadas em
+        disco (joblib.Memory) e sobrevivem entre sessões
+
+    Atributos:
+    ----------
+    matriz : np.ndarray ou scipy.sparse.csr_matrix
+        X codificado (numéricas + one-hot)
+    feature_names : list
+        Nome de cada coluna da matriz
+    """
+
+    def __init__(self, X, y, cv=5, esparso=False, n_processos=-1, diretorio_cache=None):
+        from sklearn.preprocessing import OneHotEncoder
+
+        self.y = np.asarray(y)
+        self.cv = cv
+        self.n_processos = n_processos
+
+        colunas_cat = X.select_dtypes(include=['object', 'string', 'category', 'bool']).columns.tolist()
+        colunas_num = [c for c in X.columns if c not in colunas_cat]
+
+        self.encoder = OneHotEncoder(handle_unknown='ignore', sparse_output=esparso)
+        cat = self.encoder.fit_transform(X[colunas_cat].astype(str)) if colunas_cat else None
+        num = X[colunas_num].to_numpy(dtype=np.float64)
+
+        if esparso:
+            from scipy import sparse
+            partes = [sparse.csr_matrix(num)] + ([cat] if cat is not None else [])
+            self.matriz = sparse.hstack(partes, format='csr')
+        else:
+            self.matriz = num if cat is None else np.hstack([num, cat])
+
+        self.feature_names = colunas_num + (
+            self.encoder.get_feature_names_out(colunas_cat).tolist() if colunas_cat else []
+        )
+
+        self._dobras = {}
+        self._transformacoes = {}
+        self._scores = {}
+        self._memoria = Memory(diretorio_cache, verbose=0) if diretorio_cache else None
+
+    def dobras(self, classificador=True):
+        """
+        Lista de (índices_treino, índices_teste), calculada uma única vez.
+        """
+        if classificador not in self._dobras:
+            from sklearn.model_selection import check_cv
+            divisor = check_cv(self.cv, self.y, classifier=classificador)
+            self._dobras[classificador] = list(divisor.split(self.matriz, self.y))
+        return self._dobras[classificador]
+
+    def _dados_dobras(self, dobras, transformador):
+        """
+        (X_treino, X_teste) de cada dobra; com `transformador`, vêm do cache.
+        """
+        if transformador is None:
+            return [(self.matriz[treino], self.matriz[teste]) for treino, teste in dobras]
+
+        chave = (hash_joblib(transformador), id(dobras))
+        if chave not in self._transformacoes:
+            funcao = _ajustar_transformar_dobra
+            if self._memoria is not None:
+                funcao = self._memoria.cache(_ajustar_transformar_dobra)
+            self._transformacoes[chave] = [
+                funcao(transformador, self.matriz, treino, teste) for treino, teste in dobras
+            ]
+        return self._transformacoes[chave]
+
+    def avaliar(self, estimador, scoring=None, transformador=None):
+        """
+        Avalia o estimador em todas as dobras, como `cross_val_score`.
+
+        Parâmetros:
+        -----------
+        estimador : estimador do scikit-learn (não ajustado)
+        scoring : str ou callable, opcional
+            Métrica no formato do scikit-learn (padrão: `estimador.score`)
+        transformador : transformador do scikit-learn, opcional
+            Etapa ajustada por dobra antes do modelo (ex.: StandardScaler)
+
+        Retorna:
+        --------
+        np.ndarray com o score de cada dobra
+        """
+        from sklearn.base import is_classifier
+        from sklearn.metrics import check_scoring
+
+        chave = (hash_joblib(estimador), hash_joblib(scoring), hash_joblib(transformador))
+        if chave in self._scores:
+            return self._scores[chave].copy()
+
+        dobras = self.dobras(is_classifier(estimador))
+        dados = self._dados_dobras(dobras, transformador)
+        scorer = check_scoring(estimador, scoring=scoring)
+
+        scores = Parallel(n_jobs=self.n_processos)(
+            delayed(_avaliar_dobra)(estimador, X_treino, X_teste,
+                                    self.y[treino], self.y[teste], scorer)
+            for (treino, teste), (X_treino, X_teste) in zip(dobras, dados)
+        )
+        self._scores[chave] = np.asarray(scores, dtype=np.float64)
+        return self._scores[chave].copy()
+
+    def comparar(self, estimadores, scoring=None, transformador=None):
+        """
+        Avalia vários estimadores nas mesmas dobras.
+
+        Parâmetros:
+        -----------
+        estimadores : dict
+            {nome: estimador}
+
+        Retorna:
+        --------
+        DataFrame com média e desvio padrão de cada estimador
+        """
+        linhas = {}
+        for nome, estimador in estimadores.items():
+            scores = self.avaliar(estimador, scoring=scoring, transformador=transformador)
+            linhas[nome] = {'media': scores.mean(), 'desvio_padrao': scores.std(), 'scores': scores}
+        return pd.DataFrame(linhas).T
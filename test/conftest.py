@@ -0,0 +1,46 @@
+"""
+Configuração compartilhada dos testes.
+
+Coloca scripts/ no sys.path (os módulos do projeto são importados pelo nome,
+como nos notebooks) e oferece a fábrica de clientes sintéticos no formato do
+Telco usada pelos testes de codificação, treino e pontuação.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+COLUNAS_CLIENTES = ['tenure', 'MonthlyCharges', 'Contract', 'InternetService', 'PaperlessBilling']
+
+
+def gerar_clientes(n=800, semente=0, colunas=COLUNAS_CLIENTES):
+    """
+    Clientes sintéticos e o target, com churn concentrado em contratos
+    mensais de clientes recentes (mais 10% de ruído).
+
+    Retorna:
+    --------
+    tuple: (X com `colunas`, y 'Yes'/'No' como np.ndarray)
+    """
+    rng = np.random.default_rng(semente)
+    X = pd.DataFrame({
+        'tenure': rng.integers(0, 72, n),
+        'MonthlyCharges': rng.uniform(18, 120, n),
+        'Contract': rng.choice(['Month-to-month', 'One year', 'Two year'], n),
+        'InternetService': rng.choice(['DSL', 'Fiber optic', 'No'], n),
+        'PaperlessBilling': rng.choice(['No', 'Yes'], n),
+    })
+    churn = ((X['Contract'] == 'Month-to-month') & (X['tenure'] < 24) & (rng.random(n) < 0.8)
+             | (rng.random(n) < 0.1))
+    return X[list(colunas)], np.where(churn, 'Yes', 'No')
+
+
+@pytest.fixture(scope='session')
+def clientes():
+    """Fábrica `gerar_clientes(n, semente, colunas)`."""
+    return gerar_clientes
@@ -0,0 +1,45 @@
+"""
+Testes da busca com successive halving, contra HalvingGridSearchCV aplicado
+direto à matriz do get_dummies.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.metrics import f1_score, make_scorer
+from sklearn.model_selection import HalvingGridSearchCV, StratifiedKFold
+from sklearn.tree import DecisionTreeClassifier
+
+from ajuste_hiperparametros import ajustar_hiperparametros, salvar_melhor_configuracao
+from artefatos import carregar_modelo_completo
+
+COLUNAS = ['tenure', 'MonthlyCharges', 'Contract', 'InternetService']
+GRADE = {'max_depth': [2, 4, 8, None], 'min_samples_leaf': [1, 10, 40]}
+
+
+def test_melhores_parametros_iguais_ao_halving_direto(clientes, tmp_path, monkeypatch):
+    X, y = clientes(1500, colunas=COLUNAS)
+    y = pd.Series(y)
+    resultado = ajustar_hiperparametros(X, y, modelos=['Decision Tree'], grades={'Decision Tree': GRADE},
+                                        n_processos=1)
+
+    matriz = pd.get_dummies(X, drop_first=True).astype(np.float64).to_numpy()
+    referencia = HalvingGridSearchCV(
+        DecisionTreeClassifier(random_state=42), GRADE, factor=3,
+        cv=StratifiedKFold(n_splits=5, shuffle=True, random_state=42),
+        scoring=make_scorer(f1_score, pos_label='Yes'), random_state=42
+    ).fit(matriz, y)
+
+    assert resultado['melhor_modelo'] == 'Decision Tree'
+    assert resultado['resultados']['Decision Tree']['parametros'] == referencia.best_params_
+    assert resultado['configuracao']['score_cv'] == referencia.best_score_
+    assert resultado['resultados']['Decision Tree']['n_candidatos'] == referencia.n_candidates_[0] == 12
+
+    monkeypatch.chdir(tmp_path)
+    salvar_melhor_configuracao(resultado, caminho_bundle='bundle_modelo')
+    with open('configuracao_modelo.json', encoding='utf-8') as f:
+        assert json.load(f)['parametros'] == referencia.best_params_
+    modelo, feature_columns, _, codificador = carregar_modelo_completo('bundle_modelo', com_codificador=True)
+    np.testing.assert_array_equal(modelo.predict(codificador.transformar(X)), referencia.predict(matriz))
@@ -0,0 +1,96 @@
+"""
+Testes da análise de ROI, contra uma matriz de confusão por limiar e
+calcular_roi_retencao.
+"""
+
+import numpy as np
+import pytest
+from sklearn.metrics import confusion_matrix
+
+from analise_roi import contagens_por_limiar, simular_roi, superficie_roi
+from funcoes_auxiliares import calcular_roi_retencao
+
+
+def _dados(n=5000, semente=0):
+    rng = np.random.default_rng(semente)
+    y = np.where(rng.random(n) < 0.27, 'Yes', 'No')
+    probabilidade = np.clip(rng.normal(np.where(y == 'Yes', 0.65, 0.35), 0.2), 0, 1)
+    # Empates exatos com a grade de limiares
+    probabilidade[:300] = np.round(probabilidade[:300], 2)
+    return probabilidade, y
+
+
+def test_contagens_iguais_a_confusion_matrix():
+    probabilidade, y = _dados()
+    limiares = np.linspace(0, 1, 101)[::-1]  # fora de ordem de propósito
+    contagens = contagens_por_limiar(probabilidade, y, limiares)
+    assert list(contagens.index) == sorted(limiares)
+
+    for limiar, linha in contagens.iterrows():
+        previsto = np.where(probabilidade >= limiar, 'Yes', 'No')
+        vn, fp, fn, vp = confusion_matrix(y, previsto, labels=['No', 'Yes']).ravel()
+        assert (linha['VP'], linha['FP'], linha['FN'], linha['VN']) == (vp, fp, fn, vn)
+
+
+def test_superficie_igual_a_calcular_roi_retencao(capsys):
+    probabilidade, y = _dados()
+    resultado = superficie_roi(probabilidade, y, ltv=[1500, 2000], custo_retencao=[200, 300],
+                               taxa_sucesso=[0.4, 0.6], relatorio=False)
+    contagens = resultado['contagens']
+    for i, (limiar, linha) in enumerate(contagens.iloc[::10].iterrows()):
+        for j, ltv in enumerate([1500, 2000]):
+            for k, custo in enumerate([200, 300]):
+                for m, taxa in enumerate([0.4, 0.6]):
+                    referencia = calcular_roi_retencao(*linha[['VP', 'FP', 'FN', 'VN']].astype(int),
+                                                       ltv=ltv, custo_retencao=custo, taxa_sucesso=taxa)
+                    assert resultado['roi'][10 * i, j, k, m] == referencia['roi']
+                    assert resultado['roi_percentual'][10 * i, j, k, m] == pytest.approx(referencia['roi_percentual'])
+    capsys.readouterr()
+
+    assert resultado['melhor']['roi'] == resultado['roi'].max()
+    np.testing.assert_array_equal(resultado['roi_otimo'], resultado['roi'].max(axis=0))
+
+
+def test_pos_label_ausente():
+    probabilidade, y = _dados(n=200)
+    with pytest.raises(ValueError, match='pos_label'):
+        contagens_por_limiar(probabilidade, (y == 'Yes').astype(int), [0.5])
+    contagens = contagens_por_limiar(probabilidade, (y == 'Yes').astype(int), [0.5], pos_label=1)
+    assert contagens['VP'].iloc[0] + contagens['FN'].iloc[0] == (y == 'Yes').sum()
+    # Amostra só com negativos é válida
+    assert contagens_por_limiar(probabilidade, np.full(200, 'No'), [0.5])['VP'].iloc[0] == 0
+
+
+def test_simulacao_independe_dos_processos():
+    argumentos = dict(VP=300, FP=150, FN=80, VN=1500, n_cenarios=30_000, tamanho_fatia=7_000, relatorio=False)
+    serial = simular_roi(**argumentos)
+    paralelo = simular_roi(**argumentos, n_processos=2)
+    np.testing.assert_array_equal(serial['roi'], paralelo['roi'])
+
+    inferior, superior = serial['intervalo_confianca']
+    assert inferior < serial['mediana'] < superior
+    assert np.mean((serial['roi'] >= inferior) & (serial['roi'] <= superior)) == pytest.approx(0.95, abs=0.002)
+
+
+def test_simulacao_sem_incerteza_e_a_media_da_binomial():
+    resultado = simular_roi(300, 150, 80, 1500, n_cenarios=50_000, incerteza_ltv=0, incerteza_custo=0,
+                            concentracao_taxa=None, relatorio=False)
+    # Taxa fixa: salvos ~ Binomial(300, 0.6), média 180 clientes
+    assert resultado['media'] == pytest.approx(180 * 2000 - 450 * 300, rel=2e-3)
+    assert resultado['desvio_padrao'] == pytest.approx(2000 * np.sqrt(300 * 0.6 * 0.4), rel=0.03)
+
+
+def test_simulacao_com_taxas_extremas():
+    tudo = simular_roi(300, 150, 80, 1500, n_cenarios=1000, taxa_sucesso=1.0, incerteza_ltv=0,
+                       incerteza_custo=0, relatorio=False)
+    np.testing.assert_array_equal(tudo['roi'], 300 * 2000 - 450 * 300)
+    nada = simular_roi(300, 150, 80, 1500, n_cenarios=1000, taxa_sucesso=0.0, relatorio=False)
+    assert (nada['roi'] < 0).all() and nada['prob_prejuizo'] == 1.0
+    fixa = simular_roi(300, 150, 80, 1500, n_cenarios=1000, concentracao_taxa=np.inf, relatorio=False)
+    assert np.isfinite(fixa['roi']).all()
+
+
+@pytest.mark.parametrize('n_cenarios', [0, -5])
+def test_simulacao_sem_cenarios(n_cenarios):
+    with pytest.raises(ValueError, match='n_cenarios'):
+        simular_roi(300, 150, 80, 1500, n_cenarios=n_cenarios, relatorio=False)
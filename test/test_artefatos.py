@@ -0,0 +1,94 @@
+"""
+Testes do cache de artefatos e da recarga a quente.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from sklearn.tree import DecisionTreeClassifier
+
+from artefatos import ArtefatosAoVivo, carregar_modelo_completo, salvar_modelo_completo
+from codificador import CodificadorCategorico
+
+
+def _treinar(profundidade, semente=0, n=600):
+    rng = np.random.default_rng(semente)
+    X = pd.DataFrame({'tenure': rng.integers(0, 72, n),
+                      'Contract': rng.choice(['Month-to-month', 'One year', 'Two year'], n)})
+    y = np.where((X['tenure'] < 20) | (rng.random(n) < 0.2), 'Yes', 'No')
+    codificador = CodificadorCategorico().ajustar(X)
+    modelo = DecisionTreeClassifier(max_depth=profundidade, random_state=0)
+    return modelo.fit(codificador.transformar(X), y), codificador
+
+
+def _salvar(diretorio, modelo, codificador, bundle=False):
+    caminhos = {nome: os.path.join(diretorio, arquivo) for nome, arquivo in
+                [('caminho_modelo', 'modelo_final.pkl'), ('caminho_features', 'feature_columns.pkl'),
+                 ('caminho_scaler', 'scaler.pkl'), ('caminho_codificador', 'codificador.pkl')]}
+    salvar_modelo_completo(modelo, codificador.feature_columns, codificador=codificador,
+                           caminho_bundle=os.path.join(diretorio, 'bundle') if bundle else None,
+                           caminho_configuracao=os.path.join(diretorio, 'configuracao_modelo.json'),
+                           **caminhos)
+    return caminhos
+
+
+def test_cache_devolve_os_mesmos_objetos_ate_o_arquivo_mudar(tmp_path, capsys):
+    caminhos = _salvar(str(tmp_path), *_treinar(2))
+    primeiro = carregar_modelo_completo(**caminhos)
+    assert carregar_modelo_completo(**caminhos)[0] is primeiro[0]
+    assert carregar_modelo_completo(**caminhos, usar_cache=False)[0] is not primeiro[0]
+    assert len(primeiro) == 3 and primeiro[2] is None
+
+    _salvar(str(tmp_path), *_treinar(5))
+    os.utime(caminhos['caminho_modelo'], ns=(0, 0))  # mtime diferente mesmo em sistemas de arquivos lentos
+    assert carregar_modelo_completo(**caminhos)[0].max_depth == 5
+    capsys.readouterr()
+
+
+def test_recarga_a_quente_troca_o_modelo(tmp_path, capsys):
+    modelo, codificador = _treinar(2)
+    caminhos = _salvar(str(tmp_path), modelo, codificador, bundle=True)
+    bundle = os.path.join(str(tmp_path), 'bundle')
+    ao_vivo = ArtefatosAoVivo(bundle, caminhos['caminho_features'], caminhos['caminho_scaler'],
+                              caminhos['caminho_codificador'])
+    anterior = ao_vivo.atual
+    assert not ao_vivo.verificar()
+
+    novo, codificador = _treinar(6, semente=1)
+    _salvar(str(tmp_path), novo, codificador, bundle=True)
+    assert ao_vivo.verificar() and ao_vivo.recargas == 1
+    assert ao_vivo.atual is not anterior
+
+    X = pd.DataFrame({'tenure': np.arange(72), 'Contract': 'One year'})
+    modelo_atual, _, _, codificador_atual = ao_vivo.atual
+    np.testing.assert_array_equal(modelo_atual.predict(codificador_atual.transformar(X)),
+                                  novo.predict(codificador.transformar(X)))
+    capsys.readouterr()
+
+
+def test_pickles_nao_sao_recarregados(tmp_path, capsys):
+    caminhos = _salvar(str(tmp_path), *_treinar(2))
+    ao_vivo = ArtefatosAoVivo(**caminhos)
+    anterior = ao_vivo.atual
+
+    _salvar(str(tmp_path), *_treinar(5))
+    os.utime(caminhos['caminho_modelo'], ns=(0, 0))
+    # Modelo novo com scaler/codificador possivelmente antigos: não troca no meio da publicação
+    assert not ao_vivo.recarregavel and not ao_vivo.verificar()
+    assert ao_vivo.atual is anterior
+    ao_vivo.iniciar_monitoramento()
+    assert ao_vivo._thread is None
+    capsys.readouterr()
+
+
+def test_bundle_ignora_os_pickles_padrao(tmp_path, capsys):
+    modelo, codificador = _treinar(2)
+    caminhos = _salvar(str(tmp_path), modelo, codificador, bundle=True)
+    bundle = os.path.join(str(tmp_path), 'bundle')
+    ao_vivo = ArtefatosAoVivo(bundle, caminhos['caminho_features'], caminhos['caminho_scaler'],
+                              caminhos['caminho_codificador'])
+    os.remove(caminhos['caminho_features'])
+    assert not ao_vivo.verificar()
+    assert carregar_modelo_completo(bundle, caminhos['caminho_features'])[0] is ao_vivo.atual[0]
+    capsys.readouterr()
@@ -0,0 +1,52 @@
+"""
+Testes das árvores compiladas, contra predict_proba do scikit-learn.
+"""
+
+import numpy as np
+import pytest
+from scipy import sparse
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+from arvores_compiladas import carregar_arvores_compiladas, compilar_arvores, salvar_arvores_compiladas
+
+
+def _dados(n=3000, semente=0):
+    rng = np.random.default_rng(semente)
+    X = np.column_stack([rng.integers(0, 72, n), rng.uniform(18, 120, n),
+                         rng.integers(0, 2, (n, 6))]).astype(np.float64)
+    y = (X[:, 0] < 12) & (rng.random(n) < 0.7) | (X[:, 1] > 100) & (X[:, 2] == 1) | (rng.random(n) < 0.05)
+    return X, np.where(y, 'Yes', 'No')
+
+
+@pytest.mark.parametrize('modelo', [DecisionTreeClassifier(random_state=0),
+                                    DecisionTreeClassifier(max_depth=4, random_state=0),
+                                    RandomForestClassifier(n_estimators=25, min_samples_leaf=3, random_state=0)])
+def test_predict_proba_igual_ao_sklearn(modelo):
+    X, y = _dados()
+    modelo.fit(X[:2000], y[:2000])
+    compilado = compilar_arvores(modelo)
+
+    np.testing.assert_allclose(compilado.predict_proba(X, tamanho_bloco=700), modelo.predict_proba(X), atol=1e-12)
+    np.testing.assert_array_equal(compilado.predict(X), modelo.predict(X))
+    np.testing.assert_allclose(compilado.predict_proba(sparse.csr_matrix(X)), modelo.predict_proba(X), atol=1e-12)
+
+
+def test_npz_preserva_as_classes(tmp_path):
+    X, y = _dados()
+    modelo = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, (y == 'Yes').astype(int))
+    caminho = str(tmp_path / 'modelo.npz')
+    salvar_arvores_compiladas(compilar_arvores(modelo), caminho)
+
+    carregado = carregar_arvores_compiladas(caminho)
+    np.testing.assert_array_equal(carregado.predict(X), modelo.predict(X))
+    assert carregado.classes_.dtype.kind == 'i'
+
+
+def test_modelos_nao_suportados():
+    X, y = _dados(n=300)
+    with pytest.raises(TypeError):
+        compilar_arvores(LogisticRegression(max_iter=1000).fit(X, y))
+    with pytest.raises(ValueError):
+        compilar_arvores(DecisionTreeClassifier().fit(X, np.arange(len(y)) % 3))
@@ -0,0 +1,21 @@
+"""
+Teste da superfície de inferência: importá-la não pode puxar módulos de
+gráfico ou de treino.
+"""
+
+import json
+import subprocess
+import sys
+
+from benchmark_inicializacao import DIRETORIO_SCRIPTS, MODULOS_PROIBIDOS
+
+
+def test_importacao_sem_modulos_proibidos():
+    codigo = ("import json, sys\n"
+              "import artefatos, pontuacao_lote, bundle, arvores_compiladas\n"
+              "print(json.dumps(sorted(sys.modules)))")
+    saida = subprocess.run([sys.executable, '-c', codigo], cwd=DIRETORIO_SCRIPTS,
+                           capture_output=True, text=True, check=True)
+    modulos = json.loads(saida.stdout.strip().splitlines()[-1])
+    carregados = [m for m in modulos if m.split('.')[0] in MODULOS_PROIBIDOS]
+    assert carregados == []
@@ -0,0 +1,24 @@
+"""
+Teste do benchmark de pontuação com uma base pequena (só a estrutura das medições).
+"""
+
+import os
+
+from benchmark_pontuacao import CSV_TELCO, medir_lote, medir_passada_unica
+from funcoes_auxiliares import FEATURES_SELECIONADAS, carregar_e_limpar_dados, carregar_modelo_completo
+
+DIRETORIO_TESTE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_medicoes(capsys):
+    df = carregar_e_limpar_dados(caminho_csv=CSV_TELCO, colunas=FEATURES_SELECIONADAS + ['Churn']).head(500)
+    artefatos = carregar_modelo_completo(*(os.path.join(DIRETORIO_TESTE, nome) for nome in
+                                           ('modelo_final.pkl', 'feature_columns.pkl', 'scaler.pkl')))
+
+    lote = medir_lote(df[FEATURES_SELECIONADAS], *artefatos, individuais=10, repeticoes=1)
+    assert lote['lote_s'] > 0 and lote['aceleracao'] == lote['individual_s'] / lote['lote_s']
+
+    passada = medir_passada_unica(df, n_arvores=5, repeticoes=1)
+    assert set(passada) >= {'aceleracao_base', 'aceleracao_cliente'}
+    assert all(valor > 0 for valor in passada.values())
+    capsys.readouterr()
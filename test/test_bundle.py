@@ -0,0 +1,119 @@
+"""
+Testes do bundle versionado, contra as predições do modelo scikit-learn original.
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import (AdaBoostClassifier, ExtraTreesClassifier, GradientBoostingClassifier,
+                              RandomForestClassifier)
+from sklearn.linear_model import LogisticRegression, RidgeClassifier, SGDClassifier
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+from sklearn.svm import LinearSVC
+from sklearn.tree import DecisionTreeClassifier
+
+from bundle import carregar_bundle, resolver_bundle, salvar_bundle
+from codificador import CodificadorCategorico
+
+COLUNAS = ['tenure', 'MonthlyCharges', 'Contract']
+
+
+@pytest.mark.parametrize('modelo', [DecisionTreeClassifier(max_depth=5, random_state=0),
+                                    RandomForestClassifier(n_estimators=10, max_depth=4, random_state=0),
+                                    ExtraTreesClassifier(n_estimators=10, max_depth=4, random_state=0),
+                                    LogisticRegression(max_iter=1000),
+                                    SGDClassifier(loss='log_loss', random_state=0)])
+def test_bundle_reproduz_o_modelo(clientes, modelo, tmp_path):
+    X, y = clientes(colunas=COLUNAS)
+    codificador = CodificadorCategorico().ajustar(X)
+    scaler = StandardScaler()
+    Xs = scaler.fit_transform(np.asarray(codificador.transformar(X), dtype=np.float64))
+    modelo.fit(Xs, y)
+
+    salvar_bundle(str(tmp_path), modelo, codificador.feature_columns, scaler, codificador)
+    carregado, feature_columns, scaler_c, codificador_c = carregar_bundle(str(tmp_path), verificar_hash=True)
+
+    assert feature_columns == codificador.feature_columns
+    Xc = scaler_c.transform(codificador_c.transformar(X))
+    np.testing.assert_allclose(carregado.predict_proba(Xc), modelo.predict_proba(Xs), atol=1e-9)
+    np.testing.assert_array_equal(carregado.predict(Xc), modelo.predict(Xs))
+
+
+@pytest.mark.parametrize('rotulos', [np.array([0, 1]), np.array([False, True]), np.array(['No', 'Yes'], dtype=object)])
+def test_classes_mantem_o_tipo(clientes, rotulos, tmp_path):
+    X, y = clientes(colunas=COLUNAS)
+    Xn = X[['tenure', 'MonthlyCharges']].to_numpy(dtype=np.float64)
+    modelo = DecisionTreeClassifier(max_depth=3, random_state=0).fit(Xn, rotulos[(y == 'Yes').astype(int)])
+
+    salvar_bundle(str(tmp_path), modelo, ['tenure', 'MonthlyCharges'])
+    carregado = carregar_bundle(str(tmp_path))[0]
+
+    previsto = carregado.predict(Xn)
+    np.testing.assert_array_equal(previsto, modelo.predict(Xn))
+    # int continua int e bool continua bool; strings em object voltam como unicode
+    assert previsto.dtype.kind == {'i': 'i', 'b': 'b', 'O': 'U'}[rotulos.dtype.kind]
+
+
+def test_configuracao_com_escalares_numpy(clientes, tmp_path):
+    X, y = clientes(colunas=COLUNAS)
+    Xn = X[['tenure', 'MonthlyCharges']].to_numpy(dtype=np.float64)
+    modelo = DecisionTreeClassifier(max_depth=np.int64(3), random_state=0).fit(Xn, y)
+
+    salvar_bundle(str(tmp_path), modelo, ['tenure', 'MonthlyCharges'],
+                  configuracao={'max_depth': np.int64(3), 'limiar': np.float32(0.4)})
+    with open(os.path.join(resolver_bundle(str(tmp_path)), 'manifesto.json'), encoding='utf-8') as f:
+        manifesto = json.load(f)
+    assert manifesto['configuracao'] == {'max_depth': 3, 'limiar': pytest.approx(0.4)}
+    assert isinstance(manifesto['configuracao']['max_depth'], int)
+    assert not any(nome.endswith('.tmp') for nome in os.listdir(tmp_path))
+
+
+def test_nova_versao_nao_altera_a_publicada(clientes, tmp_path):
+    X, y = clientes(colunas=COLUNAS)
+    Xn = X[['tenure', 'MonthlyCharges']].to_numpy(dtype=np.float64)
+    antigo = DecisionTreeClassifier(max_depth=2, random_state=0).fit(Xn, y)
+    salvar_bundle(str(tmp_path), antigo, ['tenure', 'MonthlyCharges'], manter_versoes=2)
+    versao_antiga = resolver_bundle(str(tmp_path))
+    em_uso = carregar_bundle(str(tmp_path))[0]
+
+    for profundidade in (6, 8):
+        novo = DecisionTreeClassifier(max_depth=profundidade, random_state=0).fit(Xn, y)
+        salvar_bundle(str(tmp_path), novo, ['tenure', 'MonthlyCharges'], manter_versoes=2)
+
+    # Os arquivos mapeados pelo leitor não foram reescritos (a versão só foi apagada)
+    np.testing.assert_array_equal(em_uso.predict(Xn), antigo.predict(Xn))
+    assert not os.path.exists(versao_antiga)
+    assert len(os.listdir(tmp_path / 'versoes')) == 2
+    np.testing.assert_array_equal(carregar_bundle(str(tmp_path))[0].predict(Xn), novo.predict(Xn))
+
+
+@pytest.mark.parametrize('modelo', [SGDClassifier(loss='hinge', random_state=0),
+                                    SGDClassifier(loss='modified_huber', random_state=0),
+                                    LinearSVC(), RidgeClassifier(),
+                                    AdaBoostClassifier(n_estimators=5, random_state=0),
+                                    GradientBoostingClassifier(n_estimators=5, random_state=0)])
+def test_modelos_sem_probabilidade_equivalente(clientes, modelo, tmp_path):
+    X, y = clientes(colunas=COLUNAS)
+    modelo.fit(X[['tenure', 'MonthlyCharges']].to_numpy(dtype=np.float64), y)
+    with pytest.raises(TypeError):
+        salvar_bundle(str(tmp_path), modelo, ['tenure', 'MonthlyCharges'])
+
+
+def test_apenas_standard_scaler(clientes, tmp_path):
+    X, y = clientes(colunas=COLUNAS)
+    Xn = X[['tenure', 'MonthlyCharges']].to_numpy(dtype=np.float64)
+    modelo = DecisionTreeClassifier(max_depth=3, random_state=0).fit(Xn, y)
+    with pytest.raises(TypeError):
+        salvar_bundle(str(tmp_path), modelo, ['tenure', 'MonthlyCharges'], MinMaxScaler().fit(Xn))
+    assert resolver_bundle(str(tmp_path)) is None
+
+
+def test_modelo_nao_suportado_nao_publica_versao(tmp_path):
+    with pytest.raises(TypeError):
+        salvar_bundle(str(tmp_path), object(), ['tenure'])
+    assert resolver_bundle(str(tmp_path)) is None
+    with pytest.raises(FileNotFoundError):
+        carregar_bundle(str(tmp_path))
@@ -0,0 +1,157 @@
+"""
+Testes da leitura em blocos e do cache colunar, contra a leitura direta do CSV.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from funcoes_auxiliares import carregar_e_limpar_dados
+
+CSV_TELCO = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'datasets',
+                         'WA_Fn-UseC_-Telco-Customer-Churn.csv')
+
+
+@pytest.fixture
+def csv_amostra(tmp_path):
+    caminho = tmp_path / 'telco.csv'
+    pd.read_csv(CSV_TELCO, nrows=2000).to_csv(caminho, index=False)
+    return str(caminho)
+
+
+def _comparavel(df):
+    return df.reset_index(drop=True).astype(str)
+
+
+def test_blocos_iguais_a_leitura_inteira(csv_amostra):
+    inteiro = carregar_e_limpar_dados(caminho_csv=csv_amostra)
+    blocos = pd.concat(carregar_e_limpar_dados(caminho_csv=csv_amostra, tamanho_bloco=300))
+
+    assert len(blocos) == len(inteiro)
+    pd.testing.assert_frame_equal(_comparavel(blocos), _comparavel(inteiro))
+    np.testing.assert_allclose(blocos['TotalCharges'], inteiro['TotalCharges'], rtol=1e-6)
+
+
+def test_cache_parquet_igual_a_leitura_inteira(csv_amostra, tmp_path):
+    pytest.importorskip('pyarrow')
+    inteiro = carregar_e_limpar_dados(caminho_csv=csv_amostra)
+    cache = carregar_e_limpar_dados(caminho_csv=csv_amostra, usar_cache=True,
+                                    diretorio_cache=str(tmp_path / 'cache'))
+    pd.testing.assert_frame_equal(_comparavel(cache), _comparavel(inteiro))
+
+
+def test_inteiros_com_nulos_nao_interrompem_a_leitura(csv_amostra):
+    df = pd.read_csv(csv_amostra)
+    df.loc[[3, 10], 'tenure'] = np.nan
+    df.loc[5, 'SeniorCitizen'] = np.nan
+    df.to_csv(csv_amostra, index=False)
+
+    blocos = pd.concat(carregar_e_limpar_dados(caminho_csv=csv_amostra, tamanho_bloco=500))
+    assert str(blocos['tenure'].dtype) == 'Int16'
+    assert blocos['tenure'].isna().sum() == 2
+    assert blocos['SeniorCitizen'].isna().sum() == 1
+
+
+def test_categoria_desconhecida_e_avisada(csv_amostra, capsys):
+    df = pd.read_csv(csv_amostra)
+    df.loc[[1, 2], 'Contract'] = 'Three year'
+    df.to_csv(csv_amostra, index=False)
+
+    blocos = pd.concat(carregar_e_limpar_dados(caminho_csv=csv_amostra, tamanho_bloco=500))
+    saida = capsys.readouterr().out
+    assert 'Contract' in saida and 'Three year' in saida
+    assert blocos['Contract'].isna().sum() == 2
+
+
+def test_compacto_preserva_valores_e_codificacao(csv_amostra, capsys):
+    from codificador import CodificadorCategorico
+    from funcoes_auxiliares import FEATURES_SELECIONADAS, preparar_features
+
+    inteiro = carregar_e_limpar_dados(caminho_csv=csv_amostra)
+    compacto = carregar_e_limpar_dados(caminho_csv=csv_amostra, compacto=True)
+    assert compacto.attrs['memoria']['depois'] < compacto.attrs['memoria']['antes']
+    assert str(compacto['PaperlessBilling'].dtype) == 'bool'
+    assert list(compacto['Churn'].cat.categories) == ['No', 'Yes']
+    np.testing.assert_allclose(compacto['MonthlyCharges'], inteiro['MonthlyCharges'], rtol=1e-6)
+    assert (compacto['tenure'].to_numpy() == inteiro['tenure'].to_numpy()).all()
+
+    X, _ = preparar_features(inteiro)
+    X_compacto, _ = preparar_features(compacto)
+    codificador = CodificadorCategorico().ajustar(X)
+    assert CodificadorCategorico().ajustar(X_compacto).feature_columns == codificador.feature_columns
+    np.testing.assert_allclose(codificador.transformar(X_compacto), codificador.transformar(X), rtol=1e-6)
+
+    # Esquema vem de DTYPES_CHURN: blocos e leitura inteira têm os mesmos dtypes
+    blocos = pd.concat(carregar_e_limpar_dados(caminho_csv=csv_amostra, tamanho_bloco=700, compacto=True))
+    pd.testing.assert_series_equal(blocos.dtypes, compacto.dtypes)
+    pd.testing.assert_frame_equal(blocos, compacto)
+    capsys.readouterr()
+
+
+def test_compacto_nao_depende_dos_valores_do_bloco(csv_amostra, capsys):
+    from funcoes_auxiliares import compactar_dataframe
+
+    df = carregar_e_limpar_dados(caminho_csv=csv_amostra)
+    # Bloco só com 'No' e bloco com um Sim/Não ausente: mesma família de tipos
+    so_nao = compactar_dataframe(df[df['PaperlessBilling'] == 'No'], relatorio=False)
+    assert so_nao['PaperlessBilling'].dtype == bool and not so_nao['PaperlessBilling'].any()
+    com_ausente = df.head(50).copy()
+    com_ausente.loc[com_ausente.index[0], ['PaperlessBilling', 'tenure']] = np.nan
+    com_ausente = compactar_dataframe(com_ausente, relatorio=False)
+    assert str(com_ausente['PaperlessBilling'].dtype) == 'boolean'
+    assert com_ausente['PaperlessBilling'].isna().sum() == 1
+    assert str(com_ausente['tenure'].dtype) == 'Int16'
+    # Contract sempre com as três categorias do esquema, mesmo se o bloco tiver só uma
+    um_contrato = compactar_dataframe(df[df['Contract'] == 'Two year'], relatorio=False)
+    assert list(um_contrato['Contract'].cat.categories) == ['Month-to-month', 'One year', 'Two year']
+    capsys.readouterr()
+
+
+def test_preparar_features_devolve_copia(csv_amostra):
+    from funcoes_auxiliares import preparar_features
+
+    df = carregar_e_limpar_dados(caminho_csv=csv_amostra)
+    X, _ = preparar_features(df)
+    X.loc[X.index[0], 'tenure'] = -1
+    assert df['tenure'].iloc[0] != -1
+
+
+def test_cache_parquet_reaproveitado_e_renovado(csv_amostra, tmp_path, capsys):
+    pytest.importorskip('pyarrow')
+    diretorio_cache = tmp_path / 'cache'
+    carregar_e_limpar_dados(caminho_csv=csv_amostra, usar_cache=True, diretorio_cache=str(diretorio_cache))
+    (primeiro,) = diretorio_cache.glob('*.parquet')
+    mtime = primeiro.stat().st_mtime_ns
+    capsys.readouterr()
+
+    # Segunda leitura: mesmo arquivo, sem reescrever
+    carregar_e_limpar_dados(caminho_csv=csv_amostra, usar_cache=True, diretorio_cache=str(diretorio_cache))
+    assert 'Criando cache' not in capsys.readouterr().out
+    assert list(diretorio_cache.glob('*.parquet')) == [primeiro]
+    assert primeiro.stat().st_mtime_ns == mtime
+
+    # CSV alterado: novo cache, com os dados novos
+    pd.read_csv(csv_amostra).head(500).to_csv(csv_amostra, index=False)
+    novo = carregar_e_limpar_dados(caminho_csv=csv_amostra, usar_cache=True, diretorio_cache=str(diretorio_cache))
+    assert len(novo) == len(carregar_e_limpar_dados(caminho_csv=csv_amostra))
+    assert len(list(diretorio_cache.glob('*.parquet'))) == 2
+    capsys.readouterr()
+
+
+def test_cache_parquet_le_apenas_as_colunas_pedidas(csv_amostra, tmp_path, capsys):
+    pytest.importorskip('pyarrow')
+    colunas = ['tenure', 'Contract', 'Churn']
+    inteiro = carregar_e_limpar_dados(caminho_csv=csv_amostra)
+    projetado = carregar_e_limpar_dados(caminho_csv=csv_amostra, usar_cache=True, colunas=colunas,
+                                        diretorio_cache=str(tmp_path / 'cache'))
+    assert list(projetado.columns) == colunas
+    pd.testing.assert_frame_equal(_comparavel(projetado), _comparavel(inteiro[colunas]))
+
+    blocos = list(carregar_e_limpar_dados(caminho_csv=csv_amostra, usar_cache=True, colunas=colunas,
+                                          tamanho_bloco=700, diretorio_cache=str(tmp_path / 'cache')))
+    assert [len(bloco) for bloco in blocos[:-1]] == [700, 700]
+    assert all(list(bloco.columns) == colunas for bloco in blocos)
+    pd.testing.assert_frame_equal(_comparavel(pd.concat(blocos)), _comparavel(projetado))
+    capsys.readouterr()
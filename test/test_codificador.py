@@ -0,0 +1,64 @@
+"""
+Testes do codificador congelado e do carregamento de artefatos.
+"""
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from artefatos import carregar_modelo_completo
+from codificador import CodificadorCategorico
+
+
+def test_transformar_igual_a_get_dummies(clientes):
+    X = clientes(500)[0]
+    codificador = CodificadorCategorico().ajustar(X)
+    referencia = pd.get_dummies(X, drop_first=True).astype(np.float64)
+
+    assert codificador.feature_columns == list(referencia.columns)
+    np.testing.assert_array_equal(np.asarray(codificador.transformar(X), dtype=np.float64),
+                                  referencia.to_numpy())
+    esparsa = codificador.transformar(X, esparso=True)
+    np.testing.assert_array_equal(esparsa.toarray(), referencia.to_numpy())
+
+
+def test_linha_unica_mantem_o_nivel(clientes):
+    X = clientes(500)[0]
+    codificador = CodificadorCategorico().ajustar(X)
+    linha = X.iloc[[0]].assign(Contract='Two year')
+
+    codificada = pd.DataFrame(np.asarray(codificador.transformar(linha)),
+                              columns=codificador.feature_columns)
+    assert codificada.loc[0, 'Contract_Two year'] == 1
+    assert codificada.loc[0, 'Contract_One year'] == 0
+
+
+def test_carregar_modelo_completo_mantem_tres_valores(clientes, tmp_path):
+    from sklearn.linear_model import LogisticRegression
+
+    X = clientes(500)[0]
+    codificador = CodificadorCategorico().ajustar(X)
+    modelo = LogisticRegression(max_iter=500).fit(
+        codificador.transformar(X), np.where(X['tenure'] < 20, 'Yes', 'No'))
+    joblib.dump(modelo, tmp_path / 'modelo_final.pkl')
+    joblib.dump(codificador.feature_columns, tmp_path / 'feature_columns.pkl')
+    joblib.dump(codificador.para_dict(), tmp_path / 'codificador.pkl')
+    caminhos = [str(tmp_path / nome) for nome in
+                ('modelo_final.pkl', 'feature_columns.pkl', 'scaler.pkl', 'codificador.pkl')]
+
+    modelo_lido, feature_columns, scaler = carregar_modelo_completo(*caminhos)
+    assert feature_columns == codificador.feature_columns and scaler is None
+
+    *_, codificador_lido = carregar_modelo_completo(*caminhos, com_codificador=True)
+    assert codificador_lido.feature_columns == codificador.feature_columns
+
+
+def test_colunas_string_igual_a_object(clientes):
+    X = clientes(500)[0]
+    como_string = X.astype({c: 'string' for c in ['Contract', 'InternetService', 'PaperlessBilling']})
+    codificador = CodificadorCategorico().ajustar(como_string)
+    referencia = CodificadorCategorico().ajustar(X.astype({'Contract': object}))
+
+    assert codificador.feature_columns == referencia.feature_columns
+    np.testing.assert_array_equal(np.asarray(codificador.transformar(como_string), dtype=np.float64),
+                                  np.asarray(referencia.transformar(X), dtype=np.float64))
@@ -0,0 +1,44 @@
+"""
+Testes da comparação paralela, contra o treino sequencial com as métricas do
+scikit-learn.
+"""
+
+import numpy as np
+import pytest
+from sklearn.base import clone
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from comparacao_paralela import comparar_modelos_paralelo
+
+
+def _dados(n=1500, semente=0):
+    rng = np.random.default_rng(semente)
+    X = np.column_stack([rng.integers(0, 72, n), rng.uniform(18, 120, n), rng.integers(0, 2, (n, 4))])
+    y = np.where((X[:, 0] < 18) & (rng.random(n) < 0.7) | (rng.random(n) < 0.1), 'Yes', 'No')
+    return X[:1000], X[1000:], y[:1000], y[1000:]
+
+
+@pytest.mark.parametrize('n_processos', [1, 2])
+def test_metricas_iguais_ao_treino_sequencial(n_processos):
+    X_train, X_test, y_train, y_test = _dados()
+    modelos = {
+        'Logistic Regression': (LogisticRegression(max_iter=1000), True),
+        'Decision Tree': (DecisionTreeClassifier(max_depth=4, random_state=42), False),
+    }
+    resultados, treinados = comparar_modelos_paralelo(X_train, X_test, y_train, y_test,
+                                                      {nome: (clone(est), escala) for nome, (est, escala) in modelos.items()},
+                                                      n_processos=n_processos)
+    assert list(resultados) == list(modelos)
+
+    scaler = StandardScaler().fit(X_train)
+    for nome, (estimador, usa_escala) in modelos.items():
+        Xtr, Xte = (scaler.transform(X_train), scaler.transform(X_test)) if usa_escala else (X_train, X_test)
+        y_pred = clone(estimador).fit(Xtr, y_train).predict(Xte)
+        assert resultados[nome]['acuracia'] == pytest.approx(accuracy_score(y_test, y_pred))
+        assert resultados[nome]['precisao'] == pytest.approx(precision_score(y_test, y_pred, pos_label='Yes'))
+        assert resultados[nome]['recall'] == pytest.approx(recall_score(y_test, y_pred, pos_label='Yes'))
+        assert resultados[nome]['f1_score'] == pytest.approx(f1_score(y_test, y_pred, pos_label='Yes'))
+        np.testing.assert_array_equal(treinados[nome].predict(Xte), y_pred)
@@ -0,0 +1,63 @@
+"""
+Testes do serviço de correlação, contra df.corr().
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from correlacao import ServicoCorrelacao
+
+
+def _dados(n=20_000, semente=0, nulos=False):
+    rng = np.random.default_rng(semente)
+    base = rng.normal(size=n)
+    df = pd.DataFrame({
+        'PlayTimeHours': 1e6 + base + rng.normal(scale=0.5, size=n),  # deslocamento grande
+        'PlayerLevel': rng.integers(1, 100, n).astype(float),
+        'SessionsPerWeek': np.exp(base) + rng.normal(scale=0.1, size=n),
+        'Age': rng.integers(15, 50, n),
+    })
+    if nulos:
+        for col, qtd in [('PlayTimeHours', 500), ('SessionsPerWeek', 2000)]:
+            df.loc[rng.choice(n, qtd, replace=False), col] = np.nan
+    return df
+
+
+@pytest.mark.parametrize('nulos', [False, True])
+@pytest.mark.parametrize('tamanho_bloco', [3_000, 200_000])
+def test_pearson_igual_a_df_corr(nulos, tamanho_bloco):
+    df = _dados(nulos=nulos)
+    servico = ServicoCorrelacao(df, tamanho_bloco=tamanho_bloco)
+    pd.testing.assert_frame_equal(servico.matriz(), df.corr(), atol=1e-9, rtol=0)
+
+
+@pytest.mark.parametrize('nulos', [False, True])
+def test_spearman_igual_a_df_corr(nulos):
+    df = _dados(nulos=nulos)
+    servico = ServicoCorrelacao(df, tamanho_bloco=3_000)
+    pd.testing.assert_frame_equal(servico.matriz('spearman'), df.corr(method='spearman'),
+                                  atol=1e-9, rtol=0)
+
+
+def test_csv_em_blocos_e_par(tmp_path):
+    df = _dados(nulos=True)
+    caminho = tmp_path / 'dados.csv'
+    df.to_csv(caminho, index=False)
+    servico = ServicoCorrelacao(str(caminho), colunas=list(df.columns), tamanho_bloco=4_000)
+    pd.testing.assert_frame_equal(servico.matriz(), df.corr(), atol=1e-9, rtol=0)
+    assert servico.par('PlayerLevel', 'Age') == pytest.approx(df['PlayerLevel'].corr(df['Age']), abs=1e-9)
+
+
+def test_coluna_constante_e_poucos_pares():
+    df = _dados(n=500).assign(Constante=7.0)
+    df.loc[2:, 'Age'] = np.nan  # só 2 linhas válidas
+    df.loc[1:, 'PlayerLevel'] = np.nan  # só 1 linha válida
+    pd.testing.assert_frame_equal(ServicoCorrelacao(df).matriz(), df.corr(), atol=1e-9, rtol=0)
+
+
+def test_metodo_invalido_e_cache():
+    servico = ServicoCorrelacao(_dados(n=100))
+    with pytest.raises(ValueError):
+        servico.matriz('kendall')
+    assert servico.matriz() is servico.matriz()
@@ -0,0 +1,91 @@
+"""
+Testes dos gráficos amostrados: orçamento da amostra, histogramas e valores não finitos.
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from graficos_amostrados import (amostra_estratificada, dispersao_amostrada, escolher_modo,
+                                 pairplot_amostrado)
+
+
+def _dados(n=60_000, semente=0):
+    rng = np.random.default_rng(semente)
+    return pd.DataFrame({
+        'a': rng.normal(size=n),
+        'b': rng.exponential(size=n),
+        'c': rng.integers(0, 100, n).astype(float),
+        'g': rng.choice(['x', 'y', 'z'], n, p=[0.7, 0.25, 0.05]),
+    })
+
+
+@pytest.mark.parametrize('orcamento', [1, 2, 3, 50, 1000, 20_000])
+def test_amostra_respeita_o_orcamento(orcamento):
+    df = _dados()
+    # 3 estratos comuns + 40 raros: o mínimo de 1 por estrato não pode estourar o orçamento
+    df.loc[df.index[:40], 'g'] = [f'raro{i}' for i in range(40)]
+    amostra = amostra_estratificada(df, orcamento, 'g')
+    assert len(amostra) <= orcamento
+    assert not amostra.index.duplicated().any()
+
+
+def test_amostra_preserva_proporcoes():
+    df = _dados()
+    amostra = amostra_estratificada(df, 6000, 'g')
+    assert len(amostra) == 6000
+    pd.testing.assert_series_equal(amostra['g'].value_counts(normalize=True),
+                                   df['g'].value_counts(normalize=True), atol=0.005, check_names=False)
+
+
+def test_escolher_modo():
+    assert escolher_modo(1000) == 'completo'
+    assert escolher_modo(10**6) == 'densidade'
+    assert escolher_modo(10**6, hue='g') == 'amostra'
+    with pytest.raises(ValueError):
+        escolher_modo(10, modo='hexbin')
+
+
+def test_histogramas_da_diagonal_usam_todas_as_linhas():
+    df = _dados()
+    grade = pairplot_amostrado(df, ['a', 'b'], diag_kws={'bins': 25})
+    assert grade.modo == 'densidade' and grade.n_pontos == len(df)
+    alturas = [barra.get_height() for barra in grade.diag_axes[0].patches]
+    np.testing.assert_array_equal(alturas, np.histogram(df['a'], bins=25)[0])
+    plt.close(grade.fig)
+
+
+@pytest.mark.parametrize('modo', ['densidade', 'amostra', 'completo'])
+def test_valores_infinitos_sao_ignorados(modo):
+    df = _dados()
+    df.loc[df.index[:5], 'a'] = np.inf
+    df.loc[df.index[5:8], 'b'] = -np.inf
+    df.loc[df.index[8:20], 'c'] = np.nan
+    grade = pairplot_amostrado(df, ['a', 'b', 'c'], modo=modo)
+    grade.fig.canvas.draw()
+    assert sum(barra.get_height() for barra in grade.diag_axes[0].patches) == len(df) - 5
+    plt.close(grade.fig)
+
+    fig, ax = plt.subplots()
+    assert dispersao_amostrada(ax, df['a'], df['b'], modo=modo) == modo
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def test_modo_completo_usa_o_pairplot_do_seaborn():
+    import seaborn as sns
+
+    df = _dados(n=2000)
+    grade = pairplot_amostrado(df, ['a', 'b'], hue='g', diag_kws={'bins': 20})
+    referencia = sns.pairplot(df[['a', 'b', 'g']], vars=['a', 'b'], hue='g', diag_kind='hist',
+                              height=2.5, diag_kws={'bins': 20})
+    assert grade.modo == 'completo' and grade.n_pontos == len(df)
+    # Mesmos pontos por grupo e mesma legenda que o sns.pairplot direto
+    assert ([len(c.get_offsets()) for c in grade.axes[1, 0].collections]
+            == [len(c.get_offsets()) for c in referencia.axes[1, 0].collections])
+    assert grade.fig.legends and grade.fig.legends[0].get_title().get_text() == 'g'
+    plt.close(grade.fig)
+    plt.close(referencia.figure)
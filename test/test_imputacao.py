@@ -0,0 +1,95 @@
+"""
+Testes do imputador em fluxo, contra median()/mode()/mean() do pandas.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from imputacao import ImputadorAproximado
+
+
+def _dados(n=200_000, semente=0):
+    rng = np.random.default_rng(semente)
+    df = pd.DataFrame({
+        'TotalCharges': rng.lognormal(7, 1, n),
+        'tenure': rng.integers(0, 72, n).astype(float),
+        'Contract': rng.choice(['Month-to-month', 'One year', 'Two year'], n, p=[0.55, 0.25, 0.2]),
+        'PaymentMethod': rng.choice(['Electronic check', 'Mailed check', 'Bank transfer'], n),
+    })
+    for col in df.columns:
+        df.loc[rng.choice(n, n // 50, replace=False), col] = np.nan
+    return df
+
+
+def _blocos(df, tamanho=30_000):
+    return (df.iloc[i:i + tamanho] for i in range(0, len(df), tamanho))
+
+
+def _posto(serie, valor):
+    return (serie.dropna() < valor).mean()
+
+
+def test_valores_proximos_do_pandas():
+    df = _dados()
+    imputador = ImputadorAproximado(estrategias={'tenure': 'media'}).ajustar(_blocos(df))
+
+    assert imputador.estrategias['TotalCharges'] == 'mediana'
+    assert _posto(df['TotalCharges'], imputador.valores['TotalCharges']) == pytest.approx(0.5, abs=0.01)
+    assert imputador.valores['tenure'] == pytest.approx(df['tenure'].mean(), rel=1e-12)
+    assert imputador.valores['Contract'] == df['Contract'].mode()[0]
+    assert imputador.contagens['Contract'] == df['Contract'].notna().sum()
+
+
+def test_mesclar_igual_a_um_ajuste():
+    df = _dados(n=60_000)
+    metades = [ImputadorAproximado().ajustar(parte) for parte in (df.iloc[:25_000], df.iloc[25_000:])]
+    mesclado = metades[0].mesclar(metades[1]).finalizar()
+
+    assert mesclado.valores['Contract'] == df['Contract'].mode()[0]
+    assert mesclado.contagens['TotalCharges'] == df['TotalCharges'].notna().sum()
+    assert _posto(df['TotalCharges'], mesclado.valores['TotalCharges']) == pytest.approx(0.5, abs=0.01)
+
+
+def test_transformar_igual_a_fillna(tmp_path, capsys):
+    df = _dados(n=20_000)
+    imputador = ImputadorAproximado().ajustar(df)
+    imputador.salvar(str(tmp_path / 'imputador.pkl'))
+    carregado = ImputadorAproximado.carregar(str(tmp_path / 'imputador.pkl'))
+
+    esperado = df.fillna(imputador.valores)
+    pd.testing.assert_frame_equal(carregado.transformar(df), esperado)
+    pd.testing.assert_frame_equal(pd.concat(carregado.transformar_em_fluxo(_blocos(df, 3_000))), esperado)
+    assert not esperado.isna().any().any()
+    capsys.readouterr()
+
+
+def test_coluna_toda_nula_nao_e_preenchida():
+    df = _dados(n=1_000).assign(vazia=np.nan)
+    imputador = ImputadorAproximado().ajustar(df)
+    assert np.isnan(imputador.valores['vazia'])
+    assert imputador.transformar(df)['vazia'].isna().all()
+
+
+def test_estrategia_revista_por_bloco_posterior(capsys):
+    numerico = pd.DataFrame({'plano': [1.0, 2.0, 2.0, np.nan], 'vazia': np.nan})
+    texto = pd.DataFrame({'plano': ['Premium', 'Premium', 'Premium', None], 'vazia': ['a', 'b', 'b', None]})
+    imputador = ImputadorAproximado().ajustar([numerico, texto])
+
+    assert imputador.estrategias == {'plano': 'moda', 'vazia': 'moda'}
+    assert imputador.valores['plano'] == 'Premium' and imputador.contagens['plano'] == 6
+    assert imputador.valores['vazia'] == 'b'
+    assert 'plano' in capsys.readouterr().out
+
+    # Ajustes em paralelo: um lado ainda numérico, o outro já revisto
+    mesclado = ImputadorAproximado().ajustar_parcial(numerico).mesclar(
+        ImputadorAproximado().ajustar_parcial(texto)).finalizar()
+    assert mesclado.estrategias['plano'] == 'moda' and mesclado.contagens['plano'] == 6
+    capsys.readouterr()
+
+
+def test_estrategia_pelo_tipo_declarado():
+    texto = pd.DataFrame({'TotalCharges': ['10.5', '20.0', '30.0', None]})
+    imputador = ImputadorAproximado(dtypes={'TotalCharges': 'float32'}).ajustar(texto)
+    assert imputador.estrategias['TotalCharges'] == 'mediana'
+    assert imputador.valores['TotalCharges'] == pytest.approx(20.0)
@@ -0,0 +1,75 @@
+"""
+Testes do acumulador de métricas, contra o scikit-learn.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn import metrics
+
+from metricas import AcumuladorMetricas, metricas_em_fluxo
+
+
+def _scores(n=20_000, semente=0):
+    rng = np.random.default_rng(semente)
+    y_true = np.where(rng.random(n) < 0.27, 'Yes', 'No')
+    probabilidade = np.clip(rng.normal(np.where(y_true == 'Yes', 0.6, 0.35), 0.2), 0, 1)
+    y_pred = np.where(probabilidade >= 0.5, 'Yes', 'No')
+    return y_true, y_pred, probabilidade
+
+
+def test_metricas_iguais_ao_sklearn():
+    y_true, y_pred, probabilidade = _scores()
+    acumulador = AcumuladorMetricas(n_faixas=10_000)
+    for partes in zip(*(np.array_split(v, 7) for v in (y_true, y_pred, probabilidade))):
+        acumulador.atualizar(*partes)
+    resultado = acumulador.metricas()
+
+    assert resultado['acuracia'] == pytest.approx(metrics.accuracy_score(y_true, y_pred))
+    assert resultado['precisao'] == pytest.approx(metrics.precision_score(y_true, y_pred, pos_label='Yes'))
+    assert resultado['recall'] == pytest.approx(metrics.recall_score(y_true, y_pred, pos_label='Yes'))
+    assert resultado['f1_score'] == pytest.approx(metrics.f1_score(y_true, y_pred, pos_label='Yes'))
+    assert resultado['roc_auc'] == pytest.approx(metrics.roc_auc_score(y_true == 'Yes', probabilidade), abs=1e-4)
+    np.testing.assert_array_equal(acumulador.matriz_confusao(),
+                                  metrics.confusion_matrix(y_true, y_pred, labels=['No', 'Yes']))
+    assert acumulador.relatorio_classificacao() == metrics.classification_report(
+        y_true, y_pred, target_names=['Não Churn', 'Churn'])
+
+
+def test_mesclar_igual_a_um_acumulador():
+    y_true, y_pred, probabilidade = _scores()
+    unico = AcumuladorMetricas().atualizar(y_true, y_pred, probabilidade)
+    a = AcumuladorMetricas().atualizar(y_true[:5000], y_pred[:5000], probabilidade[:5000])
+    b = AcumuladorMetricas().atualizar(y_true[5000:], y_pred[5000:], probabilidade[5000:])
+    soma = a + b
+    np.testing.assert_array_equal(soma.matriz_confusao(), unico.matriz_confusao())
+    assert soma.roc_auc() == unico.roc_auc()
+
+
+def test_rotulos_inteiros_e_booleanos():
+    y_true, y_pred, _ = _scores()
+    inteiros = (y_true == 'Yes').astype(int), (y_pred == 'Yes').astype(int)
+    resultado = AcumuladorMetricas(pos_label=1).atualizar(*inteiros).metricas()
+    assert resultado['f1_score'] == pytest.approx(metrics.f1_score(*inteiros))
+
+    booleanos = y_true == 'Yes', y_pred == 'Yes'
+    resultado = AcumuladorMetricas(pos_label=True).atualizar(*booleanos).metricas()
+    assert resultado['recall'] == pytest.approx(metrics.recall_score(*booleanos))
+
+
+@pytest.mark.parametrize('y_true, y_pred', [
+    ([0, 1, 1, 0], [0, 1, 0, 0]),
+    ([True, False], [True, True]),
+    ([0, 0, 0], [0, 0, 0]),
+    (['No', 'Sim'], ['No', 'No']),
+])
+def test_pos_label_ausente_gera_erro(y_true, y_pred):
+    with pytest.raises(ValueError, match='pos_label'):
+        AcumuladorMetricas().atualizar(y_true, y_pred)
+
+
+def test_lote_so_com_negativos_e_valido():
+    blocos = [pd.DataFrame({'Churn': ['No', 'No'], 'classe': ['No', 'No']}),
+              pd.DataFrame({'Churn': ['Yes', 'No'], 'classe': ['Yes', 'Yes']})]
+    acumulador = metricas_em_fluxo(blocos)
+    np.testing.assert_array_equal(acumulador.matriz_confusao(), [[2, 1], [0, 1]])
@@ -0,0 +1,99 @@
+"""
+Testes do perfil em uma passada e dos sketches, contra as referências do pandas.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from perfil_eda import PerfilDados, perfilar
+from sketches import ContadorFrequentes, EstimadorDistintos, SketchQuantis
+
+
+def _dados(n, duplicatas, semente=0):
+    rng = np.random.default_rng(semente)
+    df = pd.DataFrame({
+        'a': rng.normal(size=n),
+        'b': rng.integers(0, 10**9, n),
+        'c': rng.choice(['x', 'y', 'z'], n, p=[0.6, 0.3, 0.1]),
+    })
+    df.loc[rng.choice(n, n // 20, replace=False), 'a'] = np.nan
+    repetidas = df.sample(duplicatas, random_state=semente)
+    return pd.concat([df, repetidas], ignore_index=True)
+
+
+@pytest.mark.parametrize('n, duplicatas', [(200_000, 50), (50_000, 0), (20_000, 5000)])
+def test_duplicatas_exatas(n, duplicatas):
+    df = _dados(n, duplicatas)
+    perfil = perfilar(df, tamanho_bloco=30_000)
+    assert perfil.duplicatas == df.duplicated().sum() == duplicatas
+
+
+def test_duplicatas_entre_blocos_mesclados():
+    df = _dados(10_000, 300)
+    partes = [PerfilDados.de_bloco(df.iloc[i:i + 3000]) for i in range(0, len(df), 3000)]
+    perfil = partes[0]
+    for parte in partes[1:]:
+        perfil.mesclar(parte)
+    assert perfil.duplicatas == df.duplicated().sum()
+
+
+def test_resumo_confere_com_describe():
+    df = _dados(30_000, 0)
+    resumo = perfilar(df, tamanho_bloco=7000).resumo()
+    descricao = df.describe()
+
+    for col in ['a', 'b']:
+        assert resumo.loc[col, 'nao_nulos'] == descricao.loc['count', col]
+        assert resumo.loc[col, 'nulos'] == df[col].isna().sum()
+        for chave, ref in [('media', 'mean'), ('desvio_padrao', 'std'), ('min', 'min'), ('max', 'max')]:
+            assert resumo.loc[col, chave] == pytest.approx(descricao.loc[ref, col], rel=1e-9)
+    assert resumo.loc['c', 'top'] == df['c'].mode()[0]
+    assert resumo.loc['c', 'freq_top'] == df['c'].value_counts().iloc[0]
+
+
+def test_sketch_quantis_erro_de_posto():
+    valores = np.random.default_rng(1).lognormal(size=500_000)
+    sketch = SketchQuantis(k=1000, semente=0)
+    for bloco in np.array_split(valores, 17):
+        sketch.atualizar(bloco)
+
+    ordenados = np.sort(valores)
+    for q in [0.1, 0.25, 0.5, 0.75, 0.9]:
+        posto = np.searchsorted(ordenados, sketch.quantis(q)) / valores.size
+        assert abs(posto - q) < 0.01
+    assert sketch.quantis(0) == valores.min() and sketch.quantis(1) == valores.max()
+
+
+def test_contador_frequentes_exato_com_poucos_distintos():
+    serie = pd.Series(np.random.default_rng(2).choice(list('abcdefg'), 10_000))
+    contador = ContadorFrequentes(capacidade=10)
+    for bloco in np.array_split(serie.to_numpy(), 4):
+        contador.atualizar(bloco)
+    pd.testing.assert_series_equal(contador.mais_frequentes(7), serie.value_counts(),
+                                   check_names=False, check_index_type=False)
+
+
+def test_estimador_distintos():
+    valores = np.random.default_rng(3).integers(0, 50_000, 200_000)
+    estimador = EstimadorDistintos(p=14)
+    for bloco in np.array_split(valores, 5):
+        estimador.atualizar(bloco)
+    assert estimador.estimativa() == pytest.approx(len(np.unique(valores)), rel=0.03)
+
+
+def test_duplicatas_estimadas_acima_do_limite():
+    df = _dados(150_000, 30_000)
+    perfil = perfilar(df, tamanho_bloco=20_000, limite_hashes_exatos=50_000)
+    assert not perfil.duplicatas_exatas
+    assert perfil._hashes_linhas is None
+    assert perfil.duplicatas == pytest.approx(df.duplicated().sum(), abs=0.01 * len(df))
+
+
+def test_duplicatas_com_int_e_float_em_blocos_diferentes():
+    primeiro = pd.DataFrame({'tenure': [1, 2, 3], 'c': ['x', 'y', 'z']})
+    segundo = pd.DataFrame({'tenure': [1.0, np.nan, 3.0], 'c': ['x', None, 'w']})
+    terceiro = pd.DataFrame({'tenure': pd.array([np.nan, 2], dtype='Int16'), 'c': pd.Categorical([None, 'y'])})
+    perfil = perfilar(iter([primeiro, segundo, terceiro]))
+    # (1, x) no segundo bloco, (NaN, None) e (2, y) no terceiro
+    assert perfil.duplicatas == 3
@@ -3,11 +3,16 @@
 Este script demonstra o uso do modelo salvo (.pkl) para prever churn de NOVOS clientes.
 """
 
+import os
+import sys
 import pandas as pd
 import joblib
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from pontuacao_lote import pontuar_lote
+
 print("=" * 80)
 print("🧪 TESTE DO MODELO SALVO - PREDIÇÃO COM DADOS NOVOS")
 print("=" * 80)
@@ -99,50 +104,20 @@ for key, value in cliente_3.items():
     print(f"      {key:20s}: {value}")
 
 # ========== 3. FUNÇÃO DE PREDIÇÃO ==========
+CORES_RISCO = {'ALTO': "🔴", 'MÉDIO': "🟡", 'BAIXO': "🟢"}
+
 def prever_churn(cliente_dict):
     """
-    Faz predição para um novo cliente.
+    Faz predição para um novo cliente (atalho para a pontuação em lote).
     """
-    # 1. Criar DataFrame
-    df_novo = pd.DataFrame([cliente_dict])
-    
-    # 2. Aplicar One-Hot Encoding (igual ao treino)
-    df_encoded = pd.get_dummies(df_novo, drop_first=True)
-    
-    # 3. Garantir mesmas colunas do treino
-    for col in feature_columns:
-        if col not in df_encoded.columns:
-            df_encoded[col] = 0
-    df_encoded = df_encoded[feature_columns]
-    
-    # 4. Aplicar scaler se necessário
-    if usa_scaler:
-        df_encoded = scaler.transform(df_encoded)
-    
-    # 5. Fazer predição
-    classe_predita = modelo.predict(df_encoded)[0]
-    probabilidade_churn = modelo.predict_proba(df_encoded)[0][1]
-    
-    # 6. Determinar risco
-    if probabilidade_churn >= 0.7:
-        risco = "ALTO"
-        cor = "🔴"
-        acao = "AÇÃO URGENTE: Contato imediato, desconto 25%, migrar para contrato anual"
-    elif probabilidade_churn >= 0.4:
-        risco = "MÉDIO"
-        cor = "🟡"
-        acao = "MONITORAR: Incluir em campanha de engajamento, oferecer upgrade"
-    else:
-        risco = "BAIXO"
-        cor = "🟢"
-        acao = "MANTER: Cliente estável, continuar comunicação regular"
+    resultado = pontuar_lote([cliente_dict], modelo, feature_columns, scaler).iloc[0]
     
     return {
-        'classe': classe_predita,
-        'probabilidade': probabilidade_churn,
-        'risco': risco,
-        'cor': cor,
-        'acao': acao
+        'classe': resultado['classe'],
+        'probabilidade': resultado['probabilidade'],
+        'risco': resultado['risco'],
+        'cor': CORES_RISCO[resultado['risco']],
+        'acao': resultado['acao']
     }
 
 # ========== 4. FAZER PREDIÇÕES ==========
@@ -156,13 +131,16 @@ clientes = [
     ("CLIENTE 3 - Risco Médio", cliente_3)
 ]
 
+# Todos os clientes são pontuados em uma única chamada vetorizada
+df_predicoes = pontuar_lote([dados for _, dados in clientes], modelo, feature_columns, scaler)
+
 resultados = []
 
-for nome, dados in clientes:
+for (nome, dados), (_, resultado) in zip(clientes, df_predicoes.iterrows()):
     print(f"\n{nome}:")
     print("-" * 80)
     
-    resultado = prever_churn(dados)
+    resultado = dict(resultado, cor=CORES_RISCO[resultado['risco']])
     
     print(f"   {resultado['cor']} RISCO: {resultado['risco']}")
     print(f"   📊 Probabilidade de Churn: {resultado['probabilidade']:.1%}")
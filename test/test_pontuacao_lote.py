@@ -0,0 +1,148 @@
+"""
+Testes da pontuação em lote, contra get_dummies + reindex + predict_proba
+(o caminho cliente a cliente que ela substitui).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from codificador import CodificadorCategorico
+from pontuacao_lote import classificar_probabilidades, pontuar_em_fluxo, pontuar_lote
+
+
+@pytest.fixture(scope='module')
+def treinado(clientes):
+    X = clientes(2000)[0]
+    dummies = pd.get_dummies(X, drop_first=True).astype(np.float64)
+    y = np.where((X['Contract'] == 'Month-to-month') & (X['tenure'] < 24), 'Yes', 'No')
+    # Scaler ajustado em DataFrame (com nomes), modelo em array: como no notebook 02
+    scaler = StandardScaler().fit(dummies)
+    modelo = LogisticRegression(max_iter=1000).fit(scaler.transform(dummies), y)
+    return modelo, list(dummies.columns), scaler
+
+
+def _referencia(df, modelo, feature_columns, scaler):
+    # Uma linha por vez, como o antigo prever_churn
+    probabilidades = []
+    for _, cliente in df.iterrows():
+        linha = pd.get_dummies(pd.DataFrame([cliente]).infer_objects())
+        linha = linha.reindex(columns=feature_columns, fill_value=0).astype(np.float64)
+        probabilidades.append(modelo.predict_proba(scaler.transform(linha))[0, 1])
+    return np.array(probabilidades)
+
+
+@pytest.mark.filterwarnings('error::UserWarning')
+def test_lote_igual_a_predicao_individual(clientes, treinado):
+    modelo, feature_columns, scaler = treinado
+    novos = clientes(150, 1)[0]
+    resultado = pontuar_lote(novos, modelo, feature_columns, scaler)
+
+    np.testing.assert_allclose(resultado['probabilidade'], _referencia(novos, modelo, feature_columns, scaler),
+                               atol=1e-12)
+    np.testing.assert_array_equal(resultado['classe'],
+                                  np.where(resultado['probabilidade'] >= 0.5, 'Yes', 'No'))
+    assert resultado.index.equals(novos.index)
+
+
+def test_entradas_e_fluxo_equivalentes(clientes, treinado):
+    modelo, feature_columns, scaler = treinado
+    novos = clientes(500, 2)[0]
+    codificador = CodificadorCategorico().ajustar(clientes(2000)[0])
+    inteiro = pontuar_lote(novos, modelo, feature_columns, scaler)
+
+    pd.testing.assert_frame_equal(pontuar_lote(novos, modelo, feature_columns, scaler, codificador), inteiro)
+    pd.testing.assert_frame_equal(
+        pontuar_lote(novos.to_dict('records'), modelo, feature_columns, scaler).set_index(novos.index), inteiro)
+    fluxo = pd.concat(pontuar_em_fluxo((novos.iloc[i:i + 120] for i in range(0, 500, 120)),
+                                       modelo, feature_columns, scaler))
+    pd.testing.assert_frame_equal(fluxo, inteiro)
+
+    unico = pontuar_lote(novos.iloc[0].to_dict(), modelo, feature_columns, scaler)
+    assert unico['probabilidade'].iloc[0] == pytest.approx(inteiro['probabilidade'].iloc[0])
+
+
+def test_faixas_de_risco_nos_limites():
+    probabilidade = np.array([0.0, 0.39, 0.4, 0.5, 0.69, 0.7, 1.0])
+    classe, risco = classificar_probabilidades(probabilidade, ['No', 'Yes'])
+    assert classe.tolist() == ['No', 'No', 'No', 'Yes', 'Yes', 'Yes', 'Yes']
+    assert risco.tolist() == ['BAIXO', 'BAIXO', 'MÉDIO', 'MÉDIO', 'MÉDIO', 'ALTO', 'ALTO']
+
+
+@pytest.mark.filterwarnings('error::UserWarning')
+def test_estimadores_ajustados_com_nomes_nao_avisam(clientes):
+    X = clientes(2000)[0]
+    codificador = CodificadorCategorico().ajustar(X)
+    dummies = pd.DataFrame(np.asarray(codificador.transformar(X)), columns=codificador.feature_columns)
+    y = np.where(X['tenure'] < 24, 'Yes', 'No')
+    scaler = StandardScaler().fit(dummies)
+    modelo = LogisticRegression(max_iter=1000).fit(
+        pd.DataFrame(scaler.transform(dummies), columns=codificador.feature_columns), y)
+
+    resultado = pontuar_lote(X, modelo, codificador.feature_columns, scaler, codificador)
+    np.testing.assert_allclose(resultado['probabilidade'],
+                               modelo.predict_proba(pd.DataFrame(scaler.transform(dummies),
+                                                                 columns=codificador.feature_columns))[:, 1])
+
+
+class _ModeloEspiao:
+    """Conta as chamadas ao modelo treinado que ele envolve."""
+
+    def __init__(self, modelo):
+        self.modelo = modelo
+        self.classes_ = modelo.classes_
+        self.chamadas = {'predict': 0, 'predict_proba': 0}
+
+    def predict(self, X):
+        self.chamadas['predict'] += 1
+        return self.modelo.predict(X)
+
+    def predict_proba(self, X):
+        self.chamadas['predict_proba'] += 1
+        return self.modelo.predict_proba(X)
+
+
+def test_uma_passada_e_limiares_configuraveis(clientes, treinado):
+    modelo, feature_columns, scaler = treinado
+    novos = clientes(300, 3)[0]
+    espiao = _ModeloEspiao(modelo)
+
+    resultado = pontuar_lote(novos, espiao, feature_columns, scaler, limiar=0.3, limites_risco=(0.8, 0.2))
+    assert espiao.chamadas == {'predict': 0, 'predict_proba': 1}
+
+    probabilidade = resultado['probabilidade'].to_numpy()
+    np.testing.assert_array_equal(resultado['classe'], np.where(probabilidade >= 0.3, 'Yes', 'No'))
+    np.testing.assert_array_equal(resultado['risco'], np.select([probabilidade >= 0.8, probabilidade >= 0.2],
+                                                                ['ALTO', 'MÉDIO'], 'BAIXO'))
+    # Os limiares mudam a classe de alguns clientes em relação ao padrão
+    padrao = pontuar_lote(novos, modelo, feature_columns, scaler)
+    assert (resultado['classe'] != padrao['classe']).any()
+    assert (resultado['risco'] != padrao['risco']).any()
+
+
+def test_caminho_esparso_igual_ao_denso(clientes, tmp_path):
+    from scipy import sparse
+
+    from bundle import carregar_bundle, salvar_bundle
+
+    X, y = clientes(2000)
+    codificador = CodificadorCategorico().ajustar(X)
+    matriz = codificador.transformar(X, esparso=True)
+    assert sparse.issparse(matriz) and matriz.format == 'csr'
+    np.testing.assert_allclose(matriz.toarray(), codificador.transformar(X))
+
+    # Scaler e modelo ajustados direto na CSR (with_mean=False mantém a esparsidade)
+    scaler = StandardScaler(with_mean=False).fit(matriz)
+    modelo = LogisticRegression(max_iter=1000).fit(scaler.transform(matriz), y)
+    novos = clientes(400, 4)[0]
+    denso = pontuar_lote(novos, modelo, codificador.feature_columns, scaler, codificador)
+    esparso = pontuar_lote(novos, modelo, codificador.feature_columns, scaler, codificador, esparso=True)
+    pd.testing.assert_frame_equal(esparso, denso, rtol=1e-12)
+
+    # O bundle compilado pontua a mesma CSR
+    salvar_bundle(str(tmp_path), modelo, codificador.feature_columns, scaler, codificador)
+    compilado, feature_columns, scaler_c, codificador_c = carregar_bundle(str(tmp_path))
+    pd.testing.assert_frame_equal(
+        pontuar_lote(novos, compilado, feature_columns, scaler_c, codificador_c, esparso=True), denso, rtol=1e-9)
@@ -0,0 +1,71 @@
+"""
+Testes dos resumos agrupados, contra pd.crosstab e matplotlib.cbook.boxplot_stats.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.cbook import boxplot_stats
+
+from resumo_agrupado import estatisticas_caixa, para_bxp, tabelas_cruzadas
+
+
+def _dados(n=5000, semente=0):
+    rng = np.random.default_rng(semente)
+    df = pd.DataFrame({
+        'grupo': rng.choice(['b', 'a', 'c'], n, p=[0.5, 0.3, 0.2]),
+        'Contract': rng.choice(['Month-to-month', 'One year', 'Two year'], n),
+        'Churn': rng.choice(['No', 'Yes'], n, p=[0.73, 0.27]),
+        'valor': rng.lognormal(3, 1, n),
+        'inteiro': rng.integers(0, 72, n),
+    })
+    df.loc[rng.choice(n, 200, replace=False), 'valor'] = np.nan
+    df.loc[rng.choice(n, 50, replace=False), 'Contract'] = None
+    return df
+
+
+@pytest.mark.parametrize('normalizar', ['index', 'columns', 'all', False])
+def test_tabelas_cruzadas_iguais_a_crosstab(normalizar):
+    df = _dados()
+    tabelas = tabelas_cruzadas(df, ['Contract', 'grupo'], 'Churn', normalizar=normalizar)
+    for col, tabela in tabelas.items():
+        referencia = pd.crosstab(df[col], df['Churn'], normalize=normalizar)
+        np.testing.assert_allclose(tabela.to_numpy(dtype=np.float64), referencia.to_numpy(dtype=np.float64))
+        assert list(tabela.index) == list(referencia.index)
+        assert list(tabela.columns) == list(referencia.columns)
+
+
+def test_estatisticas_caixa_iguais_a_boxplot_stats():
+    df = _dados()
+    tabelas = estatisticas_caixa(df, 'grupo', ['valor', 'inteiro'])
+    assert list(tabelas['valor'].index) == list(df['grupo'].unique())
+
+    chaves = [('media', 'mean'), ('mediana', 'med'), ('q1', 'q1'), ('q3', 'q3'),
+              ('whislo', 'whislo'), ('whishi', 'whishi')]
+    for col, tabela in tabelas.items():
+        for nivel, linha in tabela.iterrows():
+            referencia = boxplot_stats(df.loc[df['grupo'] == nivel, col].dropna().to_numpy())[0]
+            for nossa, deles in chaves:
+                assert linha[nossa] == pytest.approx(referencia[deles])
+            np.testing.assert_allclose(np.sort(linha['fliers']), np.sort(referencia['fliers']))
+            assert linha['n'] == df.loc[df['grupo'] == nivel, col].notna().sum()
+
+
+def test_para_bxp_desenha_com_os_rotulos():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    tabela = estatisticas_caixa(_dados(), 'grupo', ['valor'], ordenar=True)['valor']
+    fig, ax = plt.subplots()
+    ax.bxp(para_bxp(tabela), showmeans=True)
+    assert [t.get_text() for t in ax.get_xticklabels()] == ['a', 'b', 'c']
+    plt.close(fig)
+
+
+def test_coluna_toda_nula_gera_tabela_vazia():
+    df = _dados().assign(vazia=np.nan)
+    tabelas = estatisticas_caixa(df, 'grupo', ['vazia', 'valor'])
+    assert tabelas['vazia'].empty
+    assert len(tabelas['valor']) == 3
+    assert para_bxp(tabelas['vazia']) == []
@@ -0,0 +1,53 @@
+"""
+Testes da seleção de clientes, contra a ordenação completa do pandas.
+"""
+
+import numpy as np
+import pandas as pd
+
+from selecao_clientes import SelecaoCampanha, selecionar_top_k, valor_esperado
+
+
+def _clientes(n=20_000, semente=0):
+    rng = np.random.default_rng(semente)
+    return pd.DataFrame({
+        'customerID': [f'C{i:06d}' for i in range(n)],
+        'MonthlyCharges': rng.uniform(18, 120, n),
+        'tenure': rng.integers(0, 72, n),
+        'probabilidade': rng.beta(2, 5, n),
+    })
+
+
+def test_selecionar_top_k_igual_a_ordenacao():
+    valores = np.random.default_rng(1).normal(size=5000)
+    esperado = np.argsort(-valores, kind='stable')[:37]
+    np.testing.assert_array_equal(selecionar_top_k(valores, 37), esperado)
+    assert selecionar_top_k(valores, 0).size == 0
+    assert selecionar_top_k(valores, 10_000).size == valores.size
+
+
+def test_selecao_em_lotes_igual_a_nlargest():
+    df = _clientes()
+    selecao = SelecaoCampanha(orcamento=150_000, custo_retencao=300)
+    for inicio in range(0, len(df), 3000):
+        bloco = df.iloc[inicio:inicio + 3000]
+        selecao.adicionar_lote(bloco, bloco['probabilidade'].to_numpy())
+    resultado = selecao.resultado()
+
+    referencia = df.assign(valor=valor_esperado(
+        df['probabilidade'], df['MonthlyCharges'] * df['tenure'].clip(12, 60), 0.6, 300))
+    referencia = referencia[referencia['valor'] > 0].nlargest(selecao.k, 'valor')
+
+    assert selecao.k == 500
+    assert list(resultado['id']) == list(referencia['customerID'])
+    np.testing.assert_allclose(resultado['valor_esperado'], referencia['valor'])
+    assert resultado['custo_acumulado'].iloc[-1] <= 150_000
+
+
+def test_orcamento_menor_que_custo_retorna_selecao_vazia():
+    df = _clientes(1000)
+    selecao = SelecaoCampanha(orcamento=100, custo_retencao=300)
+    selecao.adicionar_lote(df, df['probabilidade'].to_numpy())
+    assert selecao.k == 0
+    assert selecao.resultado().empty
+    assert selecao.clientes_vistos == len(df)
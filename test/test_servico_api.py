@@ -0,0 +1,90 @@
+"""
+Testes do serviço HTTP: respostas iguais a `pontuar_lote` e micro-lotes
+limitados a `tamanho_max`.
+"""
+
+import asyncio
+import os
+
+import joblib
+import pandas as pd
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+from fastapi.testclient import TestClient
+
+from pontuacao_lote import pontuar_lote
+from servico_api import AgrupadorLotes, criar_app
+
+DIRETORIO_TESTE = os.path.dirname(os.path.abspath(__file__))
+
+CLIENTES = [
+    {'tenure': 2, 'MonthlyCharges': 89.99, 'TotalCharges': 179.98, 'Contract': 'Month-to-month',
+     'InternetService': 'Fiber optic', 'PaymentMethod': 'Electronic check', 'OnlineSecurity': 'No',
+     'TechSupport': 'No', 'PaperlessBilling': 'Yes', 'SeniorCitizen': 0},
+    {'tenure': 60, 'MonthlyCharges': 55.0, 'TotalCharges': 3300.0, 'Contract': 'Two year',
+     'InternetService': 'DSL', 'PaymentMethod': 'Credit card (automatic)', 'OnlineSecurity': 'Yes',
+     'TechSupport': 'Yes', 'PaperlessBilling': 'No', 'SeniorCitizen': 1},
+    {'tenure': 24, 'MonthlyCharges': 70.0, 'TotalCharges': 1680.0, 'Contract': 'One year',
+     'InternetService': 'Fiber optic', 'PaymentMethod': 'Bank transfer (automatic)', 'OnlineSecurity': 'No',
+     'TechSupport': 'Yes', 'PaperlessBilling': 'Yes', 'SeniorCitizen': 0},
+]
+
+
+def _referencia():
+    modelo = joblib.load(os.path.join(DIRETORIO_TESTE, 'modelo_final.pkl'))
+    feature_columns = joblib.load(os.path.join(DIRETORIO_TESTE, 'feature_columns.pkl'))
+    scaler = joblib.load(os.path.join(DIRETORIO_TESTE, 'scaler.pkl'))
+    return pontuar_lote(CLIENTES, modelo, feature_columns, scaler)
+
+
+def test_endpoints_iguais_a_pontuar_lote():
+    referencia = _referencia()
+    app = criar_app(DIRETORIO_TESTE, intervalo_recarga=0)
+    with TestClient(app) as cliente:
+        assert cliente.get('/saude').json() == {'status': 'ok'}
+
+        individuais = [cliente.post('/prever', json=dados).json() for dados in CLIENTES]
+        pd.testing.assert_frame_equal(pd.DataFrame(individuais), referencia, check_dtype=False)
+
+        lote = cliente.post('/prever/lote', json=CLIENTES).json()
+        pd.testing.assert_frame_equal(pd.DataFrame(lote), referencia, check_dtype=False)
+
+        assert cliente.post('/prever', json={'tenure': 'x'}).status_code == 422
+        metricas = cliente.get('/metricas').json()
+        assert sum(faixa['n'] for faixa in metricas['latencia_por_tamanho_lote'].values()) == 3
+
+
+def test_agrupador_respeita_o_tamanho_max():
+    tamanhos = []
+
+    def pontuar(dados):
+        tamanhos.append(len(dados))
+        return pd.DataFrame({'valor': [d['i'] * 2 for d in dados]})
+
+    async def executar():
+        agrupador = AgrupadorLotes(pontuar, tamanho_max=4, espera_max=0.05)
+        await agrupador.iniciar()
+        resultados = await asyncio.gather(*(agrupador.pontuar({'i': i}) for i in range(10)))
+        await agrupador.parar()
+        return resultados
+
+    resultados = asyncio.run(executar())
+    assert [r['valor'] for r in resultados] == [2 * i for i in range(10)]
+    assert tamanhos == [4, 4, 2]
+
+
+def test_erro_na_pontuacao_chega_a_todas_as_requisicoes():
+    def pontuar(dados):
+        raise ValueError('modelo indisponível')
+
+    async def executar():
+        agrupador = AgrupadorLotes(pontuar, tamanho_max=8, espera_max=0.01)
+        await agrupador.iniciar()
+        resultados = await asyncio.gather(*(agrupador.pontuar({'i': i}) for i in range(3)),
+                                          return_exceptions=True)
+        await agrupador.parar()
+        return resultados
+
+    assert all(isinstance(r, ValueError) for r in asyncio.run(executar()))
@@ -0,0 +1,74 @@
+"""
+Testes do treino incremental, contra partial_fit/warm_start do scikit-learn
+chamados diretamente.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import StandardScaler
+
+from treino_incremental import TreinoIncremental
+
+COLUNAS = ['tenure', 'MonthlyCharges', 'Contract', 'InternetService']
+
+
+def test_linear_igual_a_partial_fit_direto(clientes):
+    extratos = [clientes(semente=s, colunas=COLUNAS) for s in range(3)]
+    treino = TreinoIncremental('linear')
+    for X, y in extratos:
+        treino.atualizar(X, y)
+
+    scaler, modelo = StandardScaler(), SGDClassifier(loss='log_loss', alpha=1e-4, random_state=42)
+    for X, y in extratos:
+        matriz = treino.codificador.transformar(X)
+        scaler.partial_fit(matriz)
+        modelo.partial_fit(scaler.transform(matriz), y, classes=['No', 'Yes'])
+
+    np.testing.assert_allclose(treino.modelo.coef_, modelo.coef_)
+    np.testing.assert_allclose(treino.scaler.mean_, scaler.mean_)
+    assert treino.lotes == 3 and treino.n_amostras == 2400
+
+
+def test_floresta_acrescenta_arvores_e_preserva_as_antigas(clientes):
+    (X1, y1), (X2, y2) = [clientes(semente=s, colunas=COLUNAS) for s in range(2)]
+    treino = TreinoIncremental('floresta', arvores_por_lote=5, parametros={'n_jobs': 1}).atualizar(X1, y1)
+    antigas = [arvore.tree_.threshold.copy() for arvore in treino.modelo.estimators_]
+
+    treino.atualizar(X2, y2)
+    assert len(treino.modelo.estimators_) == 10
+    for limiares, arvore in zip(antigas, treino.modelo.estimators_[:5]):
+        np.testing.assert_array_equal(arvore.tree_.threshold, limiares)
+
+    # Lote com uma única classe é ignorado
+    treino.atualizar(X2, np.full(len(X2), 'No'))
+    assert treino.lotes == 2 and len(treino.modelo.estimators_) == 10
+
+
+def test_floresta_descarta_as_arvores_mais_antigas(clientes, capsys):
+    extratos = [clientes(semente=s, colunas=COLUNAS) for s in range(4)]
+    treino = TreinoIncremental('floresta', arvores_por_lote=5, max_arvores=12, parametros={'n_jobs': 1})
+    for X, y in extratos[:3]:
+        treino.atualizar(X, y)
+    recentes = treino.modelo.estimators_[-5:]
+    treino.atualizar(*extratos[3])
+
+    assert len(treino.modelo.estimators_) == treino.modelo.n_estimators == 12
+    assert treino.modelo.estimators_[2:7] == recentes and treino.lotes == 4
+    X, _ = extratos[0]
+    probabilidade = treino.modelo.predict_proba(treino.codificador.transformar(X))
+    np.testing.assert_allclose(probabilidade.sum(axis=1), 1.0)
+    assert 'descartada' in capsys.readouterr().out
+
+
+def test_salvar_e_continuar(clientes, tmp_path, capsys):
+    (X1, y1), (X2, y2) = [clientes(semente=s, colunas=COLUNAS) for s in range(2)]
+    treino = TreinoIncremental('linear').atualizar(X1, y1)
+    diretorio = treino.salvar(str(tmp_path), versao='v1')
+
+    retomado = TreinoIncremental.continuar(diretorio).atualizar(X2, y2)
+    treino.atualizar(X2, y2)
+    assert retomado.tipo == 'linear' and retomado.lotes == 2 and retomado.n_amostras == 1600
+    assert retomado.codificador.feature_columns == treino.codificador.feature_columns
+    np.testing.assert_allclose(retomado.modelo.coef_, treino.modelo.coef_)
+    capsys.readouterr()
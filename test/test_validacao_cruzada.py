@@ -0,0 +1,65 @@
+"""
+Testes da validação cruzada em cache, contra cross_val_score com o Pipeline equivalente.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.model_selection import cross_val_score
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from validacao_cruzada import ValidacaoCruzadaCache
+
+COLUNAS = ['tenure', 'MonthlyCharges', 'Contract', 'InternetService']
+
+
+def _pipeline(X, modelo, escalonar=False):
+    cat = X.select_dtypes(include=['object', 'string']).columns.tolist()
+    num = [c for c in X.columns if c not in cat]
+    prep = ColumnTransformer([('num', 'passthrough', num),
+                              ('cat', OneHotEncoder(handle_unknown='ignore', sparse_output=False), cat)])
+    passos = [('prep', prep)] + ([('esc', StandardScaler())] if escalonar else []) + [('modelo', modelo)]
+    return Pipeline(passos)
+
+
+@pytest.mark.parametrize('esparso', [False, True])
+def test_arvore_igual_a_cross_val_score(clientes, esparso):
+    X, y = clientes(600, colunas=COLUNAS)
+    modelo = DecisionTreeClassifier(max_depth=4, random_state=42)
+    vc = ValidacaoCruzadaCache(X, y, cv=5, esparso=esparso, n_processos=1)
+    np.testing.assert_allclose(vc.avaliar(modelo, scoring='accuracy'),
+                               cross_val_score(_pipeline(X, modelo), X, y, cv=5, scoring='accuracy'))
+
+
+def test_transformador_ajustado_por_dobra(clientes):
+    X, y = clientes(600, colunas=COLUNAS)
+    modelo = LogisticRegression(max_iter=1000)
+    vc = ValidacaoCruzadaCache(X, y, cv=5, n_processos=1)
+    np.testing.assert_allclose(
+        vc.avaliar(modelo, scoring='f1_macro', transformador=StandardScaler()),
+        cross_val_score(_pipeline(X, modelo, escalonar=True), X, y, cv=5, scoring='f1_macro'),
+        rtol=1e-6)
+
+
+def test_regressao_igual_a_cross_val_score(clientes):
+    X, _ = clientes(600, colunas=COLUNAS)
+    y = X['MonthlyCharges'] * 3 + np.random.default_rng(1).normal(size=len(X))
+    vc = ValidacaoCruzadaCache(X, y, cv=5, n_processos=1)
+    esperado = cross_val_score(_pipeline(X, LinearRegression()), X, y, cv=5,
+                               scoring='neg_root_mean_squared_error')
+    np.testing.assert_allclose(vc.avaliar(LinearRegression(), scoring='neg_root_mean_squared_error'),
+                               esperado, rtol=1e-6)
+
+
+def test_colunas_string_sao_categoricas(clientes):
+    X, y = clientes(600, colunas=COLUNAS)
+    como_string = X.astype({'Contract': 'string', 'InternetService': 'string'})
+    vc = ValidacaoCruzadaCache(como_string, y, cv=5, n_processos=1)
+    assert vc.feature_names == ValidacaoCruzadaCache(X.astype({'Contract': object, 'InternetService': object}),
+                                                     y, cv=5, n_processos=1).feature_names
+
+    assert 'Contract_Two year' in vc.feature_names